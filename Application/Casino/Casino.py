@@ -1,10 +1,13 @@
 import datetime
+import math
 import uuid
 
 from Application.Model.Accounts.AccountManager import AccountManager, verify_password
+from Application.Model.Accounts.EmailOutbox import EmailSender
 from Application.Model.Accounts.UserAccount import UserAccount
 from Application.Utils.ANSI_COLORS import ANSI_COLORS
-from Application.Utils.IOConsole import IOConsole
+from Application.Utils.IOConsole import IOConsole, MINIMUM_MONETARY_INPUT
+from Application.Utils.Money import Money
 import re
 
 
@@ -50,7 +53,7 @@ class Casino:
     """
     def __init__(self):
         self.console = IOConsole(ANSI_COLORS.BLUE)
-        self.manager = AccountManager()
+        self.manager = AccountManager(email_sender=EmailSender().start())
         self.account: UserAccount | None = None
 
     def run(self) -> None:
@@ -99,6 +102,10 @@ class Casino:
 
             if account:
                 return account
+            elif retry_after := self.manager.get_login_retry_after(username):
+                self.console.print_error(f"Too many failed attempts - try again in {math.ceil(retry_after / 60)} "
+                                         f"minute(s)\n\n\n")
+                return None
             else:
                 self.console.print_error("Invalid username or password")
 
@@ -169,7 +176,7 @@ class Casino:
                 self.handle_manage_selection()
 
             elif answer == "select-game" or answer == "select game" or answer == "select":
-                if self.account.balance < 1.00:
+                if self.account.balance < MINIMUM_MONETARY_INPUT:
                     self.console.print_error("You do not have enough money to play any games")
                 else:
                     self.prompt_game()
@@ -226,7 +233,7 @@ class Casino:
         Validates the input and updates the user's account with the new balance.
         :return: None
         """
-        answer: float = self.console.get_monetary_input("Enter the amount of money you want to add to your funds"
+        answer: Money = self.console.get_monetary_input("Enter the amount of money you want to add to your funds"
                                                         " (no less than $1.00)")
         self.manager.add_and_save_account(self.account, answer)
         self.console.print_success(f"You have added ${answer} to your funds! New Balance is {self.account.balance}")
@@ -428,7 +435,7 @@ class Casino:
             input_token: uuid.UUID = uuid.UUID(user_input)
             now = datetime.datetime.now(datetime.UTC)
             expiration: datetime = self.account.reset_token_expiration.replace(tzinfo=datetime.timezone.utc)
-            return self.account.reset_token == input_token and expiration >= now
+            return self.account.reset_token == input_token and expiration > now
 
         except ValueError:
             return False
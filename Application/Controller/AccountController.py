@@ -1,9 +1,15 @@
-import datetime
+import math
+import os
 import re
-import uuid
+from concurrent.futures import Future
 
 from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.AccountServer import RecoveringAccount
+from Application.Model.Accounts.RemoteAccountManager import RemoteAccountManager
 from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Utils.Money import Money
+
+SESSION_TOKEN_FILE_PATH: str = "session_token.txt"
 
 
 def is_password_valid(password: str) -> bool:
@@ -38,10 +44,12 @@ def is_email_valid(email: str) -> bool:
 
 
 class AccountController:
-    def __init__(self, manager: AccountManager):
+    def __init__(self, manager: AccountManager | RemoteAccountManager,
+                 session_token_path: str = SESSION_TOKEN_FILE_PATH):
 
-        self.manager: AccountManager = manager
+        self.manager: AccountManager | RemoteAccountManager = manager
         self.account: UserAccount | None = None
+        self.session_token_path: str = session_token_path
 
     def login(self, username: str, password: str) -> bool:
         """
@@ -56,8 +64,128 @@ class AccountController:
         :return: True if a user was found, False otherwise
         """
         self.account = self.manager.get_account(username, password)
+
+        if self.account:
+            self.remember_session()
+
         return self.account is not None
 
+    def login_async(self, username: str, password: str) -> Future:
+        """
+        Starts authenticating a user without blocking the caller.
+
+        The returned Future should be polled (e.g. with Tk's after) and handed to finish_login once it is done.
+
+        :param username: Username entered by the user
+        :param password: Password entered by the user
+        :return: A Future resolving to the matching UserAccount or None
+        """
+        return self.manager.get_account_async(username, password)
+
+    def finish_login(self, future: Future) -> bool:
+        """
+        Completes a login started by login_async. Must be called once the Future is done.
+
+        :param future: The Future returned by login_async
+        :return: True if a user was found, False otherwise
+        """
+        self.account = future.result()
+        self.manager.save_lockouts()
+
+        if self.account:
+            self.manager.apply_pending_rehash(self.account)
+            self.remember_session()
+
+        return True if self.account else False
+
+    def get_login_retry_after(self, username: str) -> int:
+        """
+        Reports how long a username is locked out for after too many failed logins.
+
+        :param username: Username entered by the user
+        :return: Whole seconds until the next attempt is allowed, or 0 if it is allowed now
+        """
+        return math.ceil(self.manager.get_login_retry_after(username))
+
+    def remember_session(self) -> None:
+        """
+        Stores a session token for the logged in account so the next start of the app can skip the login screen.
+
+        :return: None
+        """
+        token: str = self.manager.issue_session_token(self.account)
+
+        with open(os.open(self.session_token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600),
+                  mode='w') as token_file:
+            token_file.write(token)
+
+    def resume_session(self) -> bool:
+        """
+        Logs in with the stored session token, if there is one. Checking the token takes microseconds, whereas a
+        password login spends a full bcrypt verification.
+
+        A token that has expired or was revoked (e.g. by a password change) is deleted.
+
+        :return: True if the stored token logged an account in, False otherwise.
+        """
+        if not os.path.exists(self.session_token_path):
+            return False
+
+        with open(self.session_token_path, mode='r') as token_file:
+            token: str = token_file.read().strip()
+
+        self.account = self.manager.get_account_by_session_token(token)
+
+        if not self.account:
+            os.remove(self.session_token_path)
+
+        return True if self.account else False
+
+    def logout(self) -> None:
+        """
+        Revokes and deletes the stored session token, then forgets the current account.
+
+        :return: None
+        """
+        if os.path.exists(self.session_token_path):
+            with open(self.session_token_path, mode='r') as token_file:
+                self.manager.revoke_session_token(token_file.read().strip())
+
+            os.remove(self.session_token_path)
+
+        self.account = None
+
+    def create_account_async(self, username: str, password: str, email: str, security_questions: list[str]) -> Future:
+        """
+        Starts creating an account without blocking the caller while the password is hashed.
+
+        The returned Future should be polled and handed to finish_create_account once it is done.
+
+        :param username: Username entered by the user
+        :param password: Password entered by the user
+        :param email: Email entered by the user
+        :param security_questions: A list containing the security questions and answers entered by the user
+        :return: A Future resolving to an unsaved UserAccount or None if the username or email is taken
+        """
+        return self.manager.create_account_async(username, password, email, security_questions)
+
+    def finish_create_account(self, future: Future) -> tuple[bool, str | None]:
+        """
+        Completes an account creation started by create_account_async. Must be called on the thread that owns the
+        session once the Future is done.
+
+        :param future: The Future returned by create_account_async
+        :return: A tuple (success, error) where success is True if creation succeeded, and error is None or a message.
+        """
+        new_account: UserAccount | None = future.result()
+        self.account = self.manager.save_new_account(new_account) if new_account else None
+
+        if not self.account:
+            return False, "Account with that username or email already exists"
+
+        self.remember_session()
+        return True, None
+
     def create_account(self, username: str, password: str, email: str,
                        security_questions: list[str]) -> tuple[bool, str | None]:
         """
@@ -77,26 +205,39 @@ class AccountController:
         if not self.account:
             return False, "Account with that username or email already exists"
 
+        self.remember_session()
         return True, None
 
-    def validate_email(self, email: str) -> UserAccount:
+    def validate_email(self, email: str) -> UserAccount | RecoveringAccount | None:
         """
         Attempts to find and return a user account associated with the given email.
 
         :param email: Email entered by the user.
-        :return: The matching UserAccount if found, otherwise None.
+        :return: The matching UserAccount if found, otherwise None. A remote account server only returns a
+                 RecoveringAccount, which holds the username and security questions.
         """
         self.account = self.manager.get_account_by_email(email)
         return self.account if self.account else None
 
-    def email_reset_token(self) -> str:
+    def verify_security_answers(self, answer_one: str, answer_two: str) -> bool:
+        """
+        Checks the user's answers to the security questions of the currently loaded account.
+
+        :param answer_one: Answer to the first security question.
+        :param answer_two: Answer to the second security question.
+        :return: True if both answers are correct.
+        """
+        return self.manager.verify_security_answers(self.account, [answer_one, answer_two])
+
+    def email_reset_token(self) -> str | None:
         """
         Generates a reset token for the currently loaded account and sends it via email.
 
         Delegates token generation and email dispatch to AccountManager. Assumes that
         self.account has already been set via prior validation.
 
-        :return: The generated reset token as a string.
+        :return: The generated reset token, or None when a remote account server issued it, since the token then
+                 only travels by email.
         """
         self.manager.email_recovery_token(self.account)
         return self.account.reset_token
@@ -108,14 +249,7 @@ class AccountController:
         :param token: The token entered by the user.
         :return: True if the token matches and has not expired, False otherwise.
         """
-        try:
-            input_token: uuid.UUID = uuid.UUID(token)
-            now = datetime.datetime.now(datetime.UTC)
-            expiration: datetime = self.account.reset_token_expiration.replace(tzinfo=datetime.timezone.utc)
-            return self.account.reset_token == input_token and expiration >= now
-
-        except ValueError:
-            return False
+        return self.manager.is_reset_token_valid(self.account, token)
 
     def reset_password(self, new_password) -> None:
         """
@@ -125,18 +259,22 @@ class AccountController:
         """
         self.manager.update_password(self.account, new_password)
 
-    def subtract_losses(self, wager: float) -> bool:
+    def subtract_losses(self, wager: Money) -> bool:
         """
         Attempts to subtract wager from user's balance.
 
+        The balance check is done by the database as part of the debit, so no separate check is made here.
+
         :param wager: Wager amount enter by the user.
         :return: True if successful. False otherwise.
         """
-        if self.account.balance < wager:
-            return False
+        return self.manager.settle_debit(self.account, wager)
 
-        self.manager.subtract_and_save_account(self.account, wager)
-        return True
+    def add_winnings(self, winnings: Money) -> None:
+        """
+        Adds winnings to the user's balance.
 
-    def add_winnings(self, winnings):
+        :param winnings: Amount won by the user.
+        :return: None
+        """
         self.manager.add_and_save_account(self.account, winnings)
@@ -0,0 +1,216 @@
+import csv
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Iterator
+
+from sqlalchemy import insert, or_, select
+
+from Application.Controller.AccountController import is_email_valid, is_password_valid
+from Application.Model.Accounts.AccountManager import (AccountManager, STARTING_BALANCE, get_target_cost,
+                                                       hash_password)
+from Application.Model.Accounts.Ledger import OPENING, record_entries
+from Application.Model.Accounts.UserAccount import UserAccount, normalize_email
+from Application.Utils.Money import Money
+
+CSV_FIELDS: list[str] = ["username", "password", "password_hash", "balance", "email",
+                         "security_question_one", "security_answer_one",
+                         "security_question_two", "security_answer_two"]
+EXPORT_COLUMNS = [UserAccount.username, UserAccount.password, UserAccount.balance, UserAccount.email,
+                  UserAccount.security_question_one, UserAccount.security_answer_one,
+                  UserAccount.security_question_two, UserAccount.security_answer_two]
+DEFAULT_CHUNK_SIZE: int = 1000
+
+
+def read_chunks(reader: csv.DictReader, chunk_size: int) -> Iterator[list[tuple[int, dict]]]:
+    """
+    Lazily splits a CSV reader into lists of at most chunk_size rows.
+
+    Each row comes with the reader's line_num after reading it, the physical line the row ends on. A quoted field
+    may span several lines, so counting rows would not give the line.
+
+    :param reader: The reader to consume.
+    :param chunk_size: The maximum number of rows per chunk.
+    :return: An iterator of chunks of (line number, row).
+    """
+    numbered_rows: Iterator[tuple[int, dict]] = ((reader.line_num, row) for row in reader)
+
+    while chunk := list(islice(numbered_rows, chunk_size)):
+        yield chunk
+
+
+class BulkAccountController:
+    """
+    Streams UserAccount rows between casino.db and CSV files.
+
+    Files are processed chunk by chunk, so memory use depends on the chunk size rather than the size of the file.
+    Plain-text passwords are hashed in a process pool and each chunk is inserted with a single executemany.
+
+    A row supplies either a plain-text password, which must pass is_password_valid, or a password_hash as written by
+    export_csv. Exports only contain hashes, so an exported file can be imported again without resetting passwords.
+    """
+
+    def __init__(self, manager: AccountManager, chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int | None = None):
+        self.manager: AccountManager = manager
+        self.chunk_size: int = chunk_size
+        self.workers: int | None = workers
+        self.logger: logging.Logger = logging.getLogger("database")
+
+    def import_csv(self, path: str) -> dict:
+        """
+        Creates an account for every valid row of a CSV file. Invalid rows and rows whose username or email is already
+        taken are logged and skipped.
+
+        :param path: Path of the CSV file to read.
+        :return: A dict with imported, skipped, seconds and rows_per_second.
+        """
+        imported: int = 0
+        skipped: int = 0
+        start: float = time.perf_counter()
+        hash_with_cost = partial(hash_password, rounds=get_target_cost())
+
+        with open(path, mode='r', newline='') as csv_file, \
+                ProcessPoolExecutor(max_workers=self.workers) as pool:
+            reader: csv.DictReader = csv.DictReader(csv_file)
+
+            for chunk in read_chunks(reader, self.chunk_size):
+                rows, plain_rows = self.validate_chunk(chunk)
+                hashes = pool.map(hash_with_cost, [row["password"] for row in plain_rows], chunksize=32)
+
+                for row, hashed in zip(plain_rows, hashes):
+                    row["password"] = hashed
+
+                if rows:
+                    self.manager.session.execute(insert(UserAccount), rows)
+                    record_entries(self.manager.session, [{"username": row["username"], "delta": row["balance"]}
+                                                          for row in rows], OPENING)
+                    self.manager.session.commit()
+
+                imported += len(rows)
+                skipped += len(chunk) - len(rows)
+
+        seconds: float = time.perf_counter() - start
+        rows_per_second: float = (imported + skipped) / seconds if seconds else 0.0
+        self.logger.info("Imported %d accounts from %s (%d skipped) in %.1fs, %.0f rows/s",
+                         imported, path, skipped, seconds, rows_per_second)
+
+        return {"imported": imported, "skipped": skipped, "seconds": seconds, "rows_per_second": rows_per_second}
+
+    def validate_chunk(self, chunk: list[tuple[int, dict]]) -> tuple[list[dict], list[dict]]:
+        """
+        Turns the valid rows of a chunk into insert parameters.
+
+        Plain-text passwords are left in place for the caller to hash. Usernames and emails are checked against the
+        database and against earlier rows of the same chunk; earlier chunks are already committed by then.
+
+        :param chunk: (line number, raw row) pairs from read_chunks. The line number is reported for skipped rows.
+        :return: (the rows that can be inserted, the subset of them whose password still needs hashing)
+        """
+        taken_usernames, taken_emails = self.find_taken([raw for _, raw in chunk])
+        rows: list[dict] = []
+        plain_rows: list[dict] = []
+
+        for line, raw in chunk:
+            try:
+                row: dict = self.to_insert_row(raw)
+                is_plain_text: bool = not raw.get("password_hash")
+            except (KeyError, ValueError) as e:
+                self.logger.warning("Skipping the row ending on line %d of account import: %s", line, e)
+                continue
+
+            if row["username"] in taken_usernames or row["email_normalized"] in taken_emails:
+                self.logger.warning("Skipping the row ending on line %d of account import: account already exists",
+                                    line)
+                continue
+
+            taken_usernames.add(row["username"])
+            taken_emails.add(row["email_normalized"])
+            rows.append(row)
+            if is_plain_text:
+                plain_rows.append(row)
+
+        return rows, plain_rows
+
+    def find_taken(self, chunk: list[dict]) -> tuple[set[str], set[str]]:
+        """
+        Looks up which usernames and emails of a chunk already belong to an account.
+
+        :param chunk: Raw rows from csv.DictReader.
+        :return: (taken usernames, taken normalized emails)
+        """
+        usernames: list[str] = [raw.get("username") or "" for raw in chunk]
+        emails: list[str] = [normalize_email(raw.get("email") or "") for raw in chunk]
+
+        existing = self.manager.session.execute(
+            select(UserAccount.username, UserAccount.email_normalized)
+            .where(or_(UserAccount.username.in_(usernames), UserAccount.email_normalized.in_(emails)))
+        ).all()
+
+        return {username for username, _ in existing}, {email for _, email in existing}
+
+    @staticmethod
+    def to_insert_row(raw: dict) -> dict:
+        """
+        Validates a raw CSV row and converts it into UserAccount insert parameters.
+
+        :param raw: A row from csv.DictReader.
+        :return: The insert parameters.
+        :raises ValueError: If a required field is missing or a value is invalid.
+        """
+        fields: list[str] = ["username", "email", "security_question_one", "security_answer_one",
+                             "security_question_two", "security_answer_two"]
+        missing: list[str] = [field for field in fields if not (raw.get(field) or "").strip()]
+
+        if missing:
+            raise ValueError(f"missing {', '.join(missing)}")
+
+        if not is_email_valid(raw["email"]):
+            raise ValueError(f"{raw['email']} is not a valid email")
+
+        password_hash: str = raw.get("password_hash") or ""
+        if password_hash:
+            if not password_hash.startswith("$2"):
+                raise ValueError("password_hash is not a bcrypt hash")
+            password: str = password_hash
+        else:
+            password = raw.get("password") or ""
+            if not is_password_valid(password):
+                raise ValueError("password does not meet the password requirements")
+
+        balance: Money = Money.parse(raw["balance"]) if raw.get("balance") else STARTING_BALANCE
+        if balance < 0:
+            raise ValueError(f"balance {balance} is negative")
+
+        return {"username": raw["username"], "password": password, "balance": balance, "email": raw["email"],
+                "email_normalized": normalize_email(raw["email"]),
+                "security_question_one": raw["security_question_one"],
+                "security_answer_one": raw["security_answer_one"],
+                "security_question_two": raw["security_question_two"],
+                "security_answer_two": raw["security_answer_two"]}
+
+    def export_csv(self, path: str) -> int:
+        """
+        Writes every account to a CSV file that import_csv can read back. Passwords are exported as hashes only.
+
+        :param path: Path of the CSV file to write.
+        :return: The number of accounts written.
+        """
+        written: int = 0
+        start: float = time.perf_counter()
+        result = self.manager.session.execute(select(*EXPORT_COLUMNS).execution_options(yield_per=self.chunk_size))
+
+        with open(path, mode='w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(CSV_FIELDS)
+
+            for partition in result.partitions():
+                writer.writerows([username, "", password, str(balance), email, *questions]
+                                 for username, password, balance, email, *questions in partition)
+                written += len(partition)
+
+        seconds: float = time.perf_counter() - start
+        self.logger.info("Exported %d accounts to %s in %.1fs, %.0f rows/s",
+                         written, path, seconds, written / seconds if seconds else 0.0)
+        return written
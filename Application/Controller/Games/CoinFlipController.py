@@ -1,6 +1,11 @@
+from decimal import Decimal
+
 from Application.Controller.AccountController import AccountController
 from Application.Model.Games.CoinFlip.CoinFlip import handle_heads_tails
 from Application.Model.Games.GameOutcome import GameOutcome
+from Application.Utils.Money import Money
+
+PAYOUT_MULTIPLIER: Decimal = Decimal("1.25")
 
 
 class CoinFlipController:
@@ -8,7 +13,7 @@ class CoinFlipController:
     def __init__(self, account_controller: AccountController):
         self.account_controller = account_controller
 
-    def handle_outcome(self, guess: str, wager: float) -> GameOutcome:
+    def handle_outcome(self, guess: str, wager: Money) -> GameOutcome:
         """
         Handles the logic of a coin flip game, including checking the user's guess,
         updating account balance based on the result, and returning the outcome.
@@ -22,7 +27,7 @@ class CoinFlipController:
 
         if successful_withdraw:
             if flip == guess:
-                self.account_controller.add_winnings(wager * 1.25)
+                self.account_controller.add_winnings(wager * PAYOUT_MULTIPLIER)
                 return GameOutcome.WIN
 
             return GameOutcome.LOSS
@@ -1,10 +1,11 @@
 from Application.Controller.AccountController import AccountController
 from Application.Controller.Games.CoinFlipController import CoinFlipController
 from Application.Controller.Games.TriviaController import TriviaController
+from Application.Model.Games.TriviaGame.QuestionBank import QuestionBank
 
 
 class GameController:
-    def __init__(self, account_controller: AccountController):
+    def __init__(self, account_controller: AccountController, question_bank: QuestionBank | None = None):
         self.account_controller: AccountController = account_controller
         self.cf_controller: CoinFlipController = CoinFlipController(account_controller)
-        self.trivia_controller: TriviaController = TriviaController(account_controller)
+        self.trivia_controller: TriviaController = TriviaController(account_controller, question_bank)
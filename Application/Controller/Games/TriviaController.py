@@ -1,13 +1,15 @@
 from Application.Controller.AccountController import AccountController
 from Application.Model.Games.TriviaGame.Category import Category
 from Application.Model.Games.TriviaGame.Question import Question
+from Application.Model.Games.TriviaGame.QuestionBank import QuestionBank
 from Application.Model.Games.TriviaGame.TriviaGame import TriviaGame
 
 
 class TriviaController:
 
-    def __init__(self, account_controller: AccountController):
+    def __init__(self, account_controller: AccountController, question_bank: QuestionBank | None = None):
         self.account_controller: AccountController = account_controller
+        self.question_bank: QuestionBank | None = question_bank
         self.game: TriviaGame | None = None
         self.question_list: list[Question] | None = None
         self.question_num: int = 0
@@ -21,7 +23,7 @@ class TriviaController:
         :param diff: Difficulty level ("easy", "medium", or "hard").
         :return: A list of Category objects that are valid for the selected difficulty.
         """
-        self.game = TriviaGame(q_type, diff)
+        self.game = TriviaGame(q_type, diff, self.question_bank)
         return self.game.get_valid_categories(self.game.difficulty)
 
     def get_question_list(self, cat: Category) -> list[Question] | None:
@@ -1,16 +1,29 @@
+import os
 import tkinter as tk
 from tkinter import ttk
 
 from Application.Controller.AccountController import AccountController
 from Application.Controller.Games.GameController import GameController
-from Application.Utils.LoggingController import setup_logging
-from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Utils.LoggingController import setup_logging, shutdown_logging
+from Application.Model.Accounts.AccountManager import AccountManager, load_or_calibrate_bcrypt_cost
+from Application.Model.Accounts.EmailOutbox import EmailSender, load_email_config
+from Application.Model.Accounts.RemoteAccountManager import RemoteAccountManager
+from Application.Model.Accounts.WagerJournal import DurabilityMode
+from Application.Model.Games.TriviaGame.QuestionBank import QuestionBank
+from Application.Model.Games.TriviaGame.TriviaGame import get_opentdb_client
 from Application.View.BaseFrame import BaseFrame
 from Application.View.EntryFrame import EntryFrame
 from Application.View.GameSelectionFrame import GameSelectionFrame
 from Application.View.PasswordResetFrame import PasswordResetFrame
 
-setup_logging()
+WAGER_FLUSH_INTERVAL_MS: int = 250
+LEDGER_COMPACTION_INTERVAL_MS: int = 10 * 60 * 1000
+# "host:port" or "unix:/path" of a shared AccountServer. When unset this window opens casino.db itself.
+ACCOUNT_SERVER_ADDRESS: str | None = os.getenv("CASINO_ACCOUNT_SERVER")
+WAGER_LOG_SAMPLE_RATE: float = 1.0  # Lower to keep only a fraction of per-wager info logs
+
+setup_logging(wager_sample_rate=WAGER_LOG_SAMPLE_RATE)
+load_email_config()
 
 
 class MainWindow(tk.Tk):
@@ -18,9 +31,17 @@ class MainWindow(tk.Tk):
         super().__init__()
         self.title("Python Casino!")
         self.geometry("800x800")
-        account_manager: AccountManager = AccountManager()
+        self.email_sender: EmailSender | None = None
+
+        if ACCOUNT_SERVER_ADDRESS:
+            account_manager: AccountManager | RemoteAccountManager = RemoteAccountManager(ACCOUNT_SERVER_ADDRESS)
+        else:
+            load_or_calibrate_bcrypt_cost()  # Only this process hashes passwords; with a server, the server does
+            self.email_sender = EmailSender().start()
+            account_manager = AccountManager(durability=DurabilityMode.GROUP, email_sender=self.email_sender)
         self.account_controller: AccountController = AccountController(account_manager)
-        self.game_controller: GameController = GameController(self.account_controller)
+        self.question_bank: QuestionBank = QuestionBank(get_opentdb_client()).start()
+        self.game_controller: GameController = GameController(self.account_controller, self.question_bank)
 
         self.container: ttk.Frame = ttk.Frame(self)
         self.container.pack(fill="both", expand=True)
@@ -29,8 +50,43 @@ class MainWindow(tk.Tk):
         self.empty_menu: tk.Menu = tk.Menu()
         self.create_menu()
 
-        # self.render_frame(EntryFrame, show_menu=False)
-        self.render_frame(GameSelectionFrame)
+        if self.account_controller.resume_session():
+            self.transition_to_main_menu()
+        else:
+            # self.render_frame(EntryFrame, show_menu=False)
+            self.render_frame(GameSelectionFrame)
+
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.after(WAGER_FLUSH_INTERVAL_MS, self.flush_wagers)
+        self.after(LEDGER_COMPACTION_INTERVAL_MS, self.compact_ledger)
+
+    def flush_wagers(self) -> None:
+        """
+        Periodically commits journaled wagers so a lone wager is never held longer than the flush interval.
+        :return: None
+        """
+        self.account_controller.manager.flush_due_wagers()
+        self.after(WAGER_FLUSH_INTERVAL_MS, self.flush_wagers)
+
+    def compact_ledger(self) -> None:
+        """
+        Periodically snapshots account balances so rebuilding one from the ledger only reads recent entries.
+        :return: None
+        """
+        self.account_controller.manager.compact_ledger()
+        self.after(LEDGER_COMPACTION_INTERVAL_MS, self.compact_ledger)
+
+    def close(self) -> None:
+        """
+        Commits any pending wagers and drains the log queue before closing the window.
+        :return: None
+        """
+        self.account_controller.manager.close()
+        self.question_bank.stop(timeout=1)
+        if self.email_sender is not None:
+            self.email_sender.stop(timeout=1)
+        self.destroy()
+        shutdown_logging()
 
     def render_frame(self, new_frame: type[BaseFrame], show_menu: bool = True, **kwargs) -> None:
         """
@@ -73,7 +129,7 @@ class MainWindow(tk.Tk):
         home_menu: tk.Menu = tk.Menu(self.menu_bar, tearoff=False)
         self.menu_bar.add_cascade(label="Home", menu=home_menu)
         home_menu.add_command(label="Main Menu", command=self.transition_to_main_menu)
-        home_menu.add_command(label="Quit", command=self.quit)
+        home_menu.add_command(label="Quit", command=self.close)
 
         self.configure(menu=self.menu_bar)
 
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+from sqlalchemy import inspect
+
+from Application.Model.Accounts.UserAccount import UserAccount
+
+DEFAULT_CACHE_SIZE: int = 128
+
+
+class AccountCache:
+    """
+    Bounded LRU cache of loaded UserAccount rows, keyed by username with a secondary index on normalized email.
+
+    Only positive lookups are cached. Entries are dropped by AccountManager whenever it changes an account so the next
+    read goes back to the session.
+
+    Attributes:
+        max_size (int): The number of accounts kept before the least recently used one is evicted.
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups that had to query the database.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        self.max_size: int = max_size
+        self.accounts: OrderedDict[str, UserAccount] = OrderedDict()
+        self.usernames_by_email: dict[str, str] = {}
+        self.emails_by_username: dict[str, str] = {}  # Kept separately so eviction never reads expired attributes
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get_by_username(self, username: str) -> UserAccount | None:
+        """
+        Looks up a cached account by username, marking it as most recently used.
+
+        :param username: The username to look up.
+        :return: The cached UserAccount, or None on a miss.
+        """
+        account: UserAccount | None = self.accounts.get(username)
+
+        if account is None or inspect(account).detached:
+            if account is not None:
+                self.invalidate(username)
+            self.misses += 1
+            return None
+
+        self.accounts.move_to_end(username)
+        self.hits += 1
+        return account
+
+    def get_by_email(self, email_normalized: str) -> UserAccount | None:
+        """
+        Looks up a cached account by its normalized email.
+
+        :param email_normalized: The normalized email to look up.
+        :return: The cached UserAccount, or None on a miss.
+        """
+        username: str | None = self.usernames_by_email.get(email_normalized)
+
+        if username is None:
+            self.misses += 1
+            return None
+
+        return self.get_by_username(username)
+
+    def put(self, account: UserAccount) -> None:
+        """
+        Adds or refreshes an account, evicting the least recently used entry if the cache is full.
+
+        :param account: The loaded UserAccount to cache.
+        :return: None
+        """
+        self.invalidate(account.username)
+
+        self.accounts[account.username] = account
+        self.usernames_by_email[account.email_normalized] = account.username
+        self.emails_by_username[account.username] = account.email_normalized
+
+        if len(self.accounts) > self.max_size:
+            self.invalidate(next(iter(self.accounts)))
+
+    def invalidate(self, username: str) -> None:
+        """
+        Drops an account from the cache.
+
+        :param username: The username of the account to drop.
+        :return: None
+        """
+        self.accounts.pop(username, None)
+        email: str | None = self.emails_by_username.pop(username, None)
+
+        if email is not None:
+            self.usernames_by_email.pop(email, None)
+
+    def clear(self) -> None:
+        """
+        Empties the cache without resetting the counters.
+
+        :return: None
+        """
+        self.accounts.clear()
+        self.usernames_by_email.clear()
+        self.emails_by_username.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the counters used to size the cache.
+
+        :return: A dict with size, max_size, hits, misses and hit_rate.
+        """
+        lookups: int = self.hits + self.misses
+        return {"size": len(self.accounts), "max_size": self.max_size, "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
@@ -1,19 +1,142 @@
 import datetime
+import hmac
+import json
 import logging
-import smtplib
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import Future
 from typing import Optional
 import bcrypt
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, scoped_session
 import uuid
 
-from Application.Model.Accounts.UserAccount import UserAccount
-from Application.Model.Accounts.db import init_db
+from Application.Model.Accounts.AccountCache import AccountCache
+from Application.Model.Accounts.AccountStore import AccountStore
+from Application.Model.Accounts.AuthExecutor import AuthExecutor, completed_future, get_auth_executor
+from Application.Model.Accounts.EmailOutbox import EmailSender
+from Application.Model.Accounts.LoginRateLimiter import LOCAL_CLIENT, LoginRateLimiter
+from Application.Model.Accounts.SqlAccountStore import SqlAccountStore
+from Application.Model.Accounts.UserAccount import UserAccount, normalize_email
+from Application.Model.Accounts.WagerJournal import DurabilityMode, WagerJournal
+from Application.Utils.LoggingController import SAMPLED
+from Application.Utils.Money import Money
 
+STARTING_BALANCE: Money = Money(5000)
 
-def hash_password(password: str) -> str:
+BCRYPT_COST_FILE_PATH: str = "bcrypt_cost.json"
+BCRYPT_LATENCY_BUDGET_MS: int = 250
+DEFAULT_BCRYPT_COST: int = 12
+MIN_BCRYPT_COST: int = 10
+MAX_BCRYPT_COST: int = 16
+RESET_TOKEN_LIFETIME: datetime.timedelta = datetime.timedelta(minutes=15)
+
+target_cost: int | None = None
+dummy_hash: str | None = None
+
+
+def load_bcrypt_cost(path: str = BCRYPT_COST_FILE_PATH) -> int:
+    """
+    Reads the calibrated bcrypt cost from disk, falling back to bcrypt's default if no calibration was stored.
+
+    :param path: Path of the calibration file.
+    :return: The stored cost.
+    """
+    if os.path.exists(path):
+        with open(path, mode='r') as cost_file:
+            return json.load(cost_file)["cost"]
+
+    return DEFAULT_BCRYPT_COST
+
+
+def get_target_cost() -> int:
+    """
+    Returns the bcrypt cost new hashes should use. The stored value is read once per process.
+
+    :return: The target cost.
+    """
+    global target_cost
+
+    if target_cost is None:
+        target_cost = load_bcrypt_cost()
+
+    return target_cost
+
+
+def calibrate_bcrypt_cost(budget_ms: int = BCRYPT_LATENCY_BUDGET_MS, min_cost: int = MIN_BCRYPT_COST,
+                          max_cost: int = MAX_BCRYPT_COST, path: str = BCRYPT_COST_FILE_PATH) -> int:
+    """
+    Measures hashing time on this machine and stores the highest cost that hashes within the latency budget.
+
+    Each extra cost step doubles the work, so the search stops as soon as the next step is predicted to exceed the
+    budget. min_cost is always accepted so slow hardware never drops below a safe floor.
+
+    :param budget_ms: The longest a single hash may take, in milliseconds.
+    :param min_cost: The lowest cost that will be chosen.
+    :param max_cost: The highest cost that will be tried.
+    :param path: Where the chosen cost is stored.
+    :return: The chosen cost.
+    """
+    global target_cost
+
+    chosen: int = min_cost
+    for cost in range(min_cost, max_cost + 1):
+        start: float = time.perf_counter()
+        bcrypt.hashpw(b"calibration-password", bcrypt.gensalt(rounds=cost))
+        elapsed_ms: float = (time.perf_counter() - start) * 1000
+
+        if elapsed_ms > budget_ms and cost > min_cost:
+            break
+
+        chosen = cost
+        if elapsed_ms * 2 > budget_ms:
+            break
+
+    with open(path, mode='w') as cost_file:
+        json.dump({"cost": chosen, "budget_ms": budget_ms,
+                   "calibrated_at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}, cost_file, indent=4)
+
+    target_cost = chosen
+    logging.getLogger("account.auth").info("Calibrated bcrypt cost %d for a %dms budget", chosen, budget_ms)
+    return chosen
+
+
+def load_or_calibrate_bcrypt_cost() -> int:
+    """
+    Returns the stored bcrypt cost, running the calibration first if this machine has never been calibrated, and
+    precomputes the dummy hash at that cost.
+
+    :return: The target cost.
+    """
+    cost: int = get_target_cost() if os.path.exists(BCRYPT_COST_FILE_PATH) else calibrate_bcrypt_cost()
+    get_dummy_hash()  # Pay for the dummy hash now rather than during the first login to an unknown username
+    return cost
+
+
+def get_bcrypt_cost(hashed: str) -> int:
+    """
+    Extracts the cost factor from a bcrypt hash such as $2b$12$....
+
+    :param hashed: The stored bcrypt hash.
+    :return: The cost the hash was created with.
+    """
+    return int(hashed.split("$")[2])
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Checks whether a stored hash was created with a cost other than the current target.
+
+    :param hashed: The stored bcrypt hash.
+    :return: True if the hash should be replaced on the next successful login.
+    """
+    return get_bcrypt_cost(hashed) != get_target_cost()
+
+
+def hash_password(password: str, rounds: int | None = None) -> str:
     encoded_bytes: bytes = password.encode('utf-8')
-    salt: bytes = bcrypt.gensalt()
+    salt: bytes = bcrypt.gensalt(rounds=rounds or get_target_cost())
     hashed_password: bytes = bcrypt.hashpw(encoded_bytes, salt)
     return hashed_password.decode('utf-8')
 
@@ -22,10 +145,83 @@ def verify_password(password: str, hashed: str) -> bool:
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
 
+def get_dummy_hash() -> str:
+    """
+    Returns a hash of a random password at the target cost. Logins to unknown usernames are verified against it, so
+    they take as long to reject as a wrong password and do not reveal which usernames exist.
+
+    :return: The dummy hash.
+    """
+    global dummy_hash
+
+    if dummy_hash is None or get_bcrypt_cost(dummy_hash) != get_target_cost():
+        dummy_hash = hash_password(secrets.token_urlsafe(16))
+
+    return dummy_hash
+
+
 class AccountManager:
-    def __init__(self, session=None):
-        self.session: Session = session or init_db()
+    """
+    Loads, creates and updates accounts.
+
+    The manager hashes passwords, rate limits logins and composes emails. Everything it keeps goes through an
+    AccountStore: by default a SqlAccountStore on casino.db, or an InMemoryAccountStore for simulations. With the SQL
+    store every thread works with its own session, account cache and wager journal; worker threads should call
+    release_thread before they exit.
+    """
+
+    def __init__(self, session: Session | scoped_session | None = None, auth_executor: AuthExecutor | None = None,
+                 durability: DurabilityMode = DurabilityMode.SYNC, email_sender: EmailSender | None = None,
+                 rate_limiter: LoginRateLimiter | None = None, store: AccountStore | None = None):
+        self.store: AccountStore = store or SqlAccountStore(session, durability)
+        self.auth_executor: AuthExecutor = auth_executor or get_auth_executor()
+        self.email_sender: EmailSender | None = email_sender
         self.logger: logging.Logger = logging.getLogger("account.auth")
+        self.pending_rehashes: dict[str, str] = {}
+        self.rehash_lock: threading.Lock = threading.Lock()  # pending_rehashes is filled on the auth executor
+        self.rate_limiter: LoginRateLimiter = rate_limiter or LoginRateLimiter()
+        self.store.load_lockouts(self.rate_limiter)
+
+    @property
+    def session(self) -> Session:
+        """
+        The calling thread's session. Only available with a SqlAccountStore.
+        """
+        return self.store.session
+
+    @property
+    def cache(self) -> AccountCache:
+        """
+        The calling thread's account cache. Only available with a SqlAccountStore.
+        """
+        return self.store.cache
+
+    @property
+    def journal(self) -> WagerJournal:
+        """
+        The calling thread's wager journal. Only available with a SqlAccountStore.
+        """
+        return self.store.journal
+
+    @journal.setter
+    def journal(self, journal: WagerJournal) -> None:
+        self.store.journal = journal
+
+    @property
+    def version_conflicts(self) -> int:
+        """
+        Account updates that lost an optimistic locking race and were retried.
+        """
+        return self.store.version_conflicts
+
+    def release_thread(self) -> None:
+        """
+        Commits the calling thread's pending wagers and frees what the store keeps for the thread.
+        Worker threads call this before they exit.
+
+        :return: None
+        """
+        self.store.release_thread()
 
     def create_account(self, username: str, password: str, email: str, questions: list[str]) -> UserAccount | None:
         """
@@ -45,102 +241,431 @@ class AccountManager:
                 UserAccount | None: The newly created UserAccount object if successful, or None if the username is already taken.
         """
         # Check is username or email already exists in db
-        user: Optional[UserAccount] = self.session.query(UserAccount).filter(or_(UserAccount.username == username,
-                                                                                 UserAccount.email == email)).first()
-
-        if user:
-            self.logger.warning(f"Account Creation failed. User {username} already exists in the database.")
+        if self.account_exists(username, email):
+            self.logger.warning("Account Creation failed. User %s already exists in the database.", username)
             return None
 
         hashed_password: str = hash_password(password)
-        user = UserAccount(username, hashed_password, 50.0, email, questions)
+        user = UserAccount(username, hashed_password, STARTING_BALANCE, email, questions)
 
-        self.session.add(user)
-        self.session.commit()
+        self.store.add_account(user)
 
-        self.logger.info(f"Created new user account. With username: {username}")
+        self.logger.info("Created new user account. With username: %s", username)
         return user
 
-    def get_account(self, username: str, password: str) -> UserAccount | None:
-        user: Optional[UserAccount] = self.session.query(UserAccount).filter_by(username=username).first()
+    def find_account(self, username: str) -> UserAccount | None:
+        """
+        Loads an account by username.
+
+        :param username: The username to look up.
+        :return: UserAccount if found, otherwise None.
+        """
+        return self.store.find_by_username(username)
+
+    def get_account(self, username: str, password: str, client: str = LOCAL_CLIENT) -> UserAccount | None:
+        """
+        Checks a username and password.
+
+        Attempts from a locked out username or client are refused before any bcrypt work, and each attempt reserves
+        its slot in the rate limiter before verifying. Unknown usernames are verified against a dummy hash so they
+        cost the same as a wrong password.
+
+        :param username: Username entered by the user.
+        :param password: Password entered by the user.
+        :param client: Identifies where the attempt comes from, for rate limiting.
+        :return: The matching UserAccount, or None if the credentials are invalid or the login is locked out.
+        """
+        self.save_lockouts()
+
+        if not self.rate_limiter.reserve(username, client):
+            self.logger.warning("Login for %s from %s refused: too many failed attempts", username, client)
+            return None
+
+        succeeded: bool = False
+
+        try:
+            user: Optional[UserAccount] = self.find_account(username)
+            succeeded = verify_password(password, user.password if user is not None else get_dummy_hash()) \
+                and user is not None
+        finally:
+            self.rate_limiter.finish(username, client, succeeded)
+
+        if succeeded:
+            self.logger.info("Account found with username %s and provided password", username)
+
+            if needs_rehash(user.password):
+                with self.rehash_lock:
+                    self.pending_rehashes[username] = hash_password(password)
+                self.apply_pending_rehash(user)
 
-        if user is not None and verify_password(password, user.password):
-            self.logger.info(f"Account found with username {username} and provided password")
             return user
 
-        self.logger.warning(f"Account not found with username {username} and provided password")
+        self.logger.warning("Account not found with username %s and provided password", username)
+        self.save_lockouts()
         return None
 
-    def add_and_save_account(self, account: UserAccount, wager: float) -> None:
+    def get_account_async(self, username: str, password: str, client: str = LOCAL_CLIENT) -> Future:
+        """
+        Non-blocking variant of get_account.
+
+        The account row is loaded on the calling thread (the session is not shared with the pool) and only the
+        bcrypt verification runs on the auth executor. The attempt is reserved in the rate limiter before it is
+        submitted, so parallel guesses cannot outrun the limit. Lockouts caused by the attempt are written to the
+        database by the next call to save_lockouts.
+
+        :param username: Username entered by the user.
+        :param password: Password entered by the user.
+        :param client: Identifies where the attempt comes from, for rate limiting.
+        :return: A Future resolving to the matching UserAccount, or None if the credentials are invalid or the login
+                 is locked out.
+        """
+        self.save_lockouts()
+
+        if not self.rate_limiter.reserve(username, client):
+            self.logger.warning("Login for %s from %s refused: too many failed attempts", username, client)
+            return completed_future(None)
+
+        try:
+            user: Optional[UserAccount] = self.find_account(username)
+        except BaseException:
+            self.rate_limiter.finish(username, client)
+            raise
+
+        hashed: str | None = user.password if user is not None else None
+
+        def verify() -> UserAccount | None:
+            succeeded: bool = False
+
+            try:
+                succeeded = verify_password(password, hashed or get_dummy_hash()) and user is not None
+            finally:
+                self.rate_limiter.finish(username, client, succeeded)
+
+            if succeeded:
+                self.logger.info("Account found with username %s and provided password", username)
+
+                if needs_rehash(hashed):  # Hash here, but leave the session write to apply_pending_rehash
+                    new_hash: str = hash_password(password)
+                    with self.rehash_lock:
+                        self.pending_rehashes[username] = new_hash
+
+                return user
+
+            self.logger.warning("Account not found with username %s and provided password", username)
+            return None
+
+        try:
+            return self.auth_executor.submit(verify)
+        except BaseException:
+            self.rate_limiter.finish(username, client)
+            raise
+
+    def get_login_retry_after(self, username: str, client: str = LOCAL_CLIENT) -> float:
+        """
+        :param username: The username being logged in to.
+        :param client: Identifies where the attempt comes from.
+        :return: Seconds until a locked out username or client may try again, or 0 if it is not locked out.
+        """
+        return self.rate_limiter.retry_after(username, client)
+
+    def save_lockouts(self) -> None:
+        """
+        Writes lockouts recorded by the rate limiter to the store so they survive a restart.
+        Must be called on the thread that created the manager.
+
+        :return: None
+        """
+        if self.rate_limiter.pending_lockouts:
+            self.store.save_lockouts(self.rate_limiter)
+
+    def apply_pending_rehash(self, account: UserAccount) -> None:
+        """
+        Stores a hash computed at the target cost during a successful login, replacing an outdated one.
+        Must be called on the thread that created the manager.
+
+        :param account: The account that just logged in.
+        :return: None
+        """
+        with self.rehash_lock:
+            new_hash: str | None = self.pending_rehashes.pop(account.username, None)
+
+        if new_hash is None:
+            return
+
+        self.store.update_account(account, lambda user: setattr(user, "password", new_hash))
+        self.logger.info("Rehashed password for %s at cost %d", account.username, get_bcrypt_cost(new_hash))
+
+    def create_account_async(self, username: str, password: str, email: str, questions: list[str]) -> Future:
+        """
+        Non-blocking variant of create_account.
+
+        The uniqueness check runs on the calling thread, the password is hashed on the auth executor, and the
+        returned Future resolves to an unsaved UserAccount. Pass it to save_new_account on the UI thread to persist it.
+
+        :param username: The desired username for the new account.
+        :param password: The password associated with the account.
+        :param email: The email address tied to the account.
+        :param questions: A list of security questions and answers.
+        :return: A Future resolving to a transient UserAccount, or None if the username or email is taken.
+        """
+        if self.account_exists(username, email):
+            self.logger.warning("Account Creation failed. User %s already exists in the database.", username)
+            return completed_future(None)
+
+        def build() -> UserAccount:
+            return UserAccount(username, hash_password(password), STARTING_BALANCE, email, questions)
+
+        return self.auth_executor.submit(build)
+
+    def save_new_account(self, user: UserAccount) -> UserAccount | None:
+        """
+        Persists an account built by create_account_async.
+
+        The uniqueness check is repeated because another signup may have committed while the hash was computed.
+
+        :param user: The transient UserAccount to save.
+        :return: The saved UserAccount, or None if the username or email was taken in the meantime.
+        """
+        if self.account_exists(user.username, user.email):
+            self.logger.warning("Account Creation failed. User %s already exists in the database.", user.username)
+            return None
+
+        self.store.add_account(user)
+
+        self.logger.info("Created new user account. With username: %s", user.username)
+        return user
+
+    def account_exists(self, username: str, email: str) -> bool:
+        """
+        Checks whether an account already uses the given username or email.
+
+        :param username: The username to check.
+        :param email: The email to check.
+        :return: True if either value is already taken, False otherwise.
+        """
+        return self.store.account_exists(username, normalize_email(email))
+
+    def add_and_save_account(self, account: UserAccount, wager: Money | float) -> None:
+        wager = Money.of(wager)
         account.add_winnings(wager)
-        self.logger.info(f"{account.username} added winning {wager}")
+        self.logger.info("%s added winning %s", account.username, wager, extra=SAMPLED)
 
-        self.session.commit()
-        self.logger.info(f"Account saved with username {account.username}")
+        self.store.record_wager(account, wager)
 
-    def subtract_and_save_account(self, account: UserAccount, wager: float) -> None:
+    def subtract_and_save_account(self, account: UserAccount, wager: Money | float) -> None:
+        wager = Money.of(wager)
         account.subtract_losses(wager)
-        self.logger.info(f"{account.username} subtracted losses {wager}")
+        self.logger.info("%s subtracted losses %s", account.username, wager, extra=SAMPLED)
+
+        self.store.record_wager(account, -wager)
+
+    def settle_debit(self, account: UserAccount, wager: Money | float) -> bool:
+        """
+        Atomically subtracts a wager from an account if, and only if, the stored balance covers it.
+
+        The check happens against the stored balance rather than the one on the account object, so several processes
+        sharing casino.db can never overdraw an account. The account's balance is refreshed to the new value.
+
+        :param account: The account to debit.
+        :param wager: The positive amount to subtract.
+        :return: True if the debit was applied, False if the balance was insufficient.
+        """
+        wager = Money.of(wager)
+        if wager <= 0:
+            raise ValueError("Wager must be positive")
+
+        new_balance: Money | None = self.store.settle_debit(account, wager)
+
+        if new_balance is None:
+            self.logger.warning("Debit of %s rejected for %s: insufficient funds", wager, account.username)
+            return False
+
+        self.logger.info("%s settled debit %s. New balance: %s", account.username, wager, new_balance,
+                         extra=SAMPLED)
+        return True
+
+    def issue_session_token(self, account: UserAccount) -> str:
+        """
+        Starts a session for an account that just logged in, so the next visit can skip the password.
+
+        :param account: The logged in account.
+        :return: The signed session token to store on the client.
+        """
+        token: str = self.store.issue_session_token(account.username)
+        self.logger.info("Issued session token for %s", account.username)
+        return token
+
+    def get_account_by_session_token(self, token: str) -> UserAccount | None:
+        """
+        Logs in with a session token instead of a password. Checking the token costs an HMAC and a lookup rather than
+        a bcrypt verification.
+
+        :param token: The token returned by issue_session_token.
+        :return: The account the token was issued for, or None if it is forged, expired or revoked.
+        """
+        username: str | None = self.store.get_session_username(token)
 
-        self.session.commit()
-        self.logger.info(f"Account saved with username {account.username}")
+        if username is None:
+            self.logger.warning("Rejected invalid, expired or revoked session token")
+            return None
+
+        return self.find_account(username)
+
+    def revoke_session_token(self, token: str) -> None:
+        """
+        Ends a session, e.g. when its user logs out.
+
+        :param token: The token to revoke.
+        :return: None
+        """
+        self.store.revoke_session_token(token)
+
+    def get_ledger_balance(self, account: UserAccount) -> Money:
+        """
+        Rebuilds an account's balance from its ledger snapshot and the entries after it, e.g. for auditing.
+
+        :param account: The account to rebuild.
+        :return: The balance according to the ledger.
+        """
+        return self.store.get_ledger_balance(account.username)
+
+    def compact_ledger(self) -> int:
+        """
+        Refreshes ledger snapshots and folds expired entries into them. Called periodically.
+
+        :return: The number of ledger entries folded into snapshots.
+        """
+        return self.store.compact_ledger()
+
+    def flush_wagers(self) -> None:
+        """
+        Commits any balance changes the store is still buffering.
+
+        :return: None
+        """
+        self.store.flush_wagers()
+
+    def flush_due_wagers(self) -> None:
+        """
+        Commits buffered wagers if the store's batching threshold has been reached. Called periodically.
+
+        :return: None
+        """
+        self.store.flush_due_wagers()
+
+    def close(self) -> None:
+        """
+        Commits pending wagers and lockouts, then releases the store.
+
+        :return: None
+        """
+        self.save_lockouts()
+        self.store.close()
 
     def update_password(self, account: UserAccount, new_password: str) -> None:
         hashed_password: str = hash_password(new_password)
-        account.password = hashed_password
-        self.logger.info(f"Updated password for {account.username}")
 
-        self.session.commit()
-        self.logger.info(f"Account saved with username {account.username}")
+        self.store.change_password(account, hashed_password)  # Tokens issued under the old password stop working
+        self.logger.info("Updated password for %s", account.username)
+        self.logger.info("Account saved with username %s", account.username)
 
     def generate_uuid_and_store_it(self, account: UserAccount) -> str:
         token: uuid = uuid.uuid4()
-        token_expiration: datetime = datetime.datetime.now(datetime.UTC) + datetime.timedelta(minutes=15)
+        token_expiration: datetime = datetime.datetime.now(datetime.UTC) + RESET_TOKEN_LIFETIME
 
-        account.reset_token = token
-        self.logger.info(f"Generated new uuid token for {account.username}")
-        account.reset_token_expiration = token_expiration
-        self.logger.info(f"Generated new uuid token expiration for {account.username}")
+        def store_token(user: UserAccount) -> None:
+            user.reset_token = token
+            user.reset_token_expiration = token_expiration
 
-        self.session.commit()
-        self.logger.info(f"Account saved with username {account.username}")
+        self.store.update_account(account, store_token)
+        self.logger.info("Generated new uuid token for %s", account.username)
+        self.logger.info("Generated new uuid token expiration for %s", account.username)
+        self.logger.info("Account saved with username %s", account.username)
         return str(token)
 
     def invalidate_reset_token(self, account: UserAccount):
-        account.reset_token = None
-        account.reset_token_expiration = None
-        self.logger.info(f"Invalidated token and expiration for {account.username}")
+        def clear_token(user: UserAccount) -> None:
+            user.reset_token = None
+            user.reset_token_expiration = None
 
-        self.session.commit()
-        self.logger.info(f"Account saved with username {account.username}")
+        self.store.update_account(account, clear_token)
+        self.logger.info("Invalidated token and expiration for %s", account.username)
+        self.logger.info("Account saved with username %s", account.username)
 
     def email_recovery_token(self, account: UserAccount) -> None:
-        from os import getenv
-        from dotenv import load_dotenv, find_dotenv
+        """
+        Issues a new reset token and queues the email carrying it in the same transaction. Returns without waiting
+        for the SMTP server; the outbox sender delivers the message in the background.
+
+        :param account: The account requesting a password reset.
+        :return: None
+        """
+        token: uuid.UUID = uuid.uuid4()
+        token_expiration: datetime.datetime = datetime.datetime.now(datetime.UTC) + RESET_TOKEN_LIFETIME
+
+        subject: str = "Python Casino Password Reset"
+        body: str = (f"Below is your password reset token.\n"
+                     f"Please paste it in the prompt on the application:\n\n{token}")
+        self.store.issue_reset_token(account, token, token_expiration, subject, body)
+        self.logger.info("Generated new uuid token for %s", account.username)
+        self.logger.info("Queued reset email to %s", account.email)
+
+        if self.email_sender is not None:
+            self.email_sender.wake()
+
+    def verify_security_answers(self, account: UserAccount, answers: list[str]) -> bool:
+        """
+        Checks the answers to an account's security questions, e.g. before emailing a reset token.
 
-        dotenv_path = find_dotenv()
-        load_dotenv(dotenv_path)
+        :param account: The account being recovered.
+        :param answers: The answers entered by the user, in question order.
+        :return: True if both answers match.
+        """
+        expected: list[str] = [account.security_answer_one or "", account.security_answer_two or ""]
+
+        return len(answers) == len(expected) and all(hmac.compare_digest(answer.encode(), stored.encode())
+                                                     for answer, stored in zip(answers, expected))
+
+    def is_reset_token_valid(self, account: UserAccount, token: str) -> bool:
+        """
+        Checks a reset token entered by the user against the one issued to the account.
 
-        username: str = getenv("G_USERNAME")
-        password: str = getenv("G_KEY")
+        :param account: The account being recovered.
+        :param token: The token entered by the user.
+        :return: True if the token matches and has not expired, False otherwise.
+        """
+        try:
+            input_token: uuid.UUID = uuid.UUID(token)
+        except ValueError:
+            return False
 
-        token: str = self.generate_uuid_and_store_it(account)
+        if account.reset_token is None or account.reset_token_expiration is None:
+            return False
 
-        with smtplib.SMTP("smtp.gmail.com", 587, timeout=10) as smtp:
-            smtp.starttls()
-            smtp.login(username, password)
-            subject: str = "Python Casino Password Reset"
-            body: str = (f"Below is your password reset token.\n"
-                         f"Please paste it in the prompt on the application:\n\n{token}")
-            message = f"Subject: {subject}\n\n{body}"
-            smtp.sendmail(username, account.email, message)
-            self.logger.info(f"Email sent to {account.email}")
+        now: datetime.datetime = datetime.datetime.now(datetime.UTC)
+        expiration: datetime.datetime = account.reset_token_expiration.replace(tzinfo=datetime.timezone.utc)
+        return account.reset_token == input_token and expiration > now
 
     def get_account_by_email(self, email: str) -> UserAccount | None:
         """
-        Queries the database for a UserAccount associated with the provided email.
+        Looks up the UserAccount associated with the provided email. The lookup is case-insensitive.
 
         :param email: The email address to search for.
         :return: UserAccount if found, otherwise None.
         """
-        return self.session.query(UserAccount).filter_by(email=email).first()
+        return self.store.find_by_email(normalize_email(email))
+
+    def get_account_by_reset_token(self, token: str | uuid.UUID) -> UserAccount | None:
+        """
+        Looks up the account holding an unexpired reset token.
+
+        :param token: The reset token entered by the user.
+        :return: UserAccount if the token exists and has not expired, otherwise None.
+        """
+        try:
+            token = token if isinstance(token, uuid.UUID) else uuid.UUID(token)
+        except ValueError:
+            return None
+
+        now: datetime = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)  # Stored expirations are naive UTC
+        return self.store.find_by_reset_token(token, now)
@@ -0,0 +1,67 @@
+"""
+Pre-built statements for the account lookups made on every login, signup and reset.
+
+Each statement is constructed once at import time with bindparam placeholders, so a call only binds values. The
+statements' cache keys never change, so SQLAlchemy compiles each one once per engine and reuses the compiled form
+from its statement cache afterwards.
+"""
+import datetime
+import uuid
+
+from sqlalchemy import Select, bindparam, exists, or_, select
+from sqlalchemy.orm import Session
+
+from Application.Model.Accounts.UserAccount import UserAccount
+
+ACCOUNT_BY_USERNAME: Select = select(UserAccount).where(UserAccount.username == bindparam("username")).limit(1)
+
+ACCOUNT_BY_EMAIL: Select = (select(UserAccount)
+                            .where(UserAccount.email_normalized == bindparam("email_normalized"))
+                            .limit(1))
+
+ACCOUNT_BY_RESET_TOKEN: Select = (select(UserAccount)
+                                  .where(UserAccount.reset_token == bindparam("reset_token"),
+                                         UserAccount.reset_token_expiration > bindparam("now"))
+                                  .limit(1))
+
+# SELECT EXISTS (...) stops at the first matching row and returns a single boolean instead of a loaded account
+ACCOUNT_EXISTS: Select = select(exists().where(or_(UserAccount.username == bindparam("username"),
+                                                   UserAccount.email_normalized == bindparam("email_normalized"))))
+
+
+def find_by_username(session: Session, username: str) -> UserAccount | None:
+    """
+    :param session: Session bound to the casino database.
+    :param username: The username to look up.
+    :return: The matching account, or None.
+    """
+    return session.execute(ACCOUNT_BY_USERNAME, {"username": username}).scalars().first()
+
+
+def find_by_email(session: Session, email_normalized: str) -> UserAccount | None:
+    """
+    :param session: Session bound to the casino database.
+    :param email_normalized: The email, already passed through normalize_email.
+    :return: The matching account, or None.
+    """
+    return session.execute(ACCOUNT_BY_EMAIL, {"email_normalized": email_normalized}).scalars().first()
+
+
+def find_by_reset_token(session: Session, token: uuid.UUID, now: datetime.datetime) -> UserAccount | None:
+    """
+    :param session: Session bound to the casino database.
+    :param token: The reset token.
+    :param now: The current time as naive UTC. Tokens that expire at or before it are ignored.
+    :return: The account holding the unexpired token, or None.
+    """
+    return session.execute(ACCOUNT_BY_RESET_TOKEN, {"reset_token": token, "now": now}).scalars().first()
+
+
+def username_or_email_taken(session: Session, username: str, email_normalized: str) -> bool:
+    """
+    :param session: Session bound to the casino database.
+    :param username: The username to check.
+    :param email_normalized: The email to check, already passed through normalize_email.
+    :return: True if an account already uses either value.
+    """
+    return session.execute(ACCOUNT_EXISTS, {"username": username, "email_normalized": email_normalized}).scalar()
@@ -0,0 +1,446 @@
+"""
+Local account service. One process owns casino.db through a single AccountManager and every casino client talks to
+it over a socket, so only one process ever writes to SQLite.
+
+Run with: python -m Application.Model.Accounts.AccountServer [--host HOST] [--port PORT] [--unix PATH]
+
+The protocol is one JSON object per line in each direction:
+    request:  {"id": 1, "method": "settle_debit", "params": {"username": "alice", "cents": 500}}
+    response: {"id": 1, "result": {...}} or {"id": 1, "error": {"type": "ValueError", "message": "..."}}
+
+A connection starts anonymous and authenticates as an account through login, create_account, resume_session or
+redeem_reset_token. RPCs that change an account or start a session for it only act on that authenticated account.
+An anonymous connection only sees an account's username and security questions, and may ask for a reset token email
+only right after answering those questions.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import threading
+from contextlib import suppress
+
+from Application.Model.Accounts.AccountManager import AccountManager, load_or_calibrate_bcrypt_cost
+from Application.Model.Accounts.EmailOutbox import EmailSender, load_email_config
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode
+from Application.Utils.LoggingController import setup_logging, shutdown_logging
+from Application.Utils.Money import Money
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+WAGER_FLUSH_INTERVAL_MS: int = 250
+LEDGER_COMPACTION_INTERVAL_S: int = 10 * 60
+STREAM_LIMIT: int = 64 * 1024
+
+
+def account_to_dict(account: UserAccount | None) -> dict | None:
+    """
+    Serializes the parts of an account a client needs. Secrets never leave the server: not the password hash, not the
+    security answers and not the reset token, which only ever travels by email.
+
+    :param account: The account to serialize.
+    :return: A JSON-compatible dict, or None if account is None.
+    """
+    if account is None:
+        return None
+
+    return {"username": account.username, "balance": account.balance.cents, "email": account.email,
+            "questions": [account.security_question_one, account.security_question_two]}
+
+
+def recovery_to_dict(account: UserAccount | None) -> dict | None:
+    """
+    Serializes what the password recovery screen needs before the connection is bound to the account: who the
+    account is and which questions to ask. Balance and email are left out.
+
+    :param account: The account being recovered.
+    :return: A JSON-compatible dict, or None if account is None.
+    """
+    if account is None:
+        return None
+
+    return {"username": account.username, "questions": [account.security_question_one, account.security_question_two]}
+
+
+def account_from_dict(data: dict | None) -> UserAccount | None:
+    """
+    Rebuilds a detached UserAccount from account_to_dict output. Its security answers are left blank.
+
+    :param data: The serialized account.
+    :return: A UserAccount that is not attached to any session, or None if data is None.
+    """
+    if data is None:
+        return None
+
+    question_one, question_two = data["questions"]
+    return UserAccount(data["username"], "", Money(data["balance"]), data["email"],
+                       [question_one, "", question_two, ""])
+
+
+class RecoveringAccount:
+    """
+    The part of an account a client sees while recovering it, rebuilt from recovery_to_dict output. It stands in for
+    the UserAccount until a reset token logs the connection in.
+
+    Attributes:
+        username (str): The account's username.
+        security_question_one (str): The first security question.
+        security_question_two (str): The second security question.
+        reset_token (None): Always None, since the token only travels by email.
+    """
+
+    def __init__(self, username: str, questions: list[str]):
+        self.username: str = username
+        self.security_question_one, self.security_question_two = questions
+        self.reset_token: None = None
+
+
+def recovery_from_dict(data: dict | None) -> RecoveringAccount | None:
+    """
+    :param data: The serialized account, from recovery_to_dict.
+    :return: The account being recovered, or None if data is None.
+    """
+    return RecoveringAccount(data["username"], data["questions"]) if data is not None else None
+
+
+class ClientConnection:
+    """
+    What the server knows about one connected client.
+
+    Attributes:
+        client (str): The peer address, used to rate limit logins. Never taken from a request.
+        username (str | None): The account the connection has authenticated as, or None while it is anonymous.
+        recovering (str | None): The account whose security answers the connection has just answered correctly, which
+                                 lets it ask for one reset token email.
+    """
+
+    def __init__(self, client: str):
+        self.client: str = client
+        self.username: str | None = None
+        self.recovering: str | None = None
+
+
+class AccountServer:
+    """
+    asyncio server exposing login, create, settle and reset RPCs backed by one AccountManager.
+
+    All database work runs on the event loop thread, which is the only thread that touches the manager's session.
+    Password hashing and verification are awaited from the manager's auth executor so they never block other clients.
+
+    Attributes:
+        address (tuple | str | None): The bound (host, port) or Unix socket path once started.
+        started (threading.Event): Set once the server is accepting connections.
+    """
+
+    def __init__(self, manager: AccountManager, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 unix_path: str | None = None):
+        self.manager: AccountManager = manager
+        self.host: str = host
+        self.port: int = port
+        self.unix_path: str | None = unix_path
+        self.logger: logging.Logger = logging.getLogger("account.auth")
+
+        self.address: tuple | str | None = None
+        self.started: threading.Event = threading.Event()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.server: asyncio.AbstractServer | None = None
+
+        # Every method is called with the requesting ClientConnection first
+        self.methods: dict = {"login": self.login, "create_account": self.create_account,
+                              "get_account_by_email": self.get_account_by_email,
+                              "verify_security_answers": self.verify_security_answers,
+                              "email_recovery_token": self.email_recovery_token,
+                              "redeem_reset_token": self.redeem_reset_token,
+                              "invalidate_reset_token": self.invalidate_reset_token,
+                              "update_password": self.update_password, "settle_debit": self.settle_debit,
+                              "add_winnings": self.add_winnings,
+                              "issue_session_token": self.issue_session_token,
+                              "resume_session": self.resume_session,
+                              "revoke_session_token": self.revoke_session_token,
+                              "login_retry_after": self.login_retry_after}
+
+    async def serve(self) -> None:
+        """
+        Accepts clients until stop() is called, then commits any journaled wagers.
+
+        :return: None
+        """
+        self.loop = asyncio.get_running_loop()
+
+        if self.unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_client, self.unix_path, limit=STREAM_LIMIT)
+            self.address = self.unix_path
+        else:
+            self.server = await asyncio.start_server(self.handle_client, self.host, self.port, limit=STREAM_LIMIT)
+            self.address = self.server.sockets[0].getsockname()[:2]
+
+        flusher: asyncio.Task = asyncio.create_task(self.flush_wagers())
+        compactor: asyncio.Task = asyncio.create_task(self.compact_ledger())
+        self.logger.info("Account server listening on %s", self.address)
+        self.started.set()
+
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        except asyncio.CancelledError:
+            pass
+        finally:
+            flusher.cancel()
+            compactor.cancel()
+            self.manager.release_thread()
+
+    def stop(self) -> None:
+        """
+        Stops the server. Safe to call from any thread.
+
+        :return: None
+        """
+        if self.loop is not None and self.server is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
+
+    async def flush_wagers(self) -> None:
+        while True:
+            await asyncio.sleep(WAGER_FLUSH_INTERVAL_MS / 1000)
+            self.manager.flush_due_wagers()
+
+    async def compact_ledger(self) -> None:
+        while True:
+            await asyncio.sleep(LEDGER_COMPACTION_INTERVAL_S)
+            self.manager.compact_ledger()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername")
+        connection: ClientConnection = ClientConnection(peer[0] if isinstance(peer, tuple) else "unix")
+
+        try:
+            while line := await reader.readline():
+                await self.reply(writer, await self.dispatch(line, connection))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except (asyncio.LimitOverrunError, ValueError):  # readline raises ValueError for a line over STREAM_LIMIT
+            self.logger.warning("Closing connection from %s: request longer than %d bytes", connection.client,
+                                STREAM_LIMIT)
+            error: dict = {"type": "ValueError", "message": f"Request longer than {STREAM_LIMIT} bytes"}
+
+            with suppress(ConnectionError):
+                await self.reply(writer, {"id": None, "error": error})
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def reply(writer: asyncio.StreamWriter, response: dict) -> None:
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def dispatch(self, line: bytes, connection: ClientConnection) -> dict:
+        """
+        Runs one request and builds its response. Errors are returned to the client rather than raised.
+
+        :param line: The raw request line.
+        :param connection: The connection the request came in on.
+        :return: The response object.
+        """
+        request_id = None
+
+        try:
+            request: dict = json.loads(line)
+            request_id = request.get("id")
+            method = self.methods.get(request.get("method"))
+
+            if method is None:
+                raise LookupError(f"Unknown method {request.get('method')}")
+
+            return {"id": request_id, "result": await method(connection, **request.get("params", {}))}
+        except Exception as e:
+            self.logger.warning("Account server request failed: %s", e)
+            return {"id": request_id, "error": {"type": type(e).__name__, "message": str(e)}}
+
+    def require_account(self, username: str) -> UserAccount:
+        account: UserAccount | None = self.manager.find_account(username)
+
+        if account is None:
+            raise LookupError(f"No account with username {username}")
+
+        return account
+
+    def require_identity(self, connection: ClientConnection, username: str) -> UserAccount:
+        """
+        Loads the account a request acts on, provided the connection has authenticated as it.
+
+        :param connection: The requesting connection.
+        :param username: The account the request names.
+        :return: The account.
+        :raises PermissionError: If the connection is anonymous or authenticated as another account.
+        """
+        if connection.username is None or connection.username != username:
+            self.logger.warning("Refused request for %s from %s: not authenticated as it", username,
+                                connection.client)
+            raise PermissionError(f"Not logged in as {username}")
+
+        return self.require_account(username)
+
+    def bind(self, connection: ClientConnection, account: UserAccount | None) -> dict | None:
+        """
+        Authenticates the connection as an account, or makes it anonymous again if account is None.
+
+        :return: The serialized account.
+        """
+        connection.username = account.username if account is not None else None
+        return account_to_dict(account)
+
+    async def login(self, connection: ClientConnection, username: str, password: str) -> dict | None:
+        account: UserAccount | None = await asyncio.wrap_future(
+            self.manager.get_account_async(username, password, connection.client))
+
+        if account is not None:
+            self.manager.apply_pending_rehash(account)
+        self.manager.save_lockouts()
+
+        return self.bind(connection, account)
+
+    async def login_retry_after(self, connection: ClientConnection, username: str) -> float:
+        return self.manager.get_login_retry_after(username, connection.client)
+
+    async def create_account(self, connection: ClientConnection, username: str, password: str, email: str,
+                             questions: list[str]) -> dict | None:
+        new_account: UserAccount | None = await asyncio.wrap_future(
+            self.manager.create_account_async(username, password, email, questions))
+
+        return self.bind(connection, self.manager.save_new_account(new_account) if new_account else None)
+
+    async def get_account_by_email(self, connection: ClientConnection, email: str) -> dict | None:
+        """
+        Looks up the account to recover. Unknown emails count as failures against the email and the client, so
+        addresses cannot be probed any faster than passwords can be guessed.
+
+        :return: The account's recovery_to_dict view, or None if there is no such account or the lookup was refused.
+        """
+        key: str = email.strip().lower()
+
+        if not self.manager.rate_limiter.reserve(key, connection.client):
+            return None
+
+        account: UserAccount | None = None
+
+        try:
+            account = self.manager.get_account_by_email(email)
+        finally:
+            self.manager.rate_limiter.finish(key, connection.client, account is not None)
+            self.manager.save_lockouts()
+
+        return recovery_to_dict(account)
+
+    async def verify_security_answers(self, connection: ClientConnection, username: str, answers: list[str]) -> bool:
+        verified: bool = self.check_limited(connection, username,
+                                            lambda account: self.manager.verify_security_answers(account, answers))
+        connection.recovering = username if verified else None
+        return verified
+
+    async def email_recovery_token(self, connection: ClientConnection, username: str) -> None:
+        """
+        Emails a reset token, once per correct set of security answers, so a peer cannot keep replacing another
+        player's token or flood their inbox.
+
+        :raises PermissionError: If the connection has not just answered the account's security questions.
+        """
+        if connection.recovering is None or connection.recovering != username:
+            self.logger.warning("Refused reset token email for %s from %s: security answers not verified", username,
+                                connection.client)
+            raise PermissionError(f"Security answers for {username} not verified")
+
+        connection.recovering = None
+
+        def send(account: UserAccount) -> bool:
+            self.manager.email_recovery_token(account)
+            return True
+
+        if not self.check_limited(connection, username, send):
+            raise PermissionError(f"Too many attempts for {username}, try again later")
+
+    async def redeem_reset_token(self, connection: ClientConnection, username: str, token: str) -> bool:
+        valid: bool = self.check_limited(connection, username,
+                                         lambda account: self.manager.is_reset_token_valid(account, token))
+        self.bind(connection, self.require_account(username) if valid else None)
+        return valid
+
+    def check_limited(self, connection: ClientConnection, username: str, check) -> bool:
+        """
+        Runs a recovery check against an account, counting failures towards the same lockout as failed logins so the
+        answers and reset tokens cannot be guessed any faster than passwords.
+
+        :param connection: The requesting connection.
+        :param username: The account being recovered.
+        :param check: Called with the account, returns whether the secret matched.
+        :return: True if the secret matched and the account is not locked out.
+        """
+        if not self.manager.rate_limiter.reserve(username, connection.client):
+            return False
+
+        matched: bool = False
+
+        try:
+            matched = check(self.require_account(username))
+        finally:
+            self.manager.rate_limiter.finish(username, connection.client, matched)
+            self.manager.save_lockouts()
+
+        return matched
+
+    async def invalidate_reset_token(self, connection: ClientConnection, username: str) -> None:
+        self.manager.invalidate_reset_token(self.require_identity(connection, username))
+
+    async def update_password(self, connection: ClientConnection, username: str, new_password: str) -> None:
+        self.manager.update_password(self.require_identity(connection, username), new_password)
+
+    async def settle_debit(self, connection: ClientConnection, username: str, cents: int) -> dict:
+        account: UserAccount = self.require_identity(connection, username)
+        settled: bool = self.manager.settle_debit(account, Money(cents))
+        return {"settled": settled, "balance": account.balance.cents}
+
+    async def add_winnings(self, connection: ClientConnection, username: str, cents: int) -> dict:
+        account: UserAccount = self.require_identity(connection, username)
+        self.manager.add_and_save_account(account, Money(cents))
+        return {"balance": account.balance.cents}
+
+    async def issue_session_token(self, connection: ClientConnection, username: str) -> str:
+        return self.manager.issue_session_token(self.require_identity(connection, username))
+
+    async def resume_session(self, connection: ClientConnection, token: str) -> dict | None:
+        return self.bind(connection, self.manager.get_account_by_session_token(token))
+
+    async def revoke_session_token(self, connection: ClientConnection, token: str) -> None:
+        account: UserAccount | None = self.manager.get_account_by_session_token(token)
+
+        if account is not None:
+            self.require_identity(connection, account.username)
+            self.manager.revoke_session_token(token)
+
+        connection.username = None
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Run the shared casino account server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", dest="unix_path", help="Listen on a Unix socket instead of TCP")
+    args: argparse.Namespace = parser.parse_args()
+
+    setup_logging()
+    load_or_calibrate_bcrypt_cost()
+    load_email_config()
+
+    email_sender: EmailSender = EmailSender().start()
+    manager: AccountManager = AccountManager(durability=DurabilityMode.GROUP, email_sender=email_sender)
+
+    try:
+        asyncio.run(AccountServer(manager, host=args.host, port=args.port, unix_path=args.unix_path).serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        email_sender.stop(timeout=1)
+        shutdown_logging()
+
+
+if __name__ == "__main__":
+    main()
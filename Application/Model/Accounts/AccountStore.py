@@ -0,0 +1,199 @@
+import datetime
+import uuid
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from Application.Model.Accounts.LoginRateLimiter import LoginRateLimiter
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Utils.Money import Money
+
+
+class AccountStore(ABC):
+    """
+    Storage behind AccountManager. The manager owns hashing, rate limiting and logging; a store only keeps accounts,
+    their ledger, session tokens and queued emails.
+
+    SqlAccountStore keeps everything in casino.db. InMemoryAccountStore keeps it in dicts for simulations and load
+    tests. Both must pass the AccountManager contract tests.
+
+    Attributes:
+        version_conflicts (int): Updates that lost an optimistic locking race and were retried.
+    """
+
+    version_conflicts: int = 0
+
+    @abstractmethod
+    def find_by_username(self, username: str) -> UserAccount | None:
+        """
+        :param username: The username to look up.
+        :return: The matching account, or None.
+        """
+
+    @abstractmethod
+    def find_by_email(self, email_normalized: str) -> UserAccount | None:
+        """
+        :param email_normalized: The email, already passed through normalize_email.
+        :return: The matching account, or None.
+        """
+
+    @abstractmethod
+    def find_by_reset_token(self, token: uuid.UUID, now: datetime.datetime) -> UserAccount | None:
+        """
+        :param token: The reset token.
+        :param now: The current time as naive UTC. Tokens that expire at or before it are ignored.
+        :return: The account holding the unexpired token, or None.
+        """
+
+    @abstractmethod
+    def account_exists(self, username: str, email_normalized: str) -> bool:
+        """
+        :param username: The username to check.
+        :param email_normalized: The email to check, already passed through normalize_email.
+        :return: True if an account already uses either value.
+        """
+
+    @abstractmethod
+    def add_account(self, account: UserAccount) -> None:
+        """
+        Saves a new account and records its balance as the opening ledger entry.
+
+        :param account: The account to save.
+        :return: None
+        """
+
+    @abstractmethod
+    def record_wager(self, account: UserAccount, delta: Money) -> None:
+        """
+        Saves a balance change that has already been applied to the account, together with its ledger entry.
+
+        :param account: The account whose balance changed.
+        :param delta: The signed change in balance.
+        :return: None
+        """
+
+    @abstractmethod
+    def settle_debit(self, account: UserAccount, wager: Money) -> Money | None:
+        """
+        Subtracts a wager if, and only if, the stored balance covers it, and updates the account's balance to match.
+
+        :param account: The account to debit.
+        :param wager: The positive amount to subtract.
+        :return: The new balance, or None if the balance was insufficient.
+        """
+
+    @abstractmethod
+    def update_account(self, account: UserAccount, change: Callable[[UserAccount], None]) -> None:
+        """
+        Applies a change to an account and saves it, reapplying it on top of a newer version after a conflict.
+
+        :param account: The account to change.
+        :param change: Sets the new values on the account. May be called more than once.
+        :return: None
+        """
+
+    @abstractmethod
+    def change_password(self, account: UserAccount, hashed_password: str) -> None:
+        """
+        Stores a new password hash and revokes every session token of the account in the same change.
+
+        :param account: The account to change.
+        :param hashed_password: The new bcrypt hash.
+        :return: None
+        """
+
+    @abstractmethod
+    def issue_session_token(self, username: str) -> str:
+        """
+        :param username: The account the token logs in as.
+        :return: A new signed session token.
+        """
+
+    @abstractmethod
+    def get_session_username(self, token: str) -> str | None:
+        """
+        :param token: The token presented by the client.
+        :return: The username the token belongs to, or None if it is forged, expired or revoked.
+        """
+
+    @abstractmethod
+    def revoke_session_token(self, token: str) -> None:
+        """
+        :param token: The token to revoke.
+        :return: None
+        """
+
+    @abstractmethod
+    def issue_reset_token(self, account: UserAccount, token: uuid.UUID, expiration: datetime.datetime, subject: str,
+                          body: str) -> None:
+        """
+        Stores a password reset token and queues the email carrying it to the account's address in the same change, so
+        a token is never issued without its email or the other way around.
+
+        :param account: The account requesting a password reset.
+        :param token: The new reset token.
+        :param expiration: When the token stops being accepted.
+        :param subject: Subject line of the email.
+        :param body: Plain-text body of the email, including the token.
+        :return: None
+        """
+
+    @abstractmethod
+    def load_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        """
+        Restores lockouts saved by an earlier run into the rate limiter.
+
+        :param rate_limiter: The manager's rate limiter.
+        :return: None
+        """
+
+    @abstractmethod
+    def save_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        """
+        Saves lockouts the rate limiter recorded since the last call.
+
+        :param rate_limiter: The manager's rate limiter.
+        :return: None
+        """
+
+    @abstractmethod
+    def get_ledger_balance(self, username: str) -> Money:
+        """
+        :param username: The account to rebuild.
+        :return: The balance according to the ledger.
+        """
+
+    @abstractmethod
+    def compact_ledger(self) -> int:
+        """
+        Folds old ledger entries into snapshots.
+
+        :return: The number of ledger entries folded.
+        """
+
+    def flush_wagers(self) -> None:
+        """
+        Saves any wagers the store is still buffering.
+
+        :return: None
+        """
+
+    def flush_due_wagers(self) -> None:
+        """
+        Saves buffered wagers if the store's batching threshold has been reached.
+
+        :return: None
+        """
+
+    def release_thread(self) -> None:
+        """
+        Frees anything the store keeps for the calling thread.
+
+        :return: None
+        """
+
+    def close(self) -> None:
+        """
+        Saves buffered wagers and releases the store's resources.
+
+        :return: None
+        """
@@ -0,0 +1,90 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+DEFAULT_MAX_WORKERS: int = 2
+
+
+class AuthExecutor:
+    """
+    Runs bcrypt hashing and verification on a bounded pool of worker threads.
+
+    bcrypt releases the GIL while it works, so running it on threads keeps the Tk mainloop responsive without the
+    pickling overhead of a process pool. Every method returns a Future that the caller can poll or block on.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="auth")
+        self.logger: logging.Logger = logging.getLogger("account.auth")
+
+    def submit(self, func: Callable, *args) -> Future:
+        """
+        Schedules an arbitrary callable on the auth pool.
+
+        :param func: The callable to run on a worker thread.
+        :param args: Positional arguments passed to func.
+        :return: A Future resolving to the callable's return value.
+        """
+        return self.pool.submit(func, *args)
+
+    def hash_password(self, password: str) -> Future:
+        """
+        Hashes a password on the auth pool.
+
+        :param password: The plain text password to hash.
+        :return: A Future resolving to the bcrypt hash as a string.
+        """
+        from Application.Model.Accounts.AccountManager import hash_password
+        return self.submit(hash_password, password)
+
+    def verify_password(self, password: str, hashed: str) -> Future:
+        """
+        Verifies a password against a stored hash on the auth pool.
+
+        :param password: The plain text password entered by the user.
+        :param hashed: The stored bcrypt hash.
+        :return: A Future resolving to True if the password matches, False otherwise.
+        """
+        from Application.Model.Accounts.AccountManager import verify_password
+        return self.submit(verify_password, password, hashed)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting work and optionally waits for queued hashes to finish.
+
+        :param wait: If True, blocks until all pending work has completed.
+        :return: None
+        """
+        self.pool.shutdown(wait=wait)
+        self.logger.info("Auth executor shut down")
+
+
+def completed_future(result) -> Future:
+    """
+    Builds a Future that is already resolved with the given result.
+
+    Used for short-circuit paths (e.g. unknown usernames) so callers can treat every auth call the same way.
+
+    :param result: The value the Future should resolve to.
+    :return: A resolved Future.
+    """
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+_default_executor: AuthExecutor | None = None
+
+
+def get_auth_executor() -> AuthExecutor:
+    """
+    Returns the process-wide AuthExecutor, creating it on first use.
+
+    :return: The shared AuthExecutor instance.
+    """
+    global _default_executor
+
+    if _default_executor is None:
+        _default_executor = AuthExecutor()
+
+    return _default_executor
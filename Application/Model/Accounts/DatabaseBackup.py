@@ -0,0 +1,218 @@
+"""
+Online backup of casino.db. Copies the database with SQLite's backup API a few pages at a time, sleeping between
+batches so the casino keeps playing, then checks the copy and rotates old generations.
+
+Run with: python -m Application.Model.Accounts.DatabaseBackup [--source PATH] [--dest DIR] [--keep N]
+                                                             [--pages N] [--sleep-ms MS]
+"""
+import argparse
+import datetime
+import glob
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from urllib.request import pathname2url
+
+from Application.Model.Accounts.db import DB_PATH
+
+BACKUP_DIR: str = "backups"
+BACKUP_GENERATIONS: int = 7
+PAGES_PER_STEP: int = 256  # 1 MiB per batch with 4 KiB pages
+STEP_SLEEP_MS: int = 10
+MAX_RESTARTS: int = 3
+BUSY_TIMEOUT_S: float = 5.0
+
+
+class BackupRestarted(Exception):
+    """
+    Raised from the progress callback to stop a paced backup that keeps being restarted by writes to the source.
+    """
+
+
+class BackupResult:
+    """
+    Outcome of one backup run.
+
+    Attributes:
+        path (str): The verified backup file.
+        pages (int): Pages in the copied database.
+        elapsed_s (float): Wall time of the copy, including the sleeps between batches.
+        restarts (int): Times a write to the source made SQLite start the copy over.
+        removed (list[str]): Older generations deleted by rotation.
+    """
+
+    def __init__(self, path: str, pages: int, elapsed_s: float, restarts: int, removed: list[str]):
+        self.path: str = path
+        self.pages: int = pages
+        self.elapsed_s: float = elapsed_s
+        self.restarts: int = restarts
+        self.removed: list[str] = removed
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed_s if self.elapsed_s > 0 else float(self.pages)
+
+    def __repr__(self):
+        return (f"Backed up {self.pages} pages to {self.path} in {self.elapsed_s:.2f}s "
+                f"({self.pages_per_second:,.0f} pages/s, {self.restarts} restarts)")
+
+
+def get_backup_path(directory: str, now: datetime.datetime | None = None) -> str:
+    """
+    :param directory: Folder holding the backups.
+    :param now: The time the backup starts. Defaults to the current time.
+    :return: A path whose name sorts in creation order, e.g. backups/casino-20260101-120000-000000.db.
+    """
+    now = now or datetime.datetime.now()
+    return os.path.join(directory, f"casino-{now.strftime('%Y%m%d-%H%M%S-%f')}.db")
+
+
+def connect_read_only(path: str, timeout: float = BUSY_TIMEOUT_S) -> sqlite3.Connection:
+    """
+    Opens an existing database without write access. Unlike a plain connect, a missing file is an error rather than a
+    new, empty database.
+
+    :param path: The database to open.
+    :param timeout: Seconds to wait for a lock held by another connection.
+    :return: The connection.
+    :raises sqlite3.OperationalError: If the file does not exist or cannot be opened.
+    """
+    return sqlite3.connect(f"file:{pathname2url(os.path.abspath(path))}?mode=ro", timeout=timeout, uri=True)
+
+
+def check_integrity(path: str) -> str:
+    """
+    Runs PRAGMA integrity_check on a database file.
+
+    :param path: The database to check.
+    :return: "ok", or the problems SQLite found separated by newlines.
+    """
+    connection: sqlite3.Connection = sqlite3.connect(path)
+
+    try:
+        return "\n".join(row[0] for row in connection.execute("PRAGMA integrity_check"))
+    finally:
+        connection.close()
+
+
+def rotate_backups(directory: str, keep: int = BACKUP_GENERATIONS) -> list[str]:
+    """
+    Deletes all but the newest backups in a folder.
+
+    :param directory: Folder holding the backups.
+    :param keep: The number of generations to keep.
+    :return: The deleted paths.
+    """
+    backups: list[str] = sorted(glob.glob(os.path.join(directory, "casino-*.db")))
+    removed: list[str] = backups[:-keep] if keep > 0 else backups
+
+    for path in removed:
+        os.remove(path)
+
+    return removed
+
+
+def copy_database(source: sqlite3.Connection, destination: sqlite3.Connection, pages_per_step: int,
+                  sleep_s: float, max_restarts: int) -> tuple[int, int]:
+    """
+    Copies source into destination in batches of pages_per_step pages, pausing sleep_s between batches. The source is
+    only locked while a batch is being copied.
+
+    SQLite restarts a backup from the first page whenever another connection writes to the source between batches.
+    After max_restarts restarts the rest of the copy is done in one step, which holds a read transaction on the source
+    for its duration. With WAL that does not block writers.
+
+    :return: (pages in the database, restarts)
+    """
+    restarts: int = 0
+    total_pages: int = 0
+    last_remaining: int | None = None
+
+    def progress(status: int, remaining: int, total: int) -> None:
+        nonlocal restarts, total_pages, last_remaining
+        total_pages = total
+
+        if last_remaining is not None and remaining >= last_remaining:  # No progress means the copy started over
+            restarts += 1
+            if restarts > max_restarts:
+                raise BackupRestarted()
+
+        last_remaining = remaining
+
+        if remaining:
+            time.sleep(sleep_s)  # sqlite3's own sleep argument only applies after SQLITE_BUSY, so pace here
+
+    try:
+        source.backup(destination, pages=pages_per_step, progress=progress)
+    except BackupRestarted:
+        source.backup(destination, pages=-1, progress=progress)
+
+    return total_pages, restarts
+
+
+def backup_database(source_path: str = DB_PATH, directory: str = BACKUP_DIR, keep: int = BACKUP_GENERATIONS,
+                    pages_per_step: int = PAGES_PER_STEP, sleep_ms: int = STEP_SLEEP_MS,
+                    max_restarts: int = MAX_RESTARTS) -> BackupResult:
+    """
+    Makes a verified copy of a live database and rotates old copies.
+
+    The copy is written to a .partial file and only renamed into place once PRAGMA integrity_check passes, so a
+    failed or interrupted run never replaces a good generation. The .partial file is removed whenever the run fails.
+
+    :param source_path: The database to back up.
+    :param directory: Folder holding the backups. Created if missing.
+    :param keep: The number of generations to keep, including the new one.
+    :param pages_per_step: Pages copied per batch. Smaller batches hold the source's read lock for less time.
+    :param sleep_ms: Pause between batches, in milliseconds.
+    :param max_restarts: Restarts caused by concurrent writes before the rest is copied in one step.
+    :return: The result of the run.
+    :raises sqlite3.OperationalError: If the source database does not exist.
+    :raises sqlite3.DatabaseError: If the copy fails the integrity check.
+    """
+    logger: logging.Logger = logging.getLogger("database")
+    os.makedirs(directory, exist_ok=True)
+
+    path: str = get_backup_path(directory)
+    partial_path: str = f"{path}.partial"
+
+    try:
+        with closing(connect_read_only(source_path)) as source, closing(sqlite3.connect(partial_path)) as destination:
+            start: float = time.perf_counter()
+            pages, restarts = copy_database(source, destination, pages_per_step, sleep_ms / 1000, max_restarts)
+
+        elapsed_s: float = time.perf_counter() - start
+        integrity: str = check_integrity(partial_path)
+
+        if integrity != "ok":
+            logger.error("Backup of %s failed the integrity check: %s", source_path, integrity)
+            raise sqlite3.DatabaseError(f"Backup failed the integrity check: {integrity}")
+
+        os.replace(partial_path, path)
+    finally:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+    result: BackupResult = BackupResult(path, pages, elapsed_s, restarts, rotate_backups(directory, keep))
+    logger.info(repr(result))
+    return result
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Back up casino.db while it is in use.")
+    parser.add_argument("--source", default=DB_PATH)
+    parser.add_argument("--dest", default=BACKUP_DIR)
+    parser.add_argument("--keep", type=int, default=BACKUP_GENERATIONS)
+    parser.add_argument("--pages", type=int, default=PAGES_PER_STEP, help="Pages copied per batch")
+    parser.add_argument("--sleep-ms", type=int, default=STEP_SLEEP_MS, help="Pause between batches")
+    args: argparse.Namespace = parser.parse_args()
+
+    result: BackupResult = backup_database(args.source, args.dest, args.keep, args.pages, args.sleep_ms)
+    print(result)
+    for path in result.removed:
+        print(f"Removed old backup {path}")
+
+
+if __name__ == "__main__":
+    main()
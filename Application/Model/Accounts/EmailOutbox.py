@@ -0,0 +1,325 @@
+import datetime
+import logging
+import os
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+
+from sqlalchemy import Column, DateTime, Integer, String, Text, or_
+from sqlalchemy.orm import Session, sessionmaker
+
+from Application.Model.Accounts.db import Base, DB_URL, get_session_factory
+
+DEFAULT_SMTP_HOST: str = "smtp.gmail.com"
+DEFAULT_SMTP_PORT: int = 587
+SMTP_TIMEOUT_S: int = 10
+SMTP_IDLE_TIMEOUT_S: int = 60  # Servers drop idle connections, so close ours first and reconnect on demand
+POLL_INTERVAL_S: float = 30.0
+BATCH_SIZE: int = 50
+BASE_RETRY_DELAY_S: int = 5
+MAX_RETRY_DELAY_S: int = 15 * 60
+MAX_ATTEMPTS: int = 8
+
+email_config: 'EmailConfig | None' = None
+
+
+class EmailConfig:
+    """
+    SMTP settings for the outbox sender.
+
+    Attributes:
+        host (str): SMTP server host name.
+        port (int): SMTP server port.
+        username (str | None): Login name, also used as the sender address. No login is attempted if None.
+        password (str | None): Login password or app key.
+        use_tls (bool): Whether to upgrade the connection with STARTTLS.
+    """
+
+    def __init__(self, host: str = DEFAULT_SMTP_HOST, port: int = DEFAULT_SMTP_PORT, username: str | None = None,
+                 password: str | None = None, use_tls: bool = True):
+        self.host: str = host
+        self.port: int = port
+        self.username: str | None = username
+        self.password: str | None = password
+        self.use_tls: bool = use_tls
+
+
+def load_email_config() -> EmailConfig:
+    """
+    Reads the SMTP settings from .env once and keeps them for the rest of the process. Call at startup.
+
+    :return: The loaded EmailConfig.
+    """
+    global email_config
+    from dotenv import load_dotenv, find_dotenv
+
+    load_dotenv(find_dotenv())
+    email_config = EmailConfig(host=os.getenv("SMTP_HOST", DEFAULT_SMTP_HOST),
+                               port=int(os.getenv("SMTP_PORT", DEFAULT_SMTP_PORT)),
+                               username=os.getenv("G_USERNAME"),
+                               password=os.getenv("G_KEY"))
+    return email_config
+
+
+def get_email_config() -> EmailConfig:
+    """
+    Returns the SMTP settings loaded at startup, loading them now if that has not happened yet.
+
+    :return: The EmailConfig.
+    """
+    return email_config if email_config is not None else load_email_config()
+
+
+def utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+
+def get_retry_delay(attempts: int) -> datetime.timedelta:
+    """
+    Exponential backoff between delivery attempts.
+
+    :param attempts: The number of failed attempts so far.
+    :return: How long to wait before the next attempt.
+    """
+    return datetime.timedelta(seconds=min(BASE_RETRY_DELAY_S * 2 ** (attempts - 1), MAX_RETRY_DELAY_S))
+
+
+class OutboxMessage(Base):
+    """
+    An email waiting to be sent, or kept as a record once it has been.
+    Rows are written in the same transaction as the change that caused them (e.g. SqlAccountStore.issue_reset_token),
+    so a message is never lost to a crash.
+    """
+    __tablename__ = 'email_outbox'
+
+    id = Column(Integer, primary_key=True)
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    body = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+    next_attempt_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(String, nullable=True)
+
+
+def enqueue_email(session: Session, recipient: str, subject: str, body: str) -> OutboxMessage:
+    """
+    Adds an email to the outbox. The caller commits it together with the rest of its transaction.
+
+    :param session: Session bound to the casino database.
+    :param recipient: Address to send to.
+    :param subject: Subject line.
+    :param body: Plain-text body.
+    :return: The pending OutboxMessage.
+    """
+    message: OutboxMessage = OutboxMessage(recipient=recipient, subject=subject, body=body, attempts=0)
+    session.add(message)
+    return message
+
+
+class EmailSender:
+    """
+    Background thread that delivers outbox messages over a single reused SMTP connection.
+
+    The thread has its own session, wakes when wake() is called or every POLL_INTERVAL_S, and sends every due message
+    in id order. Failed messages are retried with exponential backoff until MAX_ATTEMPTS is reached. Any error, not just
+    an SMTP or network one, is logged and the thread keeps going.
+    """
+
+    def __init__(self, config: EmailConfig | None = None, session_factory: sessionmaker | None = None,
+                 poll_interval_s: float = POLL_INTERVAL_S):
+        self.config: EmailConfig = config or get_email_config()
+        self.session_factory: sessionmaker = session_factory or get_session_factory(DB_URL)
+        self.poll_interval_s: float = poll_interval_s
+        self.logger: logging.Logger = logging.getLogger("account.auth")
+
+        self.smtp: smtplib.SMTP | None = None
+        self.last_used: float = 0.0
+        self.wake_event: threading.Event = threading.Event()
+        self.stopping: threading.Event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self) -> 'EmailSender':
+        """
+        Starts the sender thread.
+
+        :return: self, so the sender can be created and started in one expression.
+        """
+        self.thread = threading.Thread(target=self.run, name="email-outbox", daemon=True)
+        self.thread.start()
+        return self
+
+    def wake(self) -> None:
+        """
+        Asks the sender to check the outbox now instead of at the next poll.
+
+        :return: None
+        """
+        self.wake_event.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops the sender thread and closes the SMTP connection. Unsent messages stay in the outbox for next time.
+
+        :param timeout: Seconds to wait for the thread to finish, or None to wait indefinitely.
+        :return: None
+        """
+        self.stopping.set()
+        self.wake_event.set()
+
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+
+    def run(self) -> None:
+        session: Session = self.session_factory()
+
+        try:
+            while not self.stopping.is_set():
+                self.wake_event.clear()
+
+                try:
+                    delay: float = self.send_due(session)
+                except Exception:
+                    session.rollback()
+                    self.logger.exception("Could not process the email outbox, trying again at the next poll")
+                    delay = self.poll_interval_s
+
+                self.wake_event.wait(delay)
+        finally:
+            self.disconnect()
+            session.close()
+
+    def send_due(self, session: Session) -> float:
+        """
+        Sends every message that is due.
+
+        :param session: The sender thread's session.
+        :return: Seconds until the outbox should be checked again.
+        """
+        now: datetime.datetime = utc_now()
+        messages: list[OutboxMessage] = (session.query(OutboxMessage)
+                                         .filter(OutboxMessage.sent_at.is_(None),
+                                                 OutboxMessage.attempts < MAX_ATTEMPTS,
+                                                 or_(OutboxMessage.next_attempt_at.is_(None),
+                                                     OutboxMessage.next_attempt_at <= now))
+                                         .order_by(OutboxMessage.id)
+                                         .limit(BATCH_SIZE)
+                                         .all())
+
+        for message in messages:
+            if self.stopping.is_set():
+                return 0.0
+            self.send(session, message)
+
+        if len(messages) == BATCH_SIZE:
+            return 0.0
+
+        if self.smtp is not None and time.monotonic() - self.last_used >= SMTP_IDLE_TIMEOUT_S:
+            self.disconnect()
+
+        next_retry: datetime.datetime | None = (session.query(OutboxMessage.next_attempt_at)
+                                                .filter(OutboxMessage.sent_at.is_(None),
+                                                        OutboxMessage.attempts < MAX_ATTEMPTS,
+                                                        OutboxMessage.next_attempt_at.is_not(None))
+                                                .order_by(OutboxMessage.next_attempt_at)
+                                                .limit(1)
+                                                .scalar())
+        session.commit()  # End the read transaction so the next poll sees new messages
+
+        if next_retry is None:
+            return self.poll_interval_s
+
+        return max(0.0, min(self.poll_interval_s, (next_retry - utc_now()).total_seconds()))
+
+    def send(self, session: Session, message: OutboxMessage) -> None:
+        """
+        Attempts one delivery and records the outcome.
+
+        :param session: The sender thread's session.
+        :param message: The message to deliver.
+        :return: None
+        """
+        message.attempts += 1
+
+        try:
+            self.deliver(message)
+        except Exception as e:  # E.g. a malformed address raises ValueError, which must not stop the other messages
+            self.disconnect()
+            message.last_error = str(e)
+            message.next_attempt_at = utc_now() + get_retry_delay(message.attempts)
+
+            if message.attempts >= MAX_ATTEMPTS:
+                self.logger.error("Giving up on email %d to %s after %d attempts: %s",
+                                  message.id, message.recipient, message.attempts, e)
+            else:
+                self.logger.warning("Email %d to %s failed (attempt %d): %s",
+                                    message.id, message.recipient, message.attempts, e)
+        else:
+            message.sent_at = utc_now()
+            message.last_error = None
+            self.logger.info("Email sent to %s", message.recipient)
+
+        session.commit()
+
+    def deliver(self, message: OutboxMessage) -> None:
+        """
+        Sends a message over the shared connection, reconnecting once if the server has closed it.
+
+        :param message: The message to deliver.
+        :return: None
+        """
+        email: EmailMessage = EmailMessage()
+        email["From"] = self.config.username or ""
+        email["To"] = message.recipient
+        email["Subject"] = message.subject
+        email.set_content(message.body)
+
+        try:
+            self.connect().send_message(email)
+        except smtplib.SMTPServerDisconnected:
+            self.disconnect()
+            self.connect().send_message(email)
+
+        self.last_used = time.monotonic()
+
+    def connect(self) -> smtplib.SMTP:
+        """
+        Returns the open SMTP connection, opening and authenticating a new one if needed.
+
+        :return: The connection.
+        """
+        if self.smtp is None:
+            smtp: smtplib.SMTP = smtplib.SMTP(self.config.host, self.config.port, timeout=SMTP_TIMEOUT_S)
+
+            try:
+                if self.config.use_tls:
+                    smtp.starttls()
+                if self.config.username:
+                    smtp.login(self.config.username, self.config.password)
+            except Exception:
+                smtp.close()
+                raise
+
+            self.smtp = smtp
+            self.logger.info("Opened SMTP connection to %s:%d", self.config.host, self.config.port)
+
+        return self.smtp
+
+    def disconnect(self) -> None:
+        """
+        Closes the SMTP connection if one is open.
+
+        :return: None
+        """
+        if self.smtp is None:
+            return
+
+        try:
+            self.smtp.quit()
+        except Exception:
+            self.smtp.close()
+
+        self.smtp = None
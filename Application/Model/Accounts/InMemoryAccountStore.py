@@ -0,0 +1,198 @@
+import datetime
+import logging
+import secrets
+import threading
+import uuid
+from array import array
+from typing import Callable
+
+from Application.Model.Accounts.AccountStore import AccountStore
+from Application.Model.Accounts.Ledger import SNAPSHOT_TAIL_LENGTH
+from Application.Model.Accounts.LoginRateLimiter import LoginRateLimiter
+from Application.Model.Accounts.SessionTokens import (SESSION_ID_BYTES, SESSION_TOKEN_TTL, encode_token, parse_token,
+                                                      utc_now)
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Utils.Money import Money
+
+
+def as_naive_utc(moment: datetime.datetime) -> datetime.datetime:
+    return moment.astimezone(datetime.UTC).replace(tzinfo=None) if moment.tzinfo is not None else moment
+
+
+class InMemoryAccountStore(AccountStore):
+    """
+    Keeps accounts in dicts for simulations, load tests and benchmarks. Nothing survives the process.
+
+    Accounts are held as UserAccount objects that are never attached to a session, and every lookup returns the stored
+    object itself. Each account's ledger is an array of signed cents plus a snapshot total, so a wager costs one
+    append. Session tokens are signed exactly like the SQL store's, so tokens from either store look the same.
+
+    A single lock makes settle_debit's check-and-subtract atomic across threads. Wagers applied to the same account
+    from several threads at once need the same care as with a shared UserAccount anywhere else.
+
+    Attributes:
+        accounts (dict): Accounts by username.
+        outbox (list): Queued emails as (recipient, subject, body) tuples, oldest first. Nothing delivers them.
+    """
+
+    def __init__(self):
+        self.lock: threading.Lock = threading.Lock()
+        self.logger: logging.Logger = logging.getLogger("database")
+        self.version_conflicts: int = 0
+
+        self.accounts: dict[str, UserAccount] = {}
+        self.usernames_by_email: dict[str, str] = {}
+        self.usernames_by_reset_token: dict[uuid.UUID, str] = {}
+        self.ledgers: dict[str, array] = {}
+        self.snapshots: dict[str, int] = {}  # Cents folded out of each ledger by compact_ledger
+        self.sessions: dict[str, tuple[str, datetime.datetime]] = {}  # Session id to (username, expires_at)
+        self.lockouts: dict[str, datetime.datetime] = {}
+        self.outbox: list[tuple[str, str, str]] = []
+
+    def find_by_username(self, username: str) -> UserAccount | None:
+        return self.accounts.get(username)
+
+    def find_by_email(self, email_normalized: str) -> UserAccount | None:
+        username: str | None = self.usernames_by_email.get(email_normalized)
+        return self.accounts.get(username) if username is not None else None
+
+    def find_by_reset_token(self, token: uuid.UUID, now: datetime.datetime) -> UserAccount | None:
+        """
+        The index only narrows the search. The account's own token and expiry are checked on every lookup, since
+        callers may have changed them directly on the stored object.
+        """
+        account: UserAccount | None = self.accounts.get(self.usernames_by_reset_token.get(token))
+
+        if account is None or account.reset_token != token or account.reset_token_expiration is None:
+            return None
+
+        return account if as_naive_utc(account.reset_token_expiration) > now else None
+
+    def account_exists(self, username: str, email_normalized: str) -> bool:
+        return username in self.accounts or email_normalized in self.usernames_by_email
+
+    def add_account(self, account: UserAccount) -> None:
+        account.version = account.version or 1
+
+        with self.lock:
+            self.accounts[account.username] = account
+            self.usernames_by_email[account.email_normalized] = account.username
+            self.ledgers[account.username] = array('q', [account.balance.cents])
+            self.snapshots[account.username] = 0
+
+    def record_wager(self, account: UserAccount, delta: Money) -> None:
+        stored: UserAccount = self.accounts[account.username]
+
+        if stored is not account:  # Mirrors an ORM commit, which writes the caller's balance
+            stored.balance = account.balance
+
+        stored.version += 1
+        self.ledgers[account.username].append(delta.cents)
+
+    def settle_debit(self, account: UserAccount, wager: Money) -> Money | None:
+        with self.lock:
+            stored: UserAccount = self.accounts[account.username]
+
+            if stored.balance < wager:
+                return None
+
+            stored.balance -= wager
+            stored.version += 1
+            self.ledgers[account.username].append(-wager.cents)
+
+        account.balance, account.version = stored.balance, stored.version
+        return stored.balance
+
+    def update_account(self, account: UserAccount, change: Callable[[UserAccount], None]) -> None:
+        """
+        Nothing else can write the stored object between reading and changing it, so there are never conflicts to
+        retry. A change made to a copy of the account is applied to the stored object as well.
+        """
+        stored: UserAccount = self.accounts.get(account.username, account)
+
+        with self.lock:
+            change(account)
+            if stored is not account:
+                change(stored)
+
+            stored.version = (stored.version or 1) + 1
+            self.index_reset_token(stored)
+
+    def index_reset_token(self, account: UserAccount) -> None:
+        for token in [token for token, username in self.usernames_by_reset_token.items()
+                      if username == account.username]:
+            del self.usernames_by_reset_token[token]
+
+        if account.reset_token is not None:
+            self.usernames_by_reset_token[account.reset_token] = account.username
+
+    def change_password(self, account: UserAccount, hashed_password: str) -> None:
+        self.update_account(account, lambda user: setattr(user, "password", hashed_password))
+
+        with self.lock:
+            for session_id in [session_id for session_id, (username, _) in self.sessions.items()
+                               if username == account.username]:
+                del self.sessions[session_id]
+
+    def issue_session_token(self, username: str) -> str:
+        session_id: str = secrets.token_urlsafe(SESSION_ID_BYTES)
+        expires_at: datetime.datetime = utc_now() + SESSION_TOKEN_TTL
+
+        with self.lock:
+            self.sessions[session_id] = (username, expires_at)
+
+        return encode_token(session_id, expires_at)
+
+    def get_session_username(self, token: str) -> str | None:
+        session_id: str | None = parse_token(token)
+        stored: tuple[str, datetime.datetime] | None = self.sessions.get(session_id)
+
+        if stored is None or stored[1] <= utc_now():
+            return None
+
+        return stored[0]
+
+    def revoke_session_token(self, token: str) -> None:
+        with self.lock:
+            self.sessions.pop(token.strip().split(".")[0], None)
+
+    def issue_reset_token(self, account: UserAccount, token: uuid.UUID, expiration: datetime.datetime, subject: str,
+                          body: str) -> None:
+        def store_token(user: UserAccount) -> None:
+            user.reset_token = token
+            user.reset_token_expiration = expiration
+
+        self.update_account(account, store_token)
+        self.outbox.append((account.email, subject, body))
+
+    def load_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        now: datetime.datetime = utc_now()
+        rate_limiter.restore({key: locked_until for key, locked_until in self.lockouts.items() if locked_until > now})
+
+    def save_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        self.lockouts.update(rate_limiter.take_pending_lockouts())
+
+    def get_ledger_balance(self, username: str) -> Money:
+        return Money(self.snapshots[username] + sum(self.ledgers[username]))
+
+    def compact_ledger(self, tail_length: int = SNAPSHOT_TAIL_LENGTH) -> int:
+        """
+        Folds every ledger with at least tail_length entries into its snapshot. Entries carry no timestamps, so there
+        is no retention period.
+
+        :param tail_length: Ledgers shorter than this are left alone.
+        :return: The number of ledger entries folded.
+        """
+        folded: int = 0
+
+        with self.lock:
+            for username, ledger in self.ledgers.items():
+                if len(ledger) >= tail_length:
+                    self.snapshots[username] += sum(ledger)
+                    folded += len(ledger)
+                    self.ledgers[username] = array('q')
+
+        if folded:
+            self.logger.info("Folded %d in-memory ledger entries into snapshots", folded)
+
+        return folded
@@ -0,0 +1,187 @@
+import datetime
+import logging
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from Application.Model.Accounts.db import Base, MoneyType
+from Application.Utils.Money import Money
+
+OPENING: str = "opening"
+CREDIT: str = "credit"
+DEBIT: str = "debit"
+
+SNAPSHOT_TAIL_LENGTH: int = 100  # Snapshot an account once this many entries have piled up since its last snapshot
+LEDGER_RETENTION: datetime.timedelta = datetime.timedelta(days=90)  # Older entries are folded into snapshots
+
+
+def utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+
+class LedgerEntry(Base):
+    """
+    Append-only record of one balance change. The id doubles as the ledger's sequence number.
+    """
+    __tablename__ = 'ledger'
+
+    id = Column(Integer, primary_key=True)
+    username = Column(String, nullable=False)
+    kind = Column(String, nullable=False)
+    delta = Column(MoneyType, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+
+    # Serves "entries of one account after id N", so replaying an account reads only its tail
+    __table_args__ = (Index("ix_ledger_username_id", "username", "id"),)
+
+
+class BalanceSnapshot(Base):
+    """
+    An account's balance as of a ledger entry. Entries up to last_entry_id are already included in balance.
+    """
+    __tablename__ = 'balance_snapshot'
+
+    username = Column(String, primary_key=True)
+    balance = Column(MoneyType, nullable=False)
+    last_entry_id = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+
+
+def get_kind(delta: Money) -> str:
+    return CREDIT if delta > 0 else DEBIT
+
+
+def record_entry(session: Session, username: str, delta: Money, kind: str | None = None) -> None:
+    """
+    Appends a balance change to the ledger. The caller commits it in the same transaction as the balance itself.
+
+    :param session: Session bound to the casino database.
+    :param username: The account whose balance changed.
+    :param delta: The signed change in balance.
+    :param kind: OPENING, CREDIT or DEBIT. Derived from the sign of delta if omitted.
+    :return: None
+    """
+    session.add(LedgerEntry(username=username, kind=kind or get_kind(delta), delta=delta, created_at=utc_now()))
+
+
+def record_entries(session: Session, entries: list[dict], kind: str | None = None) -> None:
+    """
+    Appends many balance changes with a single executemany.
+
+    :param session: Session bound to the casino database.
+    :param entries: Dicts of the form {"username": str, "delta": Money}.
+    :param kind: Applied to every entry, or derived per entry from the sign of its delta if omitted.
+    :return: None
+    """
+    if not entries:
+        return
+
+    now: datetime.datetime = utc_now()
+    session.execute(insert(LedgerEntry), [{"username": entry["username"], "delta": entry["delta"],
+                                           "kind": kind or get_kind(entry["delta"]), "created_at": now}
+                                          for entry in entries])
+
+
+def sum_entries(session: Session, username: str, after_id: int, up_to_id: int | None = None) -> Money:
+    """
+    Sums an account's ledger entries in the range (after_id, up_to_id].
+
+    :param session: Session bound to the casino database.
+    :param username: The account to sum.
+    :param after_id: Entries with this id or lower are skipped.
+    :param up_to_id: Entries with a higher id are skipped. No upper bound if None.
+    :return: The total change.
+    """
+    query = select(func.sum(LedgerEntry.delta)).where(LedgerEntry.username == username, LedgerEntry.id > after_id)
+
+    if up_to_id is not None:
+        query = query.where(LedgerEntry.id <= up_to_id)
+
+    total: Money | None = session.execute(query).scalar()
+    return total if total is not None else Money(0)
+
+
+def compute_balance(session: Session, username: str) -> Money:
+    """
+    Rebuilds an account's balance from its latest snapshot plus the ledger entries written after it.
+
+    :param session: Session bound to the casino database.
+    :param username: The account to rebuild.
+    :return: The balance according to the ledger.
+    """
+    snapshot: BalanceSnapshot | None = session.get(BalanceSnapshot, username)
+
+    if snapshot is None:
+        return sum_entries(session, username, after_id=0)
+
+    return snapshot.balance + sum_entries(session, username, after_id=snapshot.last_entry_id)
+
+
+def take_snapshot(session: Session, username: str, up_to_id: int) -> BalanceSnapshot:
+    """
+    Moves an account's snapshot forward to include every entry up to up_to_id.
+
+    :param session: Session bound to the casino database.
+    :param username: The account to snapshot.
+    :param up_to_id: The last ledger entry the snapshot should include.
+    :return: The updated snapshot.
+    """
+    snapshot: BalanceSnapshot | None = session.get(BalanceSnapshot, username)
+
+    if snapshot is None:
+        snapshot = BalanceSnapshot(username=username, balance=Money(0), last_entry_id=0)
+        session.add(snapshot)
+
+    if up_to_id > snapshot.last_entry_id:
+        snapshot.balance = snapshot.balance + sum_entries(session, username, snapshot.last_entry_id, up_to_id)
+        snapshot.last_entry_id = up_to_id
+        snapshot.created_at = utc_now()
+
+    return snapshot
+
+
+def compact_ledger(session: Session, tail_length: int = SNAPSHOT_TAIL_LENGTH,
+                   retention: datetime.timedelta = LEDGER_RETENTION) -> int:
+    """
+    Snapshots accounts with long ledger tails and folds entries older than the retention period into snapshots.
+
+    :param session: Session bound to the casino database.
+    :param tail_length: Accounts with at least this many entries after their snapshot get a new snapshot.
+    :param retention: Entries older than this are folded into the snapshot and deleted.
+    :return: The number of ledger entries deleted.
+    """
+    snapshot_ids = (select(BalanceSnapshot.last_entry_id)
+                    .where(BalanceSnapshot.username == LedgerEntry.username)
+                    .scalar_subquery())
+    tails = session.execute(select(LedgerEntry.username, func.max(LedgerEntry.id), func.count())
+                            .where(LedgerEntry.id > func.coalesce(snapshot_ids, 0))
+                            .group_by(LedgerEntry.username)).all()
+
+    refreshed: int = 0
+
+    for username, last_id, count in tails:
+        if count >= tail_length:
+            take_snapshot(session, username, last_id)
+            refreshed += 1
+
+    cutoff: datetime.datetime = utc_now() - retention
+    expired = session.execute(select(LedgerEntry.username, func.max(LedgerEntry.id))
+                              .where(LedgerEntry.created_at < cutoff, LedgerEntry.id > func.coalesce(snapshot_ids, 0))
+                              .group_by(LedgerEntry.username)).all()
+
+    for username, last_id in expired:
+        take_snapshot(session, username, last_id)
+        refreshed += 1
+
+    session.flush()
+    deleted: int = session.execute(delete(LedgerEntry)
+                                   .where(LedgerEntry.created_at < cutoff,
+                                          LedgerEntry.id <= (select(BalanceSnapshot.last_entry_id)
+                                                             .where(BalanceSnapshot.username == LedgerEntry.username)
+                                                             .scalar_subquery()))
+                                   .execution_options(synchronize_session=False)).rowcount
+    session.commit()
+
+    logging.getLogger("database").info("Compacted ledger: %d snapshots refreshed, %d entries folded",
+                                       refreshed, deleted)
+    return deleted
@@ -0,0 +1,287 @@
+import datetime
+import logging
+import threading
+from collections import OrderedDict, deque
+
+from sqlalchemy import Column, DateTime, Integer, String, delete, select
+from sqlalchemy.orm import Session
+
+from Application.Model.Accounts.db import Base
+
+# Logins typed into this process's own GUI or console. Every player on a kiosk shares it, so it has no client bucket
+LOCAL_CLIENT: str = "local"
+
+MAX_FAILURES_PER_USER: int = 5
+MAX_FAILURES_PER_CLIENT: int = 20  # Catches one network peer trying many usernames, as in credential stuffing
+FAILURE_WINDOW: datetime.timedelta = datetime.timedelta(minutes=15)
+LOCKOUT_DURATION: datetime.timedelta = datetime.timedelta(minutes=15)
+MAX_TRACKED_KEYS: int = 10_000
+
+
+def utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+
+class LoginLockout(Base):
+    """
+    A username or client that failed to log in too often. Kept in the database so a restart does not lift it.
+    """
+    __tablename__ = 'login_lockout'
+
+    key = Column(String, primary_key=True)
+    locked_until = Column(DateTime, nullable=False, index=True)
+    failures = Column(Integer, nullable=False)
+
+
+def user_key(username: str) -> str:
+    return f"user:{username}"
+
+
+def client_key(client: str) -> str:
+    return f"client:{client}"
+
+
+class LoginRateLimiter:
+    """
+    Sliding-window limit on failed logins, counted separately per username and per network client. Local attempts
+    only count against the username, so one player mistyping cannot lock everyone else out of a shared kiosk.
+
+    Each key keeps the times of its most recent failures in a deque capped at the key's limit, so a check or a new
+    failure touches at most one deque end and one dict entry per key. A key whose oldest remembered failure is still
+    inside the window when the deque fills up is locked out for LOCKOUT_DURATION.
+
+    An attempt reserves its slot with reserve() before the password is checked and hands it back with finish(). A
+    reserved attempt counts as a failure until it finishes, so concurrent guesses cannot all slip past the limit
+    while their bcrypt verifications are still running.
+
+    All state is guarded by one lock, so attempts may finish on the auth executor's threads. New lockouts are held in
+    memory until persist() is called from the thread that owns the session.
+
+    Attributes:
+        locked_until (dict): Lockout expiry per key, including lockouts loaded from the database.
+        in_flight (dict): Attempts reserved but not yet finished, per key.
+        rejected (int): Attempts refused without checking the password.
+    """
+
+    def __init__(self, max_failures_per_user: int = MAX_FAILURES_PER_USER,
+                 max_failures_per_client: int = MAX_FAILURES_PER_CLIENT, window: datetime.timedelta = FAILURE_WINDOW,
+                 lockout: datetime.timedelta = LOCKOUT_DURATION, max_tracked_keys: int = MAX_TRACKED_KEYS):
+        self.max_failures_per_user: int = max_failures_per_user
+        self.max_failures_per_client: int = max_failures_per_client
+        self.window: datetime.timedelta = window
+        self.lockout: datetime.timedelta = lockout
+        self.max_tracked_keys: int = max_tracked_keys
+        self.logger: logging.Logger = logging.getLogger("account.auth")
+
+        self.lock: threading.Lock = threading.Lock()
+        self.failures: OrderedDict[str, deque[datetime.datetime]] = OrderedDict()
+        self.locked_until: dict[str, datetime.datetime] = {}
+        self.pending_lockouts: dict[str, datetime.datetime] = {}
+        self.in_flight: dict[str, int] = {}
+        self.rejected: int = 0
+
+    def get_limits(self, username: str, client: str) -> list[tuple[str, int]]:
+        """
+        :return: (key, failure limit) of every bucket an attempt counts against.
+        """
+        limits: list[tuple[str, int]] = [(user_key(username), self.max_failures_per_user)]
+
+        if client != LOCAL_CLIENT:
+            limits.append((client_key(client), self.max_failures_per_client))
+
+        return limits
+
+    def load(self, session: Session) -> None:
+        """
+        Restores unexpired lockouts from the database and deletes expired ones.
+
+        :param session: Session bound to the casino database.
+        :return: None
+        """
+        now: datetime.datetime = utc_now()
+        session.execute(delete(LoginLockout).where(LoginLockout.locked_until <= now))
+        session.commit()
+
+        self.restore(dict(session.execute(select(LoginLockout.key, LoginLockout.locked_until)).tuples().all()))
+
+    def restore(self, locked_until: dict[str, datetime.datetime]) -> None:
+        """
+        Adds lockouts saved by an earlier run.
+
+        :param locked_until: Lockout expiry per key.
+        :return: None
+        """
+        with self.lock:
+            self.locked_until.update(locked_until)
+
+    def retry_after(self, username: str, client: str = LOCAL_CLIENT) -> float:
+        """
+        :param username: The username being logged in to.
+        :param client: Identifies where the attempt comes from.
+        :return: Seconds until the username and client may try again, or 0 if they may try now.
+        """
+        now: datetime.datetime = utc_now()
+
+        with self.lock:
+            remaining: list[float] = [(self.locked_until[key] - now).total_seconds()
+                                      for key, _ in self.get_limits(username, client) if key in self.locked_until]
+
+        return max([0.0, *remaining])
+
+    def check(self, username: str, client: str = LOCAL_CLIENT) -> bool:
+        """
+        Decides whether an attempt may go on to the password check.
+
+        :param username: The username being logged in to.
+        :param client: Identifies where the attempt comes from.
+        :return: True if the attempt is allowed, False if the username or client is locked out.
+        """
+        now: datetime.datetime = utc_now()
+
+        with self.lock:
+            return self.is_allowed(self.get_limits(username, client), now, in_flight=False)
+
+    def reserve(self, username: str, client: str = LOCAL_CLIENT) -> bool:
+        """
+        Atomically checks an attempt and, if allowed, counts it as in flight until finish() is called.
+
+        An attempt is refused while the username or client is locked out, or while its recent failures plus the
+        attempts already in flight would reach the limit.
+
+        :param username: The username being logged in to.
+        :param client: Identifies where the attempt comes from.
+        :return: True if the attempt may go on to the password check. The caller must then call finish().
+        """
+        now: datetime.datetime = utc_now()
+        limits: list[tuple[str, int]] = self.get_limits(username, client)
+
+        with self.lock:
+            if not self.is_allowed(limits, now, in_flight=True):
+                return False
+
+            for key, _ in limits:
+                self.in_flight[key] = self.in_flight.get(key, 0) + 1
+
+        return True
+
+    def finish(self, username: str, client: str = LOCAL_CLIENT, succeeded: bool = False) -> None:
+        """
+        Ends an attempt started by reserve() and records its outcome.
+
+        :param username: The username that was logged in to.
+        :param client: Identifies where the attempt came from.
+        :param succeeded: Whether the password matched.
+        :return: None
+        """
+        now: datetime.datetime = utc_now()
+        limits: list[tuple[str, int]] = self.get_limits(username, client)
+
+        with self.lock:
+            for key, _ in limits:
+                if self.in_flight.get(key, 0) <= 1:
+                    self.in_flight.pop(key, None)
+                else:
+                    self.in_flight[key] -= 1
+
+            if succeeded:
+                self.failures.pop(user_key(username), None)
+            else:
+                for key, limit in limits:
+                    self.add_failure(key, limit, now)
+
+    def is_allowed(self, limits: list[tuple[str, int]], now: datetime.datetime, in_flight: bool) -> bool:
+        """
+        Must be called with the lock held.
+
+        :param limits: (key, failure limit) of the attempt's buckets.
+        :param now: The current time.
+        :param in_flight: Whether reserved attempts count towards the limits.
+        :return: True if no bucket is locked out or, with in_flight, about to reach its limit.
+        """
+        for key, limit in limits:
+            locked_until: datetime.datetime | None = self.locked_until.get(key)
+
+            if locked_until is not None and locked_until <= now:
+                del self.locked_until[key]
+            elif locked_until is not None or (in_flight and self.count_failures(key, now) + self.in_flight.get(key, 0)
+                                              >= limit):
+                self.rejected += 1
+                return False
+
+        return True
+
+    def count_failures(self, key: str, now: datetime.datetime) -> int:
+        failures: deque[datetime.datetime] | None = self.failures.get(key)
+        return sum(1 for failed_at in failures if failed_at > now - self.window) if failures else 0
+
+    def record_failure(self, username: str, client: str = LOCAL_CLIENT) -> None:
+        """
+        Counts a failed attempt against the username and, for network peers, the client, locking out whichever reached
+        its limit.
+
+        :param username: The username that failed to log in.
+        :param client: Identifies where the attempt came from.
+        :return: None
+        """
+        now: datetime.datetime = utc_now()
+
+        with self.lock:
+            for key, limit in self.get_limits(username, client):
+                self.add_failure(key, limit, now)
+
+    def add_failure(self, key: str, limit: int, now: datetime.datetime) -> None:
+        failures: deque[datetime.datetime] | None = self.failures.get(key)
+
+        if failures is None:
+            failures = self.failures[key] = deque(maxlen=limit)
+            if len(self.failures) > self.max_tracked_keys:
+                self.failures.popitem(last=False)  # Forget the key that failed least recently
+        else:
+            self.failures.move_to_end(key)
+
+        failures.append(now)
+
+        if len(failures) == limit and failures[0] > now - self.window:
+            self.locked_until[key] = self.pending_lockouts[key] = now + self.lockout
+            failures.clear()
+            self.logger.warning("Locked out %s for %s after %d failed logins", key, self.lockout, limit)
+
+    def record_success(self, username: str) -> None:
+        """
+        Forgets a username's failures after it logs in. Client failures are kept, so an attacker who owns one account
+        cannot reset their count by logging in to it.
+
+        :param username: The username that logged in.
+        :return: None
+        """
+        with self.lock:
+            self.failures.pop(user_key(username), None)
+
+    def take_pending_lockouts(self) -> dict[str, datetime.datetime]:
+        """
+        Hands over the lockouts recorded since the last call, for the caller to save.
+
+        :return: Lockout expiry per key.
+        """
+        with self.lock:
+            pending: dict[str, datetime.datetime] = self.pending_lockouts
+            self.pending_lockouts = {}
+
+        return pending
+
+    def persist(self, session: Session) -> bool:
+        """
+        Adds lockouts recorded since the last call to the session. Must be called on the thread that owns the
+        session. The caller commits.
+
+        :param session: Session bound to the casino database.
+        :return: True if any lockout was added.
+        """
+        pending: dict[str, datetime.datetime] = self.take_pending_lockouts()
+
+        for key, locked_until in pending.items():
+            session.merge(LoginLockout(key=key, locked_until=locked_until,
+                                       failures=self.max_failures_per_user if key.startswith("user:")
+                                       else self.max_failures_per_client))
+
+        return bool(pending)
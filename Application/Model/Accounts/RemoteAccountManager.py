@@ -0,0 +1,195 @@
+import json
+import logging
+import socket
+import threading
+from concurrent.futures import Future
+from typing import BinaryIO
+
+from Application.Model.Accounts.AccountServer import (DEFAULT_HOST, DEFAULT_PORT, RecoveringAccount, account_from_dict,
+                                                      recovery_from_dict)
+from Application.Model.Accounts.AuthExecutor import AuthExecutor, get_auth_executor
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Utils.Money import Money
+
+UNIX_ADDRESS_PREFIX: str = "unix:"
+CONNECT_TIMEOUT_S: float = 10.0
+
+
+class AccountServerError(Exception):
+    """
+    Raised when the account server reports a failure that has no local equivalent.
+    """
+
+
+def open_socket(address: str) -> socket.socket:
+    """
+    Connects to an account server.
+
+    :param address: "host:port" for TCP or "unix:/path/to/socket" for a Unix socket.
+    :return: The connected socket.
+    """
+    if address.startswith(UNIX_ADDRESS_PREFIX):
+        sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(CONNECT_TIMEOUT_S)
+        sock.connect(address[len(UNIX_ADDRESS_PREFIX):])
+    else:
+        host, _, port = address.rpartition(":")
+        sock = socket.create_connection((host or DEFAULT_HOST, int(port or DEFAULT_PORT)), timeout=CONNECT_TIMEOUT_S)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    sock.settimeout(None)
+    return sock
+
+
+class RemoteAccountManager:
+    """
+    Drop-in replacement for AccountManager that forwards every call to an AccountServer.
+
+    Accounts returned by this class are detached copies. Their balance is kept in step with the server by the methods
+    that change it, so AccountController can use them like local accounts. They carry no secrets: security answers
+    and reset tokens are checked by the server, and the connection may only change the account it logged in as.
+    Requests from several threads share one connection and are sent one at a time.
+    """
+
+    def __init__(self, address: str = f"{DEFAULT_HOST}:{DEFAULT_PORT}", auth_executor: AuthExecutor | None = None):
+        self.address: str = address
+        self.auth_executor: AuthExecutor = auth_executor or get_auth_executor()
+        self.logger: logging.Logger = logging.getLogger("account.auth")
+
+        self.lock: threading.Lock = threading.Lock()
+        self.next_id: int = 0
+        self.sock: socket.socket = open_socket(address)
+        self.stream: BinaryIO = self.sock.makefile("rwb")
+
+    def call(self, method: str, **params):
+        """
+        Sends one request and waits for its response.
+
+        :param method: The RPC name.
+        :param params: The RPC arguments.
+        :return: The result sent by the server.
+        :raises ValueError: If the server rejected a value (e.g. a non-positive wager).
+        :raises PermissionError: If the connection is not logged in as the account the request acts on.
+        :raises AccountServerError: For any other server-side failure.
+        """
+        with self.lock:
+            self.next_id += 1
+            self.stream.write(json.dumps({"id": self.next_id, "method": method, "params": params}).encode() + b"\n")
+            self.stream.flush()
+            line: bytes = self.stream.readline()
+
+        if not line:
+            raise ConnectionError(f"Account server at {self.address} closed the connection")
+
+        response: dict = json.loads(line)
+
+        if "error" in response:
+            error: dict = response["error"]
+            if error["type"] == "ValueError":
+                raise ValueError(error["message"])
+            if error["type"] == "PermissionError":
+                raise PermissionError(error["message"])
+            raise AccountServerError(f"{error['type']}: {error['message']}")
+
+        return response["result"]
+
+    def get_account(self, username: str, password: str) -> UserAccount | None:
+        return account_from_dict(self.call("login", username=username, password=password))
+
+    def get_account_async(self, username: str, password: str) -> Future:
+        return self.auth_executor.submit(self.get_account, username, password)
+
+    def get_login_retry_after(self, username: str) -> float:
+        return self.call("login_retry_after", username=username)
+
+    def save_lockouts(self) -> None:
+        """
+        The server rate limits logins and stores its own lockouts.
+        """
+
+    def apply_pending_rehash(self, account: UserAccount) -> None:
+        """
+        Rehashing happens on the server as part of login, so there is nothing left to do here.
+        """
+
+    def create_account(self, username: str, password: str, email: str, questions: list[str]) -> UserAccount | None:
+        return account_from_dict(self.call("create_account", username=username, password=password, email=email,
+                                           questions=questions))
+
+    def create_account_async(self, username: str, password: str, email: str, questions: list[str]) -> Future:
+        return self.auth_executor.submit(self.create_account, username, password, email, questions)
+
+    def save_new_account(self, user: UserAccount) -> UserAccount | None:
+        """
+        Accounts are already saved by the server when create_account_async completes.
+        """
+        return user
+
+    def get_account_by_email(self, email: str) -> RecoveringAccount | None:
+        """
+        Looks up an account to recover. Until a reset token logs the connection in, the server only says who the
+        account is and which security questions to ask.
+        """
+        return recovery_from_dict(self.call("get_account_by_email", email=email))
+
+    def verify_security_answers(self, account: UserAccount | RecoveringAccount, answers: list[str]) -> bool:
+        return self.call("verify_security_answers", username=account.username, answers=answers)
+
+    def email_recovery_token(self, account: UserAccount | RecoveringAccount) -> None:
+        """
+        Asks the server to email a reset token, which it allows once per correct set of security answers. The token
+        itself is never sent back over the connection.
+        """
+        self.call("email_recovery_token", username=account.username)
+
+    def is_reset_token_valid(self, account: UserAccount | RecoveringAccount, token: str) -> bool:
+        """
+        Redeems a reset token on the server, which logs this connection in as the account if it is valid.
+        """
+        return self.call("redeem_reset_token", username=account.username, token=token)
+
+    def invalidate_reset_token(self, account: UserAccount) -> None:
+        self.call("invalidate_reset_token", username=account.username)
+        account.reset_token = None
+        account.reset_token_expiration = None
+
+    def update_password(self, account: UserAccount, new_password: str) -> None:
+        self.call("update_password", username=account.username, new_password=new_password)
+
+    def settle_debit(self, account: UserAccount, wager: Money | float) -> bool:
+        result: dict = self.call("settle_debit", username=account.username, cents=Money.of(wager).cents)
+        account.balance = Money(result["balance"])
+        return result["settled"]
+
+    def add_and_save_account(self, account: UserAccount, wager: Money | float) -> None:
+        result: dict = self.call("add_winnings", username=account.username, cents=Money.of(wager).cents)
+        account.balance = Money(result["balance"])
+
+    def issue_session_token(self, account: UserAccount) -> str:
+        return self.call("issue_session_token", username=account.username)
+
+    def get_account_by_session_token(self, token: str) -> UserAccount | None:
+        return account_from_dict(self.call("resume_session", token=token))
+
+    def revoke_session_token(self, token: str) -> None:
+        self.call("revoke_session_token", token=token)
+
+    def flush_due_wagers(self) -> None:
+        """
+        The server commits journaled wagers itself.
+        """
+
+    def compact_ledger(self) -> int:
+        """
+        The server compacts its own ledger.
+        """
+        return 0
+
+    def close(self) -> None:
+        """
+        Closes the connection to the server.
+
+        :return: None
+        """
+        self.stream.close()
+        self.sock.close()
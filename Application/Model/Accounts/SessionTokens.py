@@ -0,0 +1,182 @@
+import base64
+import datetime
+import hashlib
+import hmac
+import logging
+import os
+import secrets
+
+from sqlalchemy import Column, DateTime, Select, String, bindparam, delete, select
+from sqlalchemy.orm import Session
+
+from Application.Model.Accounts.db import Base
+
+SESSION_SECRET_FILE_PATH: str = "session_secret.key"
+SESSION_TOKEN_TTL: datetime.timedelta = datetime.timedelta(days=7)
+SECRET_BYTES: int = 32
+SESSION_ID_BYTES: int = 16
+
+session_secret: bytes | None = None
+
+
+def utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+
+
+def load_or_create_session_secret(path: str = SESSION_SECRET_FILE_PATH) -> bytes:
+    """
+    Reads the key session tokens are signed with, generating and storing a new one if this machine has none.
+    Replacing the file invalidates every token issued with the old key.
+
+    :param path: Path of the key file.
+    :return: The signing key.
+    """
+    if os.path.exists(path):
+        with open(path, mode='r') as secret_file:
+            return bytes.fromhex(secret_file.read().strip())
+
+    secret: bytes = secrets.token_bytes(SECRET_BYTES)
+    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), mode='w') as secret_file:
+        secret_file.write(secret.hex())
+
+    logging.getLogger("account.auth").info("Generated a new session signing key")
+    return secret
+
+
+def get_session_secret() -> bytes:
+    """
+    Returns the session signing key. The key file is read once per process.
+
+    :return: The signing key.
+    """
+    global session_secret
+
+    if session_secret is None:
+        session_secret = load_or_create_session_secret()
+
+    return session_secret
+
+
+class LoginSession(Base):
+    """
+    A session token issued after a successful login. Deleting the row revokes the token even if it has not expired.
+    """
+    __tablename__ = 'login_session'
+
+    id = Column(String, primary_key=True)
+    username = Column(String, nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
+    expires_at = Column(DateTime, nullable=False)
+
+
+# Built once so every verification reuses the same compiled statement
+SESSION_USERNAME: Select = select(LoginSession.username).where(LoginSession.id == bindparam("session_id"),
+                                                               LoginSession.expires_at > bindparam("now"))
+
+
+def sign(secret: bytes, payload: str) -> str:
+    digest: bytes = hmac.new(secret, payload.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def encode_token(session_id: str, expires_at: datetime.datetime, secret: bytes | None = None) -> str:
+    """
+    Builds the signed token for a session.
+
+    :param session_id: The session's id.
+    :param expires_at: When the session expires, as naive UTC.
+    :param secret: The signing key. Defaults to this machine's key.
+    :return: A token of the form "<session id>.<expiry as unix seconds>.<HMAC-SHA256 signature>".
+    """
+    payload: str = f"{session_id}.{int(expires_at.replace(tzinfo=datetime.UTC).timestamp())}"
+    return f"{payload}.{sign(secret or get_session_secret(), payload)}"
+
+
+def issue_token(session: Session, username: str, ttl: datetime.timedelta = SESSION_TOKEN_TTL,
+                secret: bytes | None = None) -> str:
+    """
+    Creates a session for an account and returns its signed token. The caller commits the new row.
+
+    The token has the form "<session id>.<expiry as unix seconds>.<HMAC-SHA256 signature>". The account's expired
+    sessions are removed at the same time so the table does not grow with every login.
+
+    :param session: Session bound to the casino database.
+    :param username: The account the token logs in as.
+    :param ttl: How long the token stays valid.
+    :param secret: The signing key. Defaults to this machine's key.
+    :return: The token to hand to the client.
+    """
+    session_id: str = secrets.token_urlsafe(SESSION_ID_BYTES)
+    now: datetime.datetime = utc_now()
+    expires_at: datetime.datetime = now + ttl
+
+    session.execute(delete(LoginSession).where(LoginSession.username == username, LoginSession.expires_at <= now))
+    session.add(LoginSession(id=session_id, username=username, created_at=now, expires_at=expires_at))
+
+    return encode_token(session_id, expires_at, secret)
+
+
+def parse_token(token: str, secret: bytes | None = None) -> str | None:
+    """
+    Checks a token's signature and expiry without touching the database.
+
+    :param token: The token presented by the client.
+    :param secret: The signing key. Defaults to this machine's key.
+    :return: The session id if the token is authentic and unexpired, otherwise None.
+    """
+    try:
+        session_id, expires, signature = token.strip().split(".")
+        expires_at: int = int(expires)
+    except (AttributeError, ValueError):
+        return None
+
+    if not hmac.compare_digest(signature, sign(secret or get_session_secret(), f"{session_id}.{expires}")):
+        return None
+
+    if expires_at <= utc_now().replace(tzinfo=datetime.UTC).timestamp():
+        return None
+
+    return session_id
+
+
+def verify_token(session: Session, token: str, secret: bytes | None = None) -> str | None:
+    """
+    Resolves a token to the account it was issued for.
+
+    Forged and expired tokens are rejected before any query runs. A genuine token then costs one primary key lookup,
+    which also catches revoked sessions.
+
+    :param session: Session bound to the casino database.
+    :param token: The token presented by the client.
+    :param secret: The signing key. Defaults to this machine's key.
+    :return: The username the token belongs to, or None if it is invalid, expired or revoked.
+    """
+    session_id: str | None = parse_token(token, secret)
+
+    if session_id is None:
+        return None
+
+    return session.execute(SESSION_USERNAME, {"session_id": session_id, "now": utc_now()}).scalar()
+
+
+def revoke_token(session: Session, token: str) -> None:
+    """
+    Ends the session a token belongs to. The caller commits the change.
+
+    :param session: Session bound to the casino database.
+    :param token: The token to revoke.
+    :return: None
+    """
+    session_id: str = token.strip().split(".")[0]
+    session.execute(delete(LoginSession).where(LoginSession.id == session_id))
+
+
+def revoke_sessions(session: Session, username: str) -> None:
+    """
+    Ends every session of an account, e.g. after its password changed. The caller commits the change.
+
+    :param session: Session bound to the casino database.
+    :param username: The account whose sessions are revoked.
+    :return: None
+    """
+    session.execute(delete(LoginSession).where(LoginSession.username == username))
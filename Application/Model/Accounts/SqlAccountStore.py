@@ -0,0 +1,257 @@
+import datetime
+import logging
+import threading
+import uuid
+from typing import Callable
+
+from sqlalchemy import Row, update
+from sqlalchemy.orm import Session, scoped_session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
+
+from Application.Model.Accounts.AccountCache import AccountCache
+from Application.Model.Accounts.AccountQueries import (find_by_email, find_by_reset_token, find_by_username,
+                                                       username_or_email_taken)
+from Application.Model.Accounts.AccountStore import AccountStore
+from Application.Model.Accounts.EmailOutbox import enqueue_email
+from Application.Model.Accounts.Ledger import OPENING, compact_ledger, compute_balance, record_entry
+from Application.Model.Accounts.LoginRateLimiter import LoginRateLimiter
+from Application.Model.Accounts.SessionTokens import issue_token, revoke_sessions, revoke_token, verify_token
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode, WagerJournal
+from Application.Model.Accounts.db import create_session_registry, init_db
+from Application.Utils.Money import Money
+
+MAX_COMMIT_ATTEMPTS: int = 5
+
+
+class SqlAccountStore(AccountStore):
+    """
+    Keeps accounts in casino.db through SQLAlchemy.
+
+    Every thread that uses the store works with its own session from a thread-local registry, along with its own
+    account cache and wager journal, so identity maps are never shared between threads. The thread that creates the
+    store keeps the session it was given and the journal with the requested durability. Other threads get a new
+    session on first use, commit their wagers synchronously, and should call release_thread before they exit.
+    """
+
+    def __init__(self, session: Session | scoped_session | None = None,
+                 durability: DurabilityMode = DurabilityMode.SYNC):
+        session = session or init_db()
+        self.registry: scoped_session = (session if isinstance(session, scoped_session)
+                                         else create_session_registry(session))
+        self.local: threading.local = threading.local()
+        self.journal = WagerJournal(self.session, durability)
+        self.logger: logging.Logger = logging.getLogger("database")
+        self.version_conflicts: int = 0
+
+    @property
+    def session(self) -> Session:
+        """
+        The calling thread's session.
+        """
+        return self.registry()
+
+    @property
+    def cache(self) -> AccountCache:
+        """
+        The calling thread's account cache. It only holds accounts loaded by that thread's session.
+        """
+        cache: AccountCache | None = getattr(self.local, "cache", None)
+
+        if cache is None:
+            cache = self.local.cache = AccountCache()
+
+        return cache
+
+    @property
+    def journal(self) -> WagerJournal:
+        """
+        The calling thread's wager journal. Threads other than the creating one get a synchronous journal.
+        """
+        journal: WagerJournal | None = getattr(self.local, "journal", None)
+
+        if journal is None:
+            journal = self.local.journal = WagerJournal(self.session, DurabilityMode.SYNC)
+
+        return journal
+
+    @journal.setter
+    def journal(self, journal: WagerJournal) -> None:
+        self.local.journal = journal
+
+    def release_thread(self) -> None:
+        """
+        Commits the calling thread's pending wagers, closes its session and drops its cache and journal.
+
+        :return: None
+        """
+        self.journal.close()
+        self.registry.remove()
+        vars(self.local).clear()
+
+    def find_by_username(self, username: str) -> UserAccount | None:
+        """
+        Loads an account by username, serving repeat lookups from the LRU cache.
+        """
+        user: UserAccount | None = self.cache.get_by_username(username)
+
+        if user is None:
+            user = find_by_username(self.session, username)
+            if user is not None:
+                self.cache.put(user)
+
+        return user
+
+    def find_by_email(self, email_normalized: str) -> UserAccount | None:
+        """
+        Loads an account by email, served by the unique index on email_normalized and the LRU cache.
+        """
+        user: UserAccount | None = self.cache.get_by_email(email_normalized)
+
+        if user is None:
+            user = find_by_email(self.session, email_normalized)
+            if user is not None:
+                self.cache.put(user)
+
+        return user
+
+    def find_by_reset_token(self, token: uuid.UUID, now: datetime.datetime) -> UserAccount | None:
+        """
+        The expiry check runs in SQL, so expired tokens never load an account.
+        """
+        return find_by_reset_token(self.session, token, now)
+
+    def account_exists(self, username: str, email_normalized: str) -> bool:
+        return username_or_email_taken(self.session, username, email_normalized)
+
+    def add_account(self, account: UserAccount) -> None:
+        self.session.add(account)
+        record_entry(self.session, account.username, account.balance, OPENING)
+        self.session.commit()
+
+    def record_wager(self, account: UserAccount, delta: Money) -> None:
+        """
+        Hands the change to the calling thread's wager journal, which commits it according to its durability mode.
+        """
+        self.cache.invalidate(account.username)
+        self.journal.record(account, delta)
+
+    def settle_debit(self, account: UserAccount, wager: Money) -> Money | None:
+        """
+        The check and the write happen in one UPDATE ... WHERE balance >= wager statement, so several processes sharing
+        casino.db can never overdraw an account. RETURNING hands back the new balance in the same round trip, which is
+        used to refresh the in-memory account without another SELECT.
+        """
+        self.journal.flush()  # Pending journaled credits must reach the database before the guarded debit
+
+        settled: Row | None = self.session.execute(
+            update(UserAccount)
+            .where(UserAccount.username == account.username, UserAccount.balance >= wager)
+            .values(balance=UserAccount.balance - wager, version=UserAccount.version + 1)
+            .returning(UserAccount.balance, UserAccount.version)
+            .execution_options(synchronize_session=False)
+        ).one_or_none()
+
+        if settled is not None:
+            record_entry(self.session, account.username, -wager)
+
+        self.session.commit()
+        self.cache.invalidate(account.username)
+
+        # A missing row plays the role of rowcount == 0
+        if settled is None:
+            return None
+
+        new_balance, new_version = settled
+        set_committed_value(account, "balance", new_balance)
+        set_committed_value(account, "version", new_version)
+        return new_balance
+
+    def update_account(self, account: UserAccount, change: Callable[[UserAccount], None]) -> None:
+        """
+        Commits the change. If another session committed the account first, the account is refreshed from the database
+        and the change is applied again on top of the newer version.
+
+        :raises StaleDataError: If every one of MAX_COMMIT_ATTEMPTS attempts lost the race.
+        """
+        self.journal.flush()  # Journaled wagers have their own conflict handling, keep them out of this commit
+
+        for attempt in range(1, MAX_COMMIT_ATTEMPTS + 1):
+            change(account)
+            self.cache.invalidate(account.username)
+
+            try:
+                self.session.commit()
+                return
+            except StaleDataError:
+                self.session.rollback()
+                self.version_conflicts += 1
+                self.logger.info("Version conflict updating %s (attempt %d)", account.username, attempt)
+
+                if attempt == MAX_COMMIT_ATTEMPTS:
+                    raise
+
+                self.session.refresh(account)
+
+    def change_password(self, account: UserAccount, hashed_password: str) -> None:
+        def store_password(user: UserAccount) -> None:
+            # The DELETE runs first so its autoflush has nothing to write, leaving version conflicts to surface at
+            # commit where they are retried
+            revoke_sessions(self.session, user.username)
+            user.password = hashed_password
+
+        self.update_account(account, store_password)
+
+    def issue_session_token(self, username: str) -> str:
+        token: str = issue_token(self.session, username)
+        self.session.commit()
+        return token
+
+    def get_session_username(self, token: str) -> str | None:
+        return verify_token(self.session, token)
+
+    def revoke_session_token(self, token: str) -> None:
+        revoke_token(self.session, token)
+        self.session.commit()
+
+    def issue_reset_token(self, account: UserAccount, token: uuid.UUID, expiration: datetime.datetime, subject: str,
+                          body: str) -> None:
+        """
+        Commits the token and the outbox row, where EmailSender picks the message up, in one transaction. A rollback
+        after a version conflict discards the pending row, so the retried change queues it exactly once.
+        """
+        def store_token(user: UserAccount) -> None:
+            user.reset_token = token
+            user.reset_token_expiration = expiration
+            enqueue_email(self.session, user.email, subject, body)
+
+        self.update_account(account, store_token)
+
+    def load_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        rate_limiter.load(self.session)
+
+    def save_lockouts(self, rate_limiter: LoginRateLimiter) -> None:
+        """
+        Must be called on the thread that owns the session.
+        """
+        self.journal.flush()
+        rate_limiter.persist(self.session)
+        self.session.commit()
+
+    def get_ledger_balance(self, username: str) -> Money:
+        self.journal.flush()
+        return compute_balance(self.session, username)
+
+    def compact_ledger(self) -> int:
+        self.journal.flush()
+        return compact_ledger(self.session)
+
+    def flush_wagers(self) -> None:
+        self.journal.flush()
+
+    def flush_due_wagers(self) -> None:
+        self.journal.flush_if_due()
+
+    def close(self) -> None:
+        self.journal.close()
@@ -2,18 +2,31 @@ import logging
 
 from sqlalchemy.orm import reconstructor
 
-from Application.Model.Accounts.db import Base
-from sqlalchemy import Column, String, Float, DateTime, UUID
+from Application.Model.Accounts.db import Base, MoneyType
+from Application.Utils.LoggingController import SAMPLED
+from Application.Utils.Money import Money
+from sqlalchemy import Column, Integer, String, DateTime, UUID
+
+
+def normalize_email(email: str) -> str:
+    """
+    Returns the canonical form of an email used for lookups and uniqueness checks.
+
+    :param email: The email as entered by the user.
+    :return: The trimmed, lower-cased email.
+    """
+    return email.strip().lower()
 
 
 class UserAccount(Base):
 
-    def __init__(self, username: str, password: str, balance: float, email: str, questions: list[str], **kw):
+    def __init__(self, username: str, password: str, balance: Money | float, email: str, questions: list[str], **kw):
         super().__init__(**kw)
         self.username: str = username
         self.password: str = password
-        self.balance: float = balance
+        self.balance: Money = Money.of(balance)
         self.email: str = email
+        self.email_normalized: str = normalize_email(email)
         self.security_question_one = questions[0]
         self.security_answer_one = questions[1]
         self.security_question_two = questions[2]
@@ -27,37 +40,45 @@ class UserAccount(Base):
 
     username = Column(String, primary_key=True, nullable=False)
     password = Column(String, nullable=False)
-    balance = Column(Float, default=0.0, nullable=False)
+    balance = Column(MoneyType, default=Money(0), nullable=False)
     email = Column(String, nullable=False)
+    email_normalized = Column(String, nullable=False, unique=True, index=True)
     security_question_one = Column(String, nullable=False)
     security_question_two = Column(String, nullable=False)
     security_answer_one = Column(String, nullable=False)
     security_answer_two = Column(String, nullable=False)
-    reset_token = Column(UUID(as_uuid=True), nullable=True)
+    reset_token = Column(UUID(as_uuid=True), nullable=True, index=True)
     reset_token_expiration = Column(DateTime, nullable=True)
+    version = Column(Integer, nullable=False, default=1)
+
+    # Every ORM UPDATE checks and bumps version, so a commit based on a stale read raises StaleDataError instead of
+    # silently overwriting another session's change. Raw UPDATEs must bump it themselves.
+    __mapper_args__ = {"version_id_col": version}
 
     @reconstructor
     def init_on_load(self):
         self.logger = logging.getLogger("database")
 
-    def subtract_losses(self, wager: float) -> None:
+    def subtract_losses(self, wager: Money | float) -> None:
+        wager = Money.of(wager)
         if wager <= 0:
-            self.logger.error(f"Non-positive wager attempted by {self.username}: wager={wager}")
+            self.logger.error("Non-positive wager attempted by %s: wager=%s", self.username, wager)
             raise ValueError("Wager must be positive")
         if wager > self.balance:
-            self.logger.error(f"Non-positive wager attempted by {self.username}: wager={wager}")
+            self.logger.error("Non-positive wager attempted by %s: wager=%s", self.username, wager)
             raise ValueError(f"Insufficient funds! Available: {self.balance}, Tried to subtract: {wager}")
 
         self.balance -= wager
-        self.logger.info(f"{self.username} lost {wager}. New balance: {self.balance}")
+        self.logger.info("%s lost %s. New balance: %s", self.username, wager, self.balance, extra=SAMPLED)
 
-    def add_winnings(self, wager: float) -> None:
+    def add_winnings(self, wager: Money | float) -> None:
+        wager = Money.of(wager)
         if wager <= 0:
-            self.logger.error(f"Non-positive wager attempted by {self.username}: wager={wager}")
+            self.logger.error("Non-positive wager attempted by %s: wager=%s", self.username, wager)
             raise ValueError("Wager must be positive")
 
         self.balance += wager
-        self.logger.info(f"{self.username} won {wager}. New balance: {self.balance}")
+        self.logger.info("%s won %s. New balance: %s", self.username, wager, self.balance, extra=SAMPLED)
 
     def __repr__(self):
         return f"Username: {self.username} Balance: {self.balance}"
@@ -0,0 +1,338 @@
+import json
+import logging
+import os
+import time
+from enum import Enum
+from typing import TextIO
+
+from sqlalchemy import Column, Integer, event, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from Application.Model.Accounts.Ledger import record_entries, record_entry
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import Base
+from Application.Utils.LoggingController import SAMPLED
+from Application.Utils.Money import Money
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+JOURNAL_FILE_PATH: str = "wager_journal.log"
+
+
+class DurabilityMode(Enum):
+    """
+    How eagerly balance changes reach casino.db.
+
+    SYNC:  every wager is committed on its own (one fsync per wager).
+    GROUP: wagers are appended to the journal file and flushed to the OS immediately, then committed to the database
+           in batches. Survives an application crash.
+    ASYNC: wagers are buffered in memory and the journal file is only written in batches. Fastest, but a crash can
+           lose the most recent unflushed wagers.
+    """
+    SYNC = "sync"
+    GROUP = "group"
+    ASYNC = "async"
+
+
+class JournalCheckpoint(Base):
+    """
+    Single-row table holding the sequence number of the last journal entry committed to the database.
+    Written in the same transaction as the balances so replay never applies an entry twice.
+    """
+    __tablename__ = 'journal_checkpoint'
+
+    id = Column(Integer, primary_key=True)
+    last_seq = Column(Integer, nullable=False, default=0)
+
+
+def get_checkpoint(session: Session) -> int:
+    """
+    Returns the last committed journal sequence number, creating the checkpoint row if needed.
+
+    :param session: Session bound to the casino database.
+    :return: The last committed sequence number.
+    """
+    checkpoint: JournalCheckpoint | None = session.get(JournalCheckpoint, 1)
+
+    if checkpoint is None:
+        checkpoint = JournalCheckpoint(id=1, last_seq=0)
+        session.add(checkpoint)
+        session.commit()
+
+    return checkpoint.last_seq
+
+
+def acquire_journal_lock(path: str) -> TextIO | None:
+    """
+    Takes an exclusive, non-blocking lock on a journal's sidecar .lock file.
+
+    Only the process holding the lock may write, replay or truncate the journal. The OS drops the lock when the
+    process exits, so a crashed process's journal is recovered by whichever process starts next.
+
+    :param path: Path of the journal file.
+    :return: The open lock file, which holds the lock until it is closed, or None if another process holds it.
+    """
+    lock_file: TextIO = open(f"{path}.lock", mode='a+')
+
+    try:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+
+    return lock_file
+
+
+def read_journal(path: str) -> list[dict]:
+    """
+    Reads every complete entry from a journal file. A torn last line left by a crash is ignored.
+
+    :param path: Path of the journal file.
+    :return: A list of entries of the form {"seq": int, "username": str, "delta": int} with delta in cents.
+    """
+    entries: list[dict] = []
+
+    with open(path, mode='r') as journal_file:
+        for line in journal_file:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+
+    return entries
+
+
+def apply_deltas(session: Session, entries: list[dict]) -> None:
+    """
+    Applies journal entries with UPDATE ... SET balance = balance + delta, bumping each account's version, and appends
+    them to the ledger.
+
+    The result does not depend on what any session last read, so this is also how a write that lost an optimistic
+    locking race is retried.
+
+    :param session: Session bound to the casino database.
+    :param entries: Entries of the form {"username": str, "delta": int} with delta in cents.
+    :return: None
+    """
+    for entry in entries:
+        session.execute(update(UserAccount)
+                        .where(UserAccount.username == entry["username"])
+                        .values(balance=UserAccount.balance + Money(entry["delta"]), version=UserAccount.version + 1)
+                        .execution_options(synchronize_session=False))
+
+    record_entries(session, [{"username": entry["username"], "delta": Money(entry["delta"])} for entry in entries])
+
+
+def replay_journal(session: Session, path: str = JOURNAL_FILE_PATH) -> int:
+    """
+    Applies journal entries that were written but never committed, e.g. because the application crashed.
+
+    Deltas are applied with UPDATE ... SET balance = balance + delta so replay is correct no matter what the
+    in-memory state was when the process died. A journal locked by another running process belongs to that process
+    and is left alone.
+
+    :param session: Session bound to the casino database.
+    :param path: Path of the journal file.
+    :return: The number of entries replayed.
+    """
+    if not os.path.exists(path):
+        return 0
+
+    lock_file: TextIO | None = acquire_journal_lock(path)
+
+    if lock_file is None:
+        logging.getLogger("database").info("Wager journal %s is in use by another process, not replaying", path)
+        return 0
+
+    try:
+        last_seq: int = get_checkpoint(session)
+        entries: list[dict] = [entry for entry in read_journal(path) if entry["seq"] > last_seq]
+
+        apply_deltas(session, entries)
+
+        if entries:
+            session.execute(update(JournalCheckpoint).values(last_seq=entries[-1]["seq"]))
+            session.commit()
+            logging.getLogger("database").warning("Replayed %d unflushed wager journal entries", len(entries))
+
+        open(path, mode='w').close()
+        return len(entries)
+    finally:
+        lock_file.close()
+
+
+class WagerJournal:
+    """
+    Write-behind journal for balance changes.
+
+    In SYNC mode every recorded wager commits the session. In GROUP and ASYNC mode each wager is appended to the
+    journal file and the session is committed once max_events wagers are pending or max_delay_ms has passed since the
+    first pending wager. Any commit of the session, including ones made by other AccountManager methods, writes the
+    checkpoint and clears the journal.
+
+    If a commit fails because another session changed one of the accounts first (StaleDataError), the session is
+    rolled back and the pending deltas are applied again as SQL increments on top of the other session's write.
+
+    A GROUP or ASYNC journal holds the journal file's lock for as long as it is open. If another process already holds
+    it, this journal falls back to SYNC rather than interleave with, or truncate, the other process's entries.
+
+    Attributes:
+        version_conflicts (int): Commits that lost an optimistic locking race and were retried.
+    """
+
+    def __init__(self, session: Session, mode: DurabilityMode = DurabilityMode.SYNC, max_events: int = 50,
+                 max_delay_ms: int = 250, path: str = JOURNAL_FILE_PATH):
+        self.session: Session = session
+        self.mode: DurabilityMode = mode
+        self.max_events: int = max_events
+        self.max_delay_ms: int = max_delay_ms
+        self.path: str = path
+        self.logger: logging.Logger = logging.getLogger("database")
+
+        self.file: TextIO | None = None
+        self.lock_file: TextIO | None = None
+        self.seq: int = 0
+        self.pending: int = 0
+        self.first_pending_at: float = 0.0
+        self.version_conflicts: int = 0
+
+        if self.mode is not DurabilityMode.SYNC:
+            self.lock_file = acquire_journal_lock(self.path)
+
+            if self.lock_file is None:
+                self.logger.warning("Wager journal %s is in use by another process, committing every wager",
+                                    self.path)
+                self.mode = DurabilityMode.SYNC
+
+        if self.mode is not DurabilityMode.SYNC:
+            self.seq = get_checkpoint(session)
+            self.file = open(self.path, mode='a', buffering=1 if self.mode is DurabilityMode.GROUP else -1)
+            event.listen(self.session, "before_commit", self.write_checkpoint)
+            event.listen(self.session, "after_commit", self.clear)
+
+    def record(self, account: UserAccount, delta: Money) -> None:
+        """
+        Records a balance change that has already been applied to the in-memory account, and adds its ledger entry to
+        the same transaction.
+
+        :param account: The account whose balance changed.
+        :param delta: The signed change in balance (positive for winnings, negative for losses).
+        :return: None
+        """
+        record_entry(self.session, account.username, delta)
+
+        if self.mode is DurabilityMode.SYNC:
+            self.commit_or_reapply(lambda: [{"username": account.username, "delta": delta.cents}])
+            self.logger.info("Account saved with username %s", account.username, extra=SAMPLED)
+            return
+
+        self.seq += 1
+        self.file.write(json.dumps({"seq": self.seq, "username": account.username, "delta": delta.cents}) + "\n")
+
+        if self.pending == 0:
+            self.first_pending_at = time.monotonic()
+        self.pending += 1
+
+        self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        """
+        Commits pending wagers if the event or time threshold has been reached.
+        Intended to also be called periodically (e.g. from Tk's after) so a lone wager is not held indefinitely.
+
+        :return: None
+        """
+        if self.pending == 0:
+            return
+
+        elapsed_ms: float = (time.monotonic() - self.first_pending_at) * 1000
+
+        if self.pending >= self.max_events or elapsed_ms >= self.max_delay_ms:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Commits every pending wager in a single transaction.
+
+        :return: None
+        """
+        if self.pending == 0:
+            return
+
+        count: int = self.pending
+        self.commit_or_reapply(self.read_pending)
+        self.logger.info("Flushed %d journaled wagers in one transaction", count)
+
+    def read_pending(self) -> list[dict]:
+        """
+        Returns the journaled entries that have not been committed yet. The file is cleared on every commit, so that
+        is everything in it.
+
+        :return: The pending entries.
+        """
+        self.file.flush()
+        return read_journal(self.path)
+
+    def commit_or_reapply(self, get_entries) -> None:
+        """
+        Commits the session. On a version conflict, rolls back and commits the entries as SQL increments instead.
+
+        :param get_entries: Returns the entries that the failed commit was carrying.
+        :return: None
+        """
+        try:
+            self.session.commit()
+        except StaleDataError:
+            self.session.rollback()
+            self.version_conflicts += 1
+            self.logger.info("Version conflict while committing wagers, reapplying as increments")
+
+            apply_deltas(self.session, get_entries())
+            self.session.commit()
+
+    def write_checkpoint(self, session: Session) -> None:
+        """
+        before_commit hook that stores the journal position alongside the balances being committed.
+
+        :param session: The session being committed.
+        :return: None
+        """
+        if self.pending:
+            session.execute(update(JournalCheckpoint).values(last_seq=self.seq))
+
+    def clear(self, session: Session) -> None:
+        """
+        after_commit hook that discards journal entries now safely in the database.
+
+        :param session: The session that was committed.
+        :return: None
+        """
+        if self.pending:
+            self.file.seek(0)
+            self.file.truncate()
+            self.pending = 0
+
+    def close(self) -> None:
+        """
+        Flushes pending wagers and releases the journal file and its lock.
+
+        :return: None
+        """
+        self.flush()
+
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+        if self.lock_file is not None:
+            self.lock_file.close()
+            self.lock_file = None
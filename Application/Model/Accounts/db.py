@@ -1,20 +1,290 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base, Session
+import re
+from typing import Callable
+
+from sqlalchemy import create_engine, event, Connection, Engine, Integer, TypeDecorator
+from sqlalchemy.orm import scoped_session, sessionmaker, declarative_base, Session
+from sqlalchemy.pool import StaticPool
+
+from Application.Utils.Money import Money
 
 Base = declarative_base()
 SessionLocal = None
 
+DB_PATH: str = "casino.db"
+DB_URL: str = f"sqlite:///{DB_PATH}"
+IN_MEMORY_DB_URL: str = "sqlite:///:memory:"
+
+# Bump whenever a table or column is added so existing databases run create_all/migrations once more
+SCHEMA_VERSION: int = 9
+
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",  # Readers are not blocked by the writer
+    "synchronous": "NORMAL",  # Safe with WAL, fsyncs only at checkpoints
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -64 * 1024,  # Negative values are KiB, so 64 MiB
+}
+
+_engines: dict[str, Engine] = {}
+_session_factories: dict[str, sessionmaker] = {}
+
+
+class MoneyType(TypeDecorator):
+    """
+    Stores Money as an INTEGER number of cents so SQLite sums and sorts balances with integer arithmetic.
+    """
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect) -> int | None:
+        return None if value is None else Money.of(value).cents
+
+    def process_result_value(self, value, dialect) -> Money | None:
+        return None if value is None else Money(int(value))
+
+
+def get_column_types(connection: Connection, table: str) -> dict[str, str]:
+    """
+    Returns the declared type of every column of a table, or an empty dict if the table does not exist.
+
+    :param connection: Connection to the database.
+    :param table: Name of the table.
+    :return: A dict mapping column name to declared type.
+    """
+    rows = connection.exec_driver_sql(f"PRAGMA table_info({table})").all()
+    return {row[1]: row[2].upper() for row in rows}
+
+
+def migrate_balance_to_cents(connection: Connection) -> None:
+    """
+    Rebuilds a legacy user_account table whose balance column is a FLOAT of dollars into an INTEGER of cents.
+
+    :param connection: Connection to the database, inside a transaction.
+    :return: None
+    """
+    columns: dict[str, str] = get_column_types(connection, "user_account")
+
+    if columns.get("balance") != "FLOAT":
+        return
+
+    # Rebuild from the legacy table's own DDL so later migrations still see the columns they expect
+    ddl: str = connection.exec_driver_sql("SELECT sql FROM sqlite_master "
+                                          "WHERE type = 'table' AND name = 'user_account'").scalar()
+    connection.exec_driver_sql("ALTER TABLE user_account RENAME TO user_account_float")
+    connection.exec_driver_sql(re.sub(r"\bbalance FLOAT\b", "balance INTEGER", ddl))
+
+    copied: list[str] = [column for column in columns if column != "balance"]
+    column_list: str = ", ".join(copied)
+    connection.exec_driver_sql(f"INSERT INTO user_account ({column_list}, balance) "
+                               f"SELECT {column_list}, CAST(ROUND(balance * 100) AS INTEGER) FROM user_account_float")
+    connection.exec_driver_sql("DROP TABLE user_account_float")
+
+
+def migrate_normalized_email(connection: Connection) -> None:
+    """
+    Adds and backfills the lower-cased email column, then creates the email and reset token indexes.
+
+    Creating the unique index fails if two legacy accounts share an email that only differs in case; those rows have
+    to be merged by hand before the migration can complete.
+
+    :param connection: Connection to the database, inside a transaction.
+    :return: None
+    """
+    columns: dict[str, str] = get_column_types(connection, "user_account")
+
+    if not columns:
+        return
+
+    if "email_normalized" not in columns:
+        connection.exec_driver_sql("ALTER TABLE user_account ADD COLUMN email_normalized VARCHAR")
+        connection.exec_driver_sql("UPDATE user_account SET email_normalized = lower(trim(email))")
+
+    for index in Base.metadata.tables["user_account"].indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def migrate_account_version(connection: Connection) -> None:
+    """
+    Adds the optimistic locking version column, starting every existing account at version 1.
+
+    :param connection: Connection to the database, inside a transaction.
+    :return: None
+    """
+    columns: dict[str, str] = get_column_types(connection, "user_account")
+
+    if columns and "version" not in columns:
+        connection.exec_driver_sql("ALTER TABLE user_account ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+
+
+def migrate_balance_snapshots(connection: Connection) -> None:
+    """
+    Starts the ledger of every account that predates it with a snapshot of its current balance.
+
+    :param connection: Connection to the database, inside a transaction.
+    :return: None
+    """
+    if not get_column_types(connection, "user_account") or get_column_types(connection, "balance_snapshot"):
+        return
+
+    Base.metadata.tables["balance_snapshot"].create(bind=connection)
+    connection.exec_driver_sql("INSERT INTO balance_snapshot (username, balance, last_entry_id, created_at) "
+                               "SELECT username, balance, 0, CURRENT_TIMESTAMP FROM user_account")
+
+
+# Each migration checks the live schema itself, so running one that is already applied is a no-op
+MIGRATIONS: list[Callable[[Connection], None]] = [migrate_balance_to_cents, migrate_normalized_email,
+                                                  migrate_account_version, migrate_balance_snapshots]
+
+
+def register_models() -> None:
+    """
+    Imports every model module so all tables are on Base.metadata before migrations and create_all run.
+
+    :return: None
+    """
+    import Application.Model.Accounts.UserAccount
+    import Application.Model.Accounts.WagerJournal
+    import Application.Model.Accounts.EmailOutbox
+    import Application.Model.Accounts.Ledger
+    import Application.Model.Accounts.SessionTokens
+    import Application.Model.Accounts.LoginRateLimiter
+    import Application.Model.Games.TriviaGame.QuestionBank
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Engine "connect" hook that tunes every new SQLite connection.
+
+    :param dbapi_connection: The raw sqlite3 connection.
+    :param connection_record: The pool's record for the connection (unused).
+    :return: None
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {pragma} = {value}")
+    cursor.close()
+
+
+def migrate_schema(engine: Engine) -> None:
+    """
+    Runs migrations and creates missing tables unless the database already reports the current schema version.
+
+    The version is kept in SQLite's user_version header, so a warm start costs one PRAGMA instead of a full
+    create_all reflection pass.
+
+    :param engine: Engine bound to the database to check.
+    :return: None
+    """
+    with engine.begin() as connection:
+        version: int = connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+        if version == SCHEMA_VERSION:
+            return
+
+        register_models()
+
+        for migration in MIGRATIONS:
+            migration(connection)
+
+        Base.metadata.create_all(bind=connection)
+        connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def is_in_memory_url(db_url: str) -> bool:
+    """
+    :param db_url: SQLAlchemy database URL.
+    :return: True if the URL names a private in-memory SQLite database, e.g. sqlite:///:memory: or sqlite://.
+    """
+    return db_url in ("sqlite://", "sqlite:///") or ":memory:" in db_url
+
+
+def get_engine(db_url: str = DB_URL) -> Engine:
+    """
+    Returns the process-wide engine for a database URL, creating and migrating it on first use.
+
+    In-memory URLs are never cached: every in-memory init_db is expected to start from an empty database. Their
+    engines use a StaticPool so every thread shares the one connection, and with it the one database, instead of
+    each thread getting an empty database of its own.
+
+    :param db_url: SQLAlchemy database URL.
+    :return: The Engine for db_url.
+    """
+    engine: Engine | None = _engines.get(db_url)
+
+    if engine is None:
+        if is_in_memory_url(db_url):
+            engine = create_engine(db_url, echo=False, connect_args={"check_same_thread": False},
+                                   poolclass=StaticPool)
+        else:
+            engine = create_engine(db_url, echo=False, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", apply_sqlite_pragmas)
+        migrate_schema(engine)
+
+        if not is_in_memory_url(db_url):
+            _engines[db_url] = engine
+
+    return engine
+
+
+def get_session_factory(db_url: str = DB_URL) -> sessionmaker:
+    """
+    Returns the cached sessionmaker for a database URL.
+
+    :param db_url: SQLAlchemy database URL.
+    :return: A sessionmaker bound to the URL's engine.
+    """
+    factory: sessionmaker | None = _session_factories.get(db_url)
+
+    if factory is None:
+        factory = sessionmaker(bind=get_engine(db_url))
+
+        if not is_in_memory_url(db_url):
+            _session_factories[db_url] = factory
+
+    return factory
+
+
+def create_session_registry(session: Session) -> scoped_session:
+    """
+    Builds a thread-local session registry around an existing session.
+
+    The calling thread keeps using session. Any other thread that asks the registry for a session gets one of its own,
+    bound to the same engine, so sessions and their identity maps are never shared between threads.
+
+    :param session: The session of the thread creating the registry.
+    :return: The registry. Call it to get the current thread's session, and call remove() before a thread exits.
+    """
+    registry: scoped_session = scoped_session(sessionmaker(bind=session.get_bind()))
+    registry.registry.set(session)
+    return registry
+
+
+def dispose_engines() -> None:
+    """
+    Closes every cached engine and empties the registry. Needed before deleting or replacing a database file.
+
+    :return: None
+    """
+    for engine in _engines.values():
+        engine.dispose()
+
+    _engines.clear()
+    _session_factories.clear()
+
 
 def init_db(in_memory=False) -> Session:
     global SessionLocal
 
     if in_memory:
-        db_url = "sqlite:///:memory:"
+        db_url = IN_MEMORY_DB_URL
     else:
-        db_url = "sqlite:///casino.db"
+        db_url = DB_URL
+
+    from Application.Model.Accounts.WagerJournal import replay_journal
+
+    SessionLocal = get_session_factory(db_url)
+    session: Session = SessionLocal()
 
-    engine = create_engine(db_url, echo=False, connect_args={"check_same_thread": False})
-    SessionLocal = sessionmaker(bind=engine)
-    Base.metadata.create_all(bind=engine)
+    if not in_memory:
+        replay_journal(session)
 
-    return SessionLocal()
+    return session
@@ -0,0 +1,170 @@
+import random
+from bisect import bisect_left
+
+from Application.Model.Games.TriviaGame.Category import Category
+
+DIFFICULTIES: tuple[str, ...] = ("easy", "medium", "hard")
+COUNT_ATTRIBUTES: dict[str, str] = {"easy": "easy_num", "medium": "med_num", "hard": "hard_num"}
+
+
+def get_question_count(category: Category, difficulty: str) -> int:
+    """
+    :param category: The category to look at.
+    :param difficulty: "easy", "medium" or "hard".
+    :return: How many questions OpenTDB has for the category at that difficulty.
+    """
+    return getattr(category, COUNT_ATTRIBUTES[difficulty])
+
+
+def get_question_counts(category: Category) -> tuple[int, ...]:
+    return category.easy_num, category.med_num, category.hard_num
+
+
+class CategoryIndex:
+    """
+    Trivia categories sorted by question count, once per difficulty, so threshold and top-K queries are a bisect away.
+
+    Each difficulty keeps a list of (count, category id) keys in ascending order, with the categories in a parallel
+    list. Ties are broken by id, which gives every category exactly one position to bisect to when it changes. The
+    order of the list the index was built or last synced from is remembered too, so queries can return it instead.
+
+    Attributes:
+        keys (dict): Ascending (count, category id) keys, by difficulty.
+        categories (dict): The categories in the same order as keys, by difficulty.
+        by_id (dict): Every indexed category, by id.
+        positions (dict): Each category's position in the source list, by id.
+    """
+
+    def __init__(self, categories: list[Category] = ()):
+        self.keys: dict[str, list[tuple[int, int]]] = {}
+        self.categories: dict[str, list[Category]] = {}
+        self.by_id: dict[int, Category] = {category.id: category for category in categories}
+        self.positions: dict[int, int] = {category.id: position for position, category in enumerate(categories)}
+
+        for difficulty in DIFFICULTIES:
+            ordered: list[Category] = sorted(self.by_id.values(),
+                                             key=lambda category: (get_question_count(category, difficulty),
+                                                                   category.id))
+            self.keys[difficulty] = [(get_question_count(category, difficulty), category.id) for category in ordered]
+            self.categories[difficulty] = ordered
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def copy(self) -> 'CategoryIndex':
+        """
+        :return: An independent index with the same contents, built without sorting.
+        """
+        index: CategoryIndex = CategoryIndex()
+        index.keys = {difficulty: list(keys) for difficulty, keys in self.keys.items()}
+        index.categories = {difficulty: list(categories) for difficulty, categories in self.categories.items()}
+        index.by_id = dict(self.by_id)
+        index.positions = dict(self.positions)
+        return index
+
+    def add(self, category: Category) -> None:
+        """
+        Indexes a category, replacing any indexed category with the same id.
+
+        :param category: The category to add.
+        :return: None
+        """
+        self.remove(category.id)
+        self.by_id[category.id] = category
+        self.positions.setdefault(category.id, len(self.positions))
+
+        for difficulty in DIFFICULTIES:
+            key: tuple[int, int] = (get_question_count(category, difficulty), category.id)
+            position: int = bisect_left(self.keys[difficulty], key)
+            self.keys[difficulty].insert(position, key)
+            self.categories[difficulty].insert(position, category)
+
+    def remove(self, category_id: int) -> Category | None:
+        """
+        Removes a category from the index.
+
+        :param category_id: OpenTDB id of the category.
+        :return: The removed category, or None if it was not indexed.
+        """
+        category: Category | None = self.by_id.pop(category_id, None)
+
+        if category is not None:
+            for difficulty in DIFFICULTIES:
+                position: int = bisect_left(self.keys[difficulty], (get_question_count(category, difficulty),
+                                                                     category_id))
+                del self.keys[difficulty][position]
+                del self.categories[difficulty][position]
+
+        return category
+
+    def sync(self, categories: list[Category]) -> int:
+        """
+        Brings the index in line with a new list of categories, touching only the ones that were added, removed or
+        whose counts changed.
+
+        :param categories: The full, current list of categories.
+        :return: How many categories were re-indexed or removed.
+        """
+        changed: int = 0
+        current: dict[int, Category] = {category.id: category for category in categories}
+        self.positions = {category.id: position for position, category in enumerate(categories)}
+
+        for category_id in self.by_id.keys() - current.keys():
+            self.remove(category_id)
+            changed += 1
+
+        for category in categories:
+            indexed: Category | None = self.by_id.get(category.id)
+
+            if indexed is None or get_question_counts(indexed) != get_question_counts(category):
+                self.add(category)
+                changed += 1
+            elif indexed.name != category.name:  # Same counts, so the category keeps its positions
+                self.by_id[category.id] = category
+
+                for difficulty in DIFFICULTIES:
+                    position: int = bisect_left(self.keys[difficulty], (get_question_count(category, difficulty),
+                                                                        category.id))
+                    self.categories[difficulty][position] = category
+
+        return changed
+
+    def count_at_least(self, difficulty: str, minimum: int) -> int:
+        """
+        :return: How many categories have at least minimum questions at the difficulty. O(log n).
+        """
+        keys: list[tuple[int, int]] = self.keys[difficulty]
+        return len(keys) - bisect_left(keys, (minimum,))
+
+    def at_least(self, difficulty: str, minimum: int, most_first: bool = True) -> list[Category]:
+        """
+        :param difficulty: "easy", "medium" or "hard".
+        :param minimum: The fewest questions a category may have at the difficulty.
+        :param most_first: Order by question count, most first. Otherwise keep the order of the source list.
+        :return: Every category with at least minimum questions.
+        """
+        keys: list[tuple[int, int]] = self.keys[difficulty]
+        eligible: list[Category] = self.categories[difficulty][bisect_left(keys, (minimum,)):]
+
+        if not most_first:
+            return sorted(eligible, key=lambda category: self.positions[category.id])
+
+        return eligible[::-1]
+
+    def top(self, difficulty: str, k: int) -> list[Category]:
+        """
+        :return: The k categories with the most questions at the difficulty, most first.
+        """
+        return self.categories[difficulty][-k:][::-1] if k > 0 else []
+
+    def random_eligible(self, difficulty: str, minimum: int, rng: random.Random = random) -> Category | None:
+        """
+        Picks a category uniformly from those with at least minimum questions at the difficulty, in O(log n).
+
+        :param rng: Source of randomness, e.g. a seeded Random in tests.
+        :return: The category, or None if none qualify.
+        """
+        start: int = bisect_left(self.keys[difficulty], (minimum,))
+        categories: list[Category] = self.categories[difficulty]
+
+        return categories[rng.randrange(start, len(categories))] if start < len(categories) else None
@@ -0,0 +1,368 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from html import unescape
+from typing import Iterator
+
+from sqlalchemy import Column, Index, Integer, String, Text, delete, func, insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from Application.Model.Accounts.db import Base, DB_URL, get_session_factory
+from Application.Model.Games.TriviaGame.Question import Question
+from Application.Utils.HttpClient import HttpClient
+
+QUESTIONS_PER_GAME: int = 10
+DEFAULT_WATERMARK: int = 3 * QUESTIONS_PER_GAME  # Stock kept per key, enough for a few games back to back
+MAX_BATCH_SIZE: int = 50  # The most questions OpenTDB returns per request
+POLL_INTERVAL_S: float = 60.0
+MAX_FETCH_ATTEMPTS: int = 3
+REQUEST_INTERVAL_S: float = 5.0  # OpenTDB allows each IP one request every 5 seconds
+
+# OpenTDB response codes, see https://opentdb.com/api_config.php
+RESPONSE_SUCCESS: int = 0
+RESPONSE_NO_RESULTS: int = 1  # Fewer questions match than the amount asked for
+RESPONSE_TOKEN_NOT_FOUND: int = 3
+RESPONSE_TOKEN_EMPTY: int = 4  # Every matching question has been served to this token
+
+BankKey = tuple[int, str, str]  # (category id, difficulty, question type)
+
+
+class BankedQuestion(Base):
+    """
+    A trivia question fetched ahead of time and waiting to be served. Rows are deleted as they are handed out.
+    """
+    __tablename__ = 'trivia_question'
+
+    id = Column(Integer, primary_key=True)
+    category_id = Column(Integer, nullable=False)
+    difficulty = Column(String, nullable=False)
+    q_type = Column(String, nullable=False)
+    question = Column(Text, nullable=False)
+    answer = Column(Text, nullable=False)
+    wrong_answers = Column(Text, nullable=False)  # JSON list
+
+    __table_args__ = (
+        # Serves "oldest N for a key" from the index alone, and keeps a question from being banked twice
+        Index("ix_trivia_question_key", "category_id", "difficulty", "q_type", "id"),
+        Index("ux_trivia_question_text", "category_id", "difficulty", "q_type", "question", unique=True),
+    )
+
+
+def parse_question(result: dict) -> Question:
+    """
+    Converts one entry of an api.php response into a Question.
+
+    :param result: A dict from the response's "results" list.
+    :return: The Question, with its HTML entities unescaped.
+    """
+    return Question(question=unescape(result["question"]),
+                    answer=unescape(result["correct_answer"]),
+                    wrong_answers=[unescape(answer) for answer in result["incorrect_answers"]])
+
+
+class QuestionBank:
+    """
+    Local stock of trivia questions per (category, difficulty, type), kept topped up by a background thread.
+
+    take() serves a game's questions with one indexed DELETE ... RETURNING and never touches the network. Every take
+    queues its key for a refill; the thread then fetches until the key is back at the watermark. Fetches use an
+    OpenTDB session token so the bank is not filled with questions it has already served.
+
+    Requests a player is waiting on take priority: while one is inside live_request(), and for request_interval_s
+    after it, the thread holds back its own requests so they do not use up the player's share of OpenTDB's rate limit.
+    The thread also spaces its own requests request_interval_s apart.
+    """
+
+    def __init__(self, client: HttpClient, session_factory: sessionmaker | None = None,
+                 watermark: int = DEFAULT_WATERMARK, poll_interval_s: float = POLL_INTERVAL_S,
+                 request_interval_s: float = REQUEST_INTERVAL_S):
+        self.client: HttpClient = client
+        self.session_factory: sessionmaker = session_factory or get_session_factory(DB_URL)
+        self.watermark: int = watermark
+        self.poll_interval_s: float = poll_interval_s
+        self.request_interval_s: float = request_interval_s
+        self.logger: logging.Logger = logging.getLogger("database")
+
+        self.token: str | None = None
+        self.lock: threading.Lock = threading.Lock()
+        self.pending: dict[BankKey, None] = {}  # Keys waiting for a refill, in the order they were requested
+        self.live_requests: int = 0
+        self.last_request_at: float = float("-inf")  # time.monotonic() of the last request, live or prefetch
+        self.turn: threading.Condition = threading.Condition(self.lock)  # Notified when a live request ends
+        self.wake_event: threading.Event = threading.Event()
+        self.stopping: threading.Event = threading.Event()
+        self.thread: threading.Thread | None = None
+
+    def start(self) -> 'QuestionBank':
+        """
+        Starts the prefetch thread.
+
+        :return: self, so the bank can be created and started in one expression.
+        """
+        self.thread = threading.Thread(target=self.run, name="question-bank", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stops the prefetch thread. Banked questions stay in the database for next time.
+
+        :param timeout: Seconds to wait for the thread to finish, or None to wait indefinitely.
+        :return: None
+        """
+        self.stopping.set()
+        self.wake_event.set()
+
+        with self.turn:
+            self.turn.notify_all()
+
+        if self.thread is not None:
+            self.thread.join(timeout)
+            self.thread = None
+
+    def request(self, *keys: BankKey) -> None:
+        """
+        Queues keys to be topped up to the watermark and wakes the prefetch thread.
+
+        :param keys: (category id, difficulty, question type) of each stock to refill.
+        :return: None
+        """
+        with self.lock:
+            for key in keys:
+                self.pending.setdefault(key)
+
+        self.wake_event.set()
+
+    @contextmanager
+    def live_request(self) -> Iterator[None]:
+        """
+        Marks requests that a player is waiting on, so the prefetch thread keeps out of their way.
+
+        :return: A context manager covering the live requests.
+        """
+        with self.lock:
+            self.live_requests += 1
+
+        try:
+            yield
+        finally:
+            with self.turn:
+                self.live_requests -= 1
+                self.last_request_at = time.monotonic()
+                self.turn.notify_all()
+
+    def wait_for_turn(self) -> bool:
+        """
+        Blocks the prefetch thread until no live request is in flight and request_interval_s has passed since the
+        last request.
+
+        :return: True when the thread may send its request, False if the bank is stopping.
+        """
+        with self.turn:
+            while not self.stopping.is_set():
+                if self.live_requests:
+                    self.turn.wait()
+                    continue
+
+                remaining: float = self.last_request_at + self.request_interval_s - time.monotonic()
+                if remaining <= 0:
+                    self.last_request_at = time.monotonic()
+                    return True
+
+                self.turn.wait(remaining)
+
+        return False
+
+    def get_json(self, path: str) -> dict | None:
+        """
+        Sends a prefetch request once it is the thread's turn.
+
+        :param path: The API path, relative to the client's base URL.
+        :return: The JSON body, or None if the request failed or the bank is stopping.
+        """
+        return self.client.get_json(path) if self.wait_for_turn() else None
+
+    def take(self, category_id: int, difficulty: str, q_type: str,
+             amount: int = QUESTIONS_PER_GAME) -> list[Question] | None:
+        """
+        Removes and returns the oldest questions banked for a key, then queues the key for a refill.
+
+        :param category_id: OpenTDB id of the category.
+        :param difficulty: "easy", "medium" or "hard".
+        :param q_type: "boolean" or "multiple".
+        :param amount: How many questions to take.
+        :return: amount questions, or None without taking any if fewer are banked.
+        """
+        key: BankKey = (category_id, difficulty, q_type)
+        oldest = (select(BankedQuestion.id)
+                  .where(BankedQuestion.category_id == category_id, BankedQuestion.difficulty == difficulty,
+                         BankedQuestion.q_type == q_type)
+                  .order_by(BankedQuestion.id)
+                  .limit(amount)
+                  .scalar_subquery())
+
+        with self.session_factory() as session:
+            rows = session.execute(delete(BankedQuestion)
+                                   .where(BankedQuestion.id.in_(oldest))
+                                   .returning(BankedQuestion.question, BankedQuestion.answer,
+                                              BankedQuestion.wrong_answers)).all()
+
+            if len(rows) < amount:
+                session.rollback()
+                questions: list[Question] | None = None
+            else:
+                session.commit()
+                questions = [Question(question, answer, json.loads(wrong_answers))
+                             for question, answer, wrong_answers in rows]
+
+        self.request(key)
+        return questions
+
+    def stock(self, category_id: int, difficulty: str, q_type: str, session: Session | None = None) -> int:
+        """
+        :param session: Session to count with. Defaults to a new one.
+        :return: How many questions are banked for the key.
+        """
+        query = (select(func.count())
+                 .select_from(BankedQuestion)
+                 .where(BankedQuestion.category_id == category_id, BankedQuestion.difficulty == difficulty,
+                        BankedQuestion.q_type == q_type))
+
+        if session is not None:
+            return session.execute(query).scalar_one()
+
+        with self.session_factory() as session:
+            return session.execute(query).scalar_one()
+
+    def run(self) -> None:
+        session: Session = self.session_factory()
+
+        try:
+            while not self.stopping.is_set():
+                self.wake_event.clear()
+
+                with self.lock:
+                    key: BankKey | None = next(iter(self.pending), None)
+
+                if key is None:
+                    self.wake_event.wait(self.poll_interval_s)
+                    continue
+
+                try:
+                    self.top_up(session, key)
+                except Exception:
+                    session.rollback()
+                    self.logger.exception("Could not top up trivia questions for %s", key)
+
+                with self.lock:
+                    self.pending.pop(key, None)
+        finally:
+            session.close()
+
+    def top_up(self, session: Session, key: BankKey) -> int:
+        """
+        Fetches questions for a key until its stock reaches the watermark or OpenTDB has no more to give.
+
+        :param session: The prefetch thread's session.
+        :param key: (category id, difficulty, question type) to refill.
+        :return: The number of questions added.
+        """
+        added: int = 0
+
+        while not self.stopping.is_set():
+            missing: int = self.watermark - self.stock(*key, session=session)
+            if missing <= 0:
+                break
+
+            results: list[dict] | None = self.fetch(key, min(max(missing, QUESTIONS_PER_GAME), MAX_BATCH_SIZE))
+            if not results:
+                break
+
+            stored: int = self.store(session, key, results)
+            added += stored
+
+            if stored == 0:  # Only repeats came back, so asking again would loop
+                break
+
+        session.commit()  # End the read transaction so the next count sees other threads' takes
+        return added
+
+    def store(self, session: Session, key: BankKey, results: list[dict]) -> int:
+        """
+        Banks fetched questions, skipping any already banked for the key.
+
+        :param session: The prefetch thread's session.
+        :param key: (category id, difficulty, question type) the questions were fetched for.
+        :param results: The "results" list of an api.php response.
+        :return: The number of questions added.
+        """
+        category_id, difficulty, q_type = key
+        rows: list[dict] = []
+
+        for result in results:
+            question: Question = parse_question(result)
+            rows.append({"category_id": category_id, "difficulty": difficulty, "q_type": q_type,
+                         "question": question.question, "answer": question.answer,
+                         "wrong_answers": json.dumps(question.wrong_answers)})
+
+        # Core executemany on the session's connection, which reports how many rows OR IGNORE actually inserted
+        inserted: int = session.connection().execute(insert(BankedQuestion).prefix_with("OR IGNORE"), rows).rowcount
+        session.commit()
+        return inserted
+
+    def fetch(self, key: BankKey, amount: int) -> list[dict] | None:
+        """
+        Requests questions for a key with the bank's session token, renewing or resetting the token as OpenTDB asks.
+
+        :param key: (category id, difficulty, question type) to fetch.
+        :param amount: How many questions to ask for.
+        :return: The "results" list, or None if OpenTDB could not supply any.
+        """
+        category_id, difficulty, q_type = key
+
+        for _ in range(MAX_FETCH_ATTEMPTS):
+            token: str | None = self.get_token()
+            path: str = f"api.php?amount={amount}&category={category_id}&difficulty={difficulty}&type={q_type}"
+            response: dict | None = self.get_json(f"{path}&token={token}" if token else path)
+
+            if response is None:
+                return None
+
+            code: int = response.get("response_code")
+
+            if code == RESPONSE_SUCCESS:
+                return response["results"]
+            if code == RESPONSE_NO_RESULTS and amount > QUESTIONS_PER_GAME:
+                amount = QUESTIONS_PER_GAME
+            elif code == RESPONSE_TOKEN_NOT_FOUND:
+                self.token = None
+            elif code == RESPONSE_TOKEN_EMPTY:
+                self.reset_token()
+            else:
+                break
+
+        self.logger.warning("OpenTDB has no more questions for %s", key)
+        return None
+
+    def get_token(self) -> str | None:
+        """
+        Returns the bank's OpenTDB session token, requesting one if it has none.
+
+        :return: The token, or None if OpenTDB did not hand one out. Questions may then repeat.
+        """
+        if self.token is None:
+            response: dict | None = self.get_json("api_token.php?command=request")
+            self.token = response.get("token") if response else None
+
+        return self.token
+
+    def reset_token(self) -> None:
+        """
+        Tells OpenTDB to start serving every question to the token again.
+
+        :return: None
+        """
+        if self.token is not None and self.get_json(f"api_token.php?command=reset&token={self.token}") is None:
+            self.token = None
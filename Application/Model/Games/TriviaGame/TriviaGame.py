@@ -1,47 +1,158 @@
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from html import unescape
-
-import requests
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
 
 from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.CategoryIndex import CategoryIndex, get_question_count
 from Application.Model.Games.TriviaGame.Question import Question
+from Application.Model.Games.TriviaGame.QuestionBank import QUESTIONS_PER_GAME, QuestionBank, parse_question
+from Application.Utils.HttpClient import HttpClient
+from Application.Utils.Money import Money
 
 CACHE_FILE_PATH = "category_cache.txt"
+CACHE_TIMESTAMP_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+CATEGORY_TTL_S: float = 24 * 60 * 60  # How long the category list and each category's counts stay fresh
+CATEGORY_TTLS_S: dict[int, float] = {}  # Per-category overrides of CATEGORY_TTL_S, by OpenTDB id
+MIN_CATEGORY_QUESTIONS: int = 50  # Enough at one difficulty to assume 10+ of both question types
+PREFETCH_CATEGORIES: int = 3  # Categories stocked ahead of a pick; the picked one is refilled when a game takes from it
+REFRESH_RETRY_S: float = 60.0  # After a refresh that could not fetch everything, wait this long before the next one
 BASE_URL: str = "https://opentdb.com/"
+COUNT_FETCH_CONCURRENCY: int = 8  # OpenTDB serves the ~24 count requests fine at this width
+REQUEST_DEADLINE_S: float = 15.0  # Covers one wait for OpenTDB's rate limit
+RATE_LIMIT_RESPONSE_CODE: int = 5  # OpenTDB allows each IP one question request every 5 seconds
+RATE_LIMIT_DELAY_S: float = 5.0
+
+opentdb_client: HttpClient | None = None
+category_cache: 'CachedCategories | None' = None
+category_cache_lock: threading.Lock = threading.Lock()
+category_cache_stats: dict[str, int] = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0}
+category_refresh_thread: threading.Thread | None = None
+category_refresh_after: float = 0.0
+
+
+def get_category_ttl(category_id: int) -> float:
+    """
+    :param category_id: OpenTDB id of the category.
+    :return: Seconds the category's question counts stay fresh.
+    """
+    return CATEGORY_TTLS_S.get(category_id, CATEGORY_TTL_S)
+
 
+def format_timestamp(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp).strftime(CACHE_TIMESTAMP_FORMAT)
 
-def category_cacher(categories: list[Category]) -> None:
+
+def parse_timestamp(timestamp: str) -> float:
+    return datetime.strptime(timestamp, CACHE_TIMESTAMP_FORMAT).timestamp()
+
+
+class CachedCategories:
+    """
+    The parsed contents of the category cache file, kept in memory until the file changes.
+
+    Attributes:
+        path (str): The file the contents were read from.
+        signature (tuple): The file's inode, mtime and size when it was read. Every write renames a new file into
+            place, so any change gives a new signature.
+        listed_at (float): When the category list itself was fetched.
+        categories (list): The cached Category objects, in API order.
+        fetched_at (dict): When each category's question counts were fetched, by category id.
+        expires_at (float): When the first part of the cache goes stale.
+        index (CategoryIndex): The categories sorted by question count for each difficulty.
     """
-    Caches a list of trivia categories along with a timestamp to the cache file.
+
+    def __init__(self, path: str, signature: tuple, cache: dict, previous: 'CachedCategories | None' = None):
+        self.path: str = path
+        self.signature: tuple = signature
+        self.listed_at: float = parse_timestamp(cache["timestamp"])
+        self.categories: list[Category] = parse_cached_categories(cache["categories"])
+        # Files written before per-category timestamps existed date every category from the list
+        self.fetched_at: dict[int, float] = {category["id"]: parse_timestamp(category.get("fetched_at",
+                                                                                          cache["timestamp"]))
+                                             for category in cache["categories"]}
+        self.expires_at: float = min([self.listed_at + CATEGORY_TTL_S] +
+                                     [fetched_at + get_category_ttl(category_id)
+                                      for category_id, fetched_at in self.fetched_at.items()])
+
+        # A refresh usually changes a few counts, so patch the previous index rather than sorting from scratch
+        if previous is not None:
+            self.index: CategoryIndex = previous.index.copy()
+            self.index.sync(self.categories)
+        else:
+            self.index = CategoryIndex(self.categories)
+
+    def is_list_stale(self, now: float) -> bool:
+        return now >= self.listed_at + CATEGORY_TTL_S
+
+    def is_stale(self, category_id: int, now: float) -> bool:
+        return now >= self.fetched_at.get(category_id, 0.0) + get_category_ttl(category_id)
+
+
+def category_cacher(categories: list[Category], fetched_at: dict[int, float] | None = None,
+                    listed_at: float | None = None) -> None:
+    """
+    Caches a list of trivia categories, with when the list and each category's counts were fetched, to the cache file.
+
+    The file is written under a temporary name and renamed over the old one, so readers never see a partial file.
 
     :param categories: List of Category objects to cache.
+    :param fetched_at: When each category's counts were fetched, by id. Categories missing from it are dated now.
+    :param listed_at: When the category list was fetched. Defaults to now.
     :return: None
     """
-    cache: dict = {"timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                   "categories": [cat.__dict__ for cat in categories]}
+    now: float = time.time()
+    fetched_at = fetched_at or {}
+    cache: dict = {"timestamp": format_timestamp(listed_at or now),
+                   "categories": [cat.to_dict() | {"fetched_at": format_timestamp(fetched_at.get(cat.id, now))}
+                                  for cat in categories]}
 
-    with open(CACHE_FILE_PATH, mode='w') as cache_file:
-        json.dump(cache, cache_file, indent=4)
+    directory: str = os.path.dirname(os.path.abspath(CACHE_FILE_PATH))
+    file_descriptor, temp_path = tempfile.mkstemp(prefix=".category_cache.", dir=directory)
 
+    replaced: bool = False
 
-def cache_loader() -> dict | None:
+    try:
+        with os.fdopen(file_descriptor, mode='w') as cache_file:
+            json.dump(cache, cache_file, indent=4)
+        os.replace(temp_path, CACHE_FILE_PATH)
+        replaced = True
+    finally:
+        if not replaced:
+            os.remove(temp_path)
+
+
+def cache_loader() -> CachedCategories | None:
     """
-    Loads cached trivia categories from a local file if the cache is valid (less than 24 hours old).
+    Returns the cached trivia categories, whatever their age. The file is only read and parsed again after it changes.
 
-    :return: Dictionary of cached categories or None if cache is expired or missing.
+    :return: The cached categories, or None if the cache file is missing or unreadable.
     """
-    if os.path.exists(CACHE_FILE_PATH):
-        with open(CACHE_FILE_PATH, mode='r') as cache_file:
-            cache = json.load(cache_file)
+    global category_cache
+
+    try:
+        stat: os.stat_result = os.stat(CACHE_FILE_PATH)
+    except FileNotFoundError:
+        return None
+
+    signature: tuple = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
 
-            cache_date = datetime.strptime(cache["timestamp"], "%Y-%m-%d %H:%M:%S")
-            if datetime.now() - cache_date < timedelta(hours=24):
-                return cache["categories"]
+    with category_cache_lock:
+        if category_cache is None or category_cache.path != CACHE_FILE_PATH or category_cache.signature != signature:
+            try:
+                with open(CACHE_FILE_PATH, mode='r') as cache_file:
+                    category_cache = CachedCategories(CACHE_FILE_PATH, signature, json.load(cache_file),
+                                                      category_cache)
+            except (OSError, ValueError, KeyError, TypeError):
+                logging.warning("Ignoring unreadable category cache %s", CACHE_FILE_PATH)
+                return None
 
-    return None
+        return category_cache
 
 
 def parse_cached_categories(cache) -> list[Category]:
@@ -63,91 +174,275 @@ def parse_cached_categories(cache) -> list[Category]:
     return possible_categories
 
 
-def get_response(url: str) -> None | dict:
+def record_cache_result(result: str) -> None:
+    with category_cache_lock:
+        category_cache_stats[result] += 1
+
+
+def get_category_cache_stats() -> dict[str, int]:
     """
-    Sends an HTTP GET request to the provided URL and returns the parsed JSON response.
+    Returns how category lookups have been served since the process started.
 
-    :param url: The API endpoint to query.
-    :return: A dictionary containing the JSON response if successful, or None if the request fails.
+    :return: A dict with hits (fresh cache), stale_hits (served stale while refreshing), misses (fetched while the
+        caller waited) and refreshes (background refreshes run).
     """
-    response = requests.get(url)
-    try:
-        response.raise_for_status()
-    except requests.exceptions.HTTPError:
-        logging.error(f"HTTP Error when attempting to get_response from {url}")
+    with category_cache_lock:
+        return dict(category_cache_stats)
+
+
+def is_rate_limited(body: dict) -> bool:
+    return body.get("response_code") == RATE_LIMIT_RESPONSE_CODE
+
+
+def create_opentdb_client(base_url: str = BASE_URL) -> HttpClient:
+    """
+    Builds an HttpClient configured for OpenTDB.
+
+    :param base_url: The API root, e.g. a local stub server in tests.
+    :return: The new client.
+    """
+    return HttpClient(base_url=base_url, pool_size=COUNT_FETCH_CONCURRENCY, deadline_s=REQUEST_DEADLINE_S,
+                      is_rate_limited=is_rate_limited, rate_limit_delay_s=RATE_LIMIT_DELAY_S)
+
+
+def get_opentdb_client() -> HttpClient:
+    """
+    Returns the process-wide OpenTDB client, creating it on first use.
+
+    :return: The shared HttpClient.
+    """
+    global opentdb_client
+
+    if opentdb_client is None:
+        opentdb_client = create_opentdb_client()
+
+    return opentdb_client
+
+
+def set_opentdb_client(client: HttpClient | None) -> None:
+    """
+    Replaces the shared OpenTDB client, e.g. with one pointed at a local server. None restores the default on next use.
+
+    :param client: The client to use from now on.
+    :return: None
+    """
+    global opentdb_client
+
+    if opentdb_client is not None and opentdb_client is not client:
+        opentdb_client.close()
+
+    opentdb_client = client
+
+
+def get_response(path: str, deadline_s: float = REQUEST_DEADLINE_S) -> None | dict:
+    """
+    Sends an HTTP GET request to OpenTDB through the shared client and returns the parsed JSON response.
+
+    :param path: The API endpoint to query, relative to the client's base URL.
+    :param deadline_s: Seconds the request may take, including retries.
+    :return: A dictionary containing the JSON response if successful, or None if the request fails or times out.
+    """
+    return get_opentdb_client().get_json(path, deadline_s)
+
+
+def fetch_category(name: str, id_num: int, deadline_s: float = REQUEST_DEADLINE_S) -> Category | None:
+    """
+    Fetches the question counts of one category.
+
+    :param name: The category's name.
+    :param id_num: The category's OpenTDB id.
+    :param deadline_s: Seconds the count request may take.
+    :return: The Category with its question counts, or None if the request fails.
+    """
+    response = get_response(f"api_count.php?category={id_num}", deadline_s)
+
+    if not response:
         return None
-    return response.json()
+
+    category_data = response.get("category_question_count", {})
+    return Category(
+        name=name,
+        id_num=id_num,
+        easy_num=category_data.get("total_easy_question_count", 0),
+        med_num=category_data.get("total_medium_question_count", 0),
+        hard_num=category_data.get("total_hard_question_count", 0)
+    )
+
+
+def fetch_categories(all_categories: dict[str, int], max_workers: int = COUNT_FETCH_CONCURRENCY,
+                     deadline_s: float = REQUEST_DEADLINE_S) -> list[Category]:
+    """
+    Fetches the question counts of many categories concurrently, at most max_workers requests at a time.
+    Categories whose count request fails are left out.
+
+    :param all_categories: Category ids by name, in the order the categories should be listed.
+    :param max_workers: The most count requests in flight at once.
+    :param deadline_s: Seconds each count request may take.
+    :return: The categories that were fetched, in the order of all_categories.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="trivia") as pool:
+        fetched = pool.map(lambda item: fetch_category(*item, deadline_s=deadline_s), all_categories.items())
+        return [category for category in fetched if category is not None]
+
+
+def start_category_refresh(max_workers: int = COUNT_FETCH_CONCURRENCY,
+                           deadline_s: float = REQUEST_DEADLINE_S) -> threading.Thread | None:
+    """
+    Starts refreshing the stale parts of the category cache in the background, unless a refresh is already running or
+    the last one failed less than REFRESH_RETRY_S ago.
+
+    :param max_workers: The most count requests in flight at once.
+    :param deadline_s: Seconds each request may take.
+    :return: The refresh thread, or None if none was started.
+    """
+    global category_refresh_thread
+
+    with category_cache_lock:
+        if ((category_refresh_thread is not None and category_refresh_thread.is_alive())
+                or time.time() < category_refresh_after):
+            return None
+
+        category_refresh_thread = threading.Thread(target=refresh_categories, args=(max_workers, deadline_s),
+                                                   name="category-refresh", daemon=True)
+        category_refresh_thread.start()
+        return category_refresh_thread
+
+
+def refresh_categories(max_workers: int = COUNT_FETCH_CONCURRENCY, deadline_s: float = REQUEST_DEADLINE_S) -> bool:
+    """
+    Refetches the category list if it is stale and the counts of every stale or new category, then rewrites the cache.
+    Categories whose refetch fails keep their old counts until a later refresh succeeds.
+
+    :param max_workers: The most count requests in flight at once.
+    :param deadline_s: Seconds each request may take.
+    :return: True if everything stale was refetched.
+    """
+    global category_refresh_after
+
+    cached: CachedCategories | None = cache_loader()
+    if cached is None:
+        return False
+
+    now: float = time.time()
+    listed_at: float = cached.listed_at
+    all_categories: dict[str, int] = {category.name: category.id for category in cached.categories}
+    complete: bool = True
+
+    if cached.is_list_stale(now):
+        cat_response: dict | None = get_response("api_category.php", deadline_s)
+
+        if cat_response is None:
+            complete = False
+        else:
+            all_categories = {category["name"]: category["id"] for category in cat_response["trivia_categories"]}
+            listed_at = now
+
+    stale: dict[str, int] = {name: id_num for name, id_num in all_categories.items() if cached.is_stale(id_num, now)}
+    fetched: dict[int, Category] = {category.id: category
+                                    for category in fetch_categories(stale, max_workers, deadline_s)}
+    old: dict[int, Category] = {category.id: category for category in cached.categories}
+
+    categories: list[Category] = [fetched.get(id_num) or old[id_num] for id_num in all_categories.values()
+                                  if id_num in fetched or id_num in old]
+    fetched_at: dict[int, float] = {id_num: now if id_num in fetched else cached.fetched_at[id_num]
+                                    for id_num in all_categories.values() if id_num in fetched or id_num in old}
+    category_cacher(categories, fetched_at, listed_at)
+
+    complete = complete and len(fetched) == len(stale)
+    with category_cache_lock:
+        category_cache_stats["refreshes"] += 1
+        category_refresh_after = 0.0 if complete else now + REFRESH_RETRY_S
+
+    if not complete:
+        logging.warning("Refreshed %d of %d stale trivia categories, retrying later", len(fetched), len(stale))
+
+    return complete
 
 
 class TriviaGame:
 
-    def __init__(self, q_type: str, difficulty: str):
+    def __init__(self, q_type: str, difficulty: str, question_bank: QuestionBank | None = None):
         self.q_type: str = q_type
         self.difficulty: str = difficulty
+        self.question_bank: QuestionBank | None = question_bank
         self.cat: Category | None = None
         self.score = 0
 
     @staticmethod
-    def get_possible_categories() -> list[Category] | None:
+    def get_possible_categories(max_workers: int = COUNT_FETCH_CONCURRENCY,
+                                deadline_s: float = REQUEST_DEADLINE_S) -> list[Category] | None:
         """
-        Retrieves a list of trivia categories from cache if available and valid,
-        or from the OpenTDB API otherwise. Caches the result for future use.
+        Retrieves a list of trivia categories from the cache if there is one, or from the OpenTDB API otherwise.
+        Caches the result for future use.
+
+        Cached categories are returned straight away even once stale; the stale parts are then refreshed in the
+        background, so only the very first launch waits on the API.
+
+        The per-category count requests run concurrently. If some of them fail, the categories that were fetched are
+        still returned, but the incomplete list is not cached so the next launch tries again.
 
+        :param max_workers: The most count requests in flight at once.
+        :param deadline_s: Seconds each request may take.
         :return: A list of Category objects if successful, or None if the API call fails.
         """
-        cached_categories: dict | None = cache_loader()
+        cached_categories: CachedCategories | None = cache_loader()
 
-        if cached_categories:
-            return parse_cached_categories(cached_categories)
+        if cached_categories is not None:
+            if time.time() < cached_categories.expires_at:
+                record_cache_result("hits")
+            else:
+                record_cache_result("stale_hits")
+                start_category_refresh(max_workers, deadline_s)
 
-        cat_response = get_response(f"{BASE_URL}api_category.php")
+            return list(cached_categories.categories)
+
+        record_cache_result("misses")
+        cat_response = get_response("api_category.php", deadline_s)
 
         if cat_response is None:
             logging.error("Unable to get any response from Trivia Game's Category API")
             return None
 
         all_categories: dict = {category["name"]: category["id"] for category in cat_response["trivia_categories"]}
-        possible_categories: list[Category] = []
-
-        for key, value in all_categories.items():
-            response = get_response(f"{BASE_URL}api_count.php?category={value}")
-
-            if response:
-                category_data = response.get("category_question_count", {})
-                possible_categories.append(Category(
-                    name=key,
-                    id_num=value,
-                    easy_num=category_data.get("total_easy_question_count", 0),
-                    med_num=category_data.get("total_medium_question_count", 0),
-                    hard_num=category_data.get("total_hard_question_count", 0)
-                ))
-
-        category_cacher(possible_categories)
+        possible_categories: list[Category] = fetch_categories(all_categories, max_workers, deadline_s)
+
+        if len(possible_categories) < len(all_categories):
+            logging.warning("Fetched question counts for %d of %d categories, not caching the partial list",
+                            len(possible_categories), len(all_categories))
+        else:
+            category_cacher(possible_categories)
+
         return possible_categories
 
     def create_questions(self) -> list[Question] | None:
         """
-        Sends a request to the trivia API using the configured difficulty, category, and question type,
-        and parses the response into a list of Question objects.
+        Returns 10 questions for the configured difficulty, category, and question type.
+
+        They are served from the question bank when it has enough stock, so the game starts without a network round
+        trip, and requested live from the trivia API otherwise. Either way the bank refills in the background, after
+        the live request, which the prefetch thread never competes with.
 
         Logs an error and returns None if the API response is invalid or missing.
 
-        :return: A list of Question objects if the API call is successful; otherwise, None.
+        :return: A list of Question objects if the questions could be found; otherwise, None.
         """
-        response: dict | None = self.get_question_response()
+        if self.question_bank is None:
+            response: dict | None = self.get_question_response()
+        else:
+            with self.question_bank.live_request():
+                banked: list[Question] | None = self.question_bank.take(self.cat.id, self.difficulty, self.q_type)
+
+                if banked:
+                    return banked
+
+                response = self.get_question_response()
 
         if not response:
-            logging.error(f"Issue getting questions for difficulty: {self.difficulty},"
-                          f"type: {self.q_type}, and category: {self.cat}")
+            logging.error("Issue getting questions for difficulty: %s, type: %s, and category: %s",
+                          self.difficulty, self.q_type, self.cat)
             return None
 
-        questions_list: list[Question] = []
-        for question in response["results"]:
-            questions_list.append(Question(question=unescape(question["question"]),
-                                           answer=unescape(question["correct_answer"]),
-                                           wrong_answers=[unescape(answer) for answer in question["incorrect_answers"]]
-                                           ))
-        return questions_list
+        return [parse_question(question) for question in response["results"]]
 
     def get_question_response(self) -> dict | None:
         """
@@ -156,36 +451,55 @@ class TriviaGame:
 
         :return: A dictionary containing the API response with trivia questions, or None if the request fails.
         """
-        url: str = (f"{BASE_URL}api.php?amount=10&category={self.cat.id}"
-                    f"&difficulty={self.difficulty}&type={self.q_type}")
+        path: str = (f"api.php?amount={QUESTIONS_PER_GAME}&category={self.cat.id}"
+                     f"&difficulty={self.difficulty}&type={self.q_type}")
 
-        return get_response(url)
+        return get_response(path)
 
-    def get_valid_categories(self, difficulty: str) -> list[Category]:
+    @staticmethod
+    def get_category_index(max_workers: int = COUNT_FETCH_CONCURRENCY,
+                           deadline_s: float = REQUEST_DEADLINE_S) -> CategoryIndex:
         """
+        Returns the categories indexed by question count. The index is built once per cache load and reused by every
+        call until the cache file changes.
+
+        :param max_workers: The most count requests in flight at once, if the categories have to be fetched.
+        :param deadline_s: Seconds each request may take.
+        :return: The index, which is empty if no categories could be found.
+        """
+        categories: list[Category] | None = TriviaGame.get_possible_categories(max_workers, deadline_s)
+        cached_categories: CachedCategories | None = cache_loader()
+
+        if cached_categories is not None:
+            return cached_categories.index
 
-        Iterates through list of Categories and returns a list of only the categories that are valid
+        return CategoryIndex(categories or [])
+
+    def get_valid_categories(self, difficulty: str, most_questions_first: bool = False) -> list[Category]:
+        """
+
+        Returns the categories that are valid for a difficulty, in the order OpenTDB lists them
 
         :param difficulty: the chosen difficulty of the questions
+        :param most_questions_first: order the categories by question count at the difficulty instead
         :return: a list of valid categories to use
 
         Currently, the only way to check a category's question count is the get the count of all questions. However,
         this does not specify how many of those questions are true/false and how many are multiple choice. Thus,
-        we must iterate through all the possible categories and see if it has 50+ questions for a given difficulty at
-        which point we can assume it has 10+ for both true/false and multiple choice
-        """
-        categories: list[Category] = self.get_possible_categories()
-        valid_categories: list[Category] = []
-
-        for cat in categories:
-            if difficulty == "easy" and cat.easy_num >= 50:
-                valid_categories.append(cat)
+        a category needs 50+ questions for a given difficulty, at which point we can assume it has 10+ for both
+        true/false and multiple choice. The category index answers that with a single bisect.
 
-            elif difficulty == "medium" and cat.med_num >= 50:
-                valid_categories.append(cat)
+        With a question bank, only the PREFETCH_CATEGORIES valid categories with the most questions are queued for
+        prefetch. At one OpenTDB request every few seconds, stocking every category would take minutes; the category
+        that is picked is refilled as soon as a game takes from it.
+        """
+        index: CategoryIndex = self.get_category_index()
+        valid_categories: list[Category] = index.at_least(difficulty, MIN_CATEGORY_QUESTIONS, most_questions_first)
 
-            elif difficulty == "hard" and cat.hard_num >= 50:
-                valid_categories.append(cat)
+        if self.question_bank is not None:
+            self.question_bank.request(*[(cat.id, difficulty, self.q_type)
+                                         for cat in index.top(difficulty, PREFETCH_CATEGORIES)
+                                         if get_question_count(cat, difficulty) >= MIN_CATEGORY_QUESTIONS])
 
         return valid_categories
 
@@ -204,17 +518,18 @@ class TriviaGame:
 
         return False
 
-    def get_winnings_total(self, wager: float) -> float:
+    def get_winnings_total(self, wager: Money) -> Money:
         """
         Calculates the user's total winnings based on the selected question type,
         difficulty level, and wager amount.
 
         :param wager: The amount of money wagered by the user.
-        :return: The calculated winnings, rounded to two decimal places.
+        :return: The calculated winnings, rounded half up to the nearest cent.
         """
-        multipliers = {"easy": 1.25, "medium": 1.5, "hard": 1.75, "boolean": 1, "multiple": 1.25}
+        multipliers = {"easy": Decimal("1.25"), "medium": Decimal("1.5"), "hard": Decimal("1.75"),
+                       "boolean": Decimal(1), "multiple": Decimal("1.25")}
         multiplier = multipliers[self.difficulty] * multipliers[self.q_type]
-        return round(wager * multiplier, 2)
+        return Money.of(wager) * multiplier
 
     def set_category(self, cat: Category) -> None:
         """
@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE: int = 8
+DEFAULT_TIMEOUT_S: float = 5.0  # Longest a single attempt may take
+DEFAULT_DEADLINE_S: float = 15.0  # Longest a call may take, including retries and backoff
+DEFAULT_MAX_RETRIES: int = 3
+BASE_BACKOFF_S: float = 0.25
+MAX_BACKOFF_S: float = 8.0
+LATENCY_SAMPLES: int = 1_000
+
+
+def never_rate_limited(body: dict) -> bool:
+    return False
+
+
+def parse_retry_after(value: str | None) -> float:
+    """
+    :param value: A Retry-After header.
+    :return: The delay it asks for in seconds, or 0 if it is missing or an HTTP date.
+    """
+    try:
+        return max(float(value), 0.0) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+class HttpClient:
+    """
+    Keep-alive JSON client around a pooled requests.Session.
+
+    Connections to a host are reused across calls and threads, up to pool_size at once. A call is retried with
+    exponential backoff after connection errors, timeouts, HTTP 429 and 5xx responses, and after responses that
+    is_rate_limited recognises as an API-level rate limit; those wait at least rate_limit_delay_s. No attempt or
+    backoff runs past the call's deadline.
+
+    Attributes:
+        requests (int): Attempts sent, including retries.
+        retries (int): Attempts that were retries.
+        failures (int): Calls that gave up and returned None.
+        latencies (deque): Duration of the most recent attempts in milliseconds.
+    """
+
+    def __init__(self, base_url: str = "", pool_size: int = DEFAULT_POOL_SIZE, timeout_s: float = DEFAULT_TIMEOUT_S,
+                 deadline_s: float = DEFAULT_DEADLINE_S, max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff_s: float = BASE_BACKOFF_S, is_rate_limited: Callable[[dict], bool] = never_rate_limited,
+                 rate_limit_delay_s: float = 0.0):
+        self.base_url: str = base_url
+        self.timeout_s: float = timeout_s
+        self.deadline_s: float = deadline_s
+        self.max_retries: int = max_retries
+        self.backoff_s: float = backoff_s
+        self.is_rate_limited: Callable[[dict], bool] = is_rate_limited
+        self.rate_limit_delay_s: float = rate_limit_delay_s
+        self.logger: logging.Logger = logging.getLogger("http")
+
+        self.session: requests.Session = requests.Session()
+        adapter: HTTPAdapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.lock: threading.Lock = threading.Lock()
+        self.requests: int = 0
+        self.retries: int = 0
+        self.failures: int = 0
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        :param attempt: The number of attempts made so far, starting at 1.
+        :return: Seconds to wait before the next attempt.
+        """
+        return min(self.backoff_s * 2 ** (attempt - 1), MAX_BACKOFF_S)
+
+    def get_json(self, path: str, deadline_s: float | None = None) -> dict | None:
+        """
+        Sends a GET request and returns the parsed JSON body.
+
+        :param path: A URL, or a path relative to base_url.
+        :param deadline_s: Seconds the whole call may take, including retries. Defaults to the client's deadline.
+        :return: The JSON body, or None if every attempt failed or the deadline passed.
+        """
+        url: str = path if "://" in path else f"{self.base_url}{path}"
+        deadline: float = time.monotonic() + (deadline_s if deadline_s is not None else self.deadline_s)
+
+        for attempt in range(1, self.max_retries + 2):
+            remaining: float = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            delay: float = self.get_backoff(attempt)
+            start: float = time.perf_counter()
+
+            try:
+                response: requests.Response = self.session.get(url, timeout=min(self.timeout_s, remaining))
+                self.record(start, retry=attempt > 1)
+
+                if response.status_code == 429 or response.status_code >= 500:
+                    self.logger.warning("HTTP %d from %s (attempt %d)", response.status_code, url, attempt)
+                    delay = max(delay, parse_retry_after(response.headers.get("Retry-After")))
+                else:
+                    response.raise_for_status()
+                    body: dict = response.json()
+
+                    if not self.is_rate_limited(body):
+                        return body
+
+                    self.logger.warning("Rate limited by %s (attempt %d)", url, attempt)
+                    delay = max(delay, self.rate_limit_delay_s)
+            except requests.exceptions.HTTPError:
+                self.logger.error("HTTP Error when attempting to get_response from %s", url)
+                break
+            except ValueError:  # Also covers requests' JSONDecodeError
+                self.logger.error("Invalid JSON from %s", url)
+                break
+            except requests.exceptions.RequestException as e:
+                self.record(start, retry=attempt > 1)
+                self.logger.warning("%s from %s (attempt %d)", type(e).__name__, url, attempt)
+
+            if attempt > self.max_retries or time.monotonic() + delay >= deadline:
+                break
+
+            time.sleep(delay)
+
+        with self.lock:
+            self.failures += 1
+
+        self.logger.error("Giving up on %s", url)
+        return None
+
+    def record(self, start: float, retry: bool) -> None:
+        with self.lock:
+            self.requests += 1
+            self.retries += retry
+            self.latencies.append((time.perf_counter() - start) * 1000)
+
+    def stats(self) -> dict:
+        """
+        Returns the counters and latency percentiles of recent attempts.
+
+        :return: A dict with requests, retries, failures, p50_ms, p95_ms and max_ms.
+        """
+        with self.lock:
+            latencies: list[float] = sorted(self.latencies)
+
+        def percentile(fraction: float) -> float:
+            return latencies[min(int(len(latencies) * fraction), len(latencies) - 1)] if latencies else 0.0
+
+        return {"requests": self.requests, "retries": self.retries, "failures": self.failures,
+                "p50_ms": percentile(0.5), "p95_ms": percentile(0.95), "max_ms": latencies[-1] if latencies else 0.0}
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections.
+
+        :return: None
+        """
+        self.session.close()
@@ -1,4 +1,7 @@
 from Application.Utils.ANSI_COLORS import ANSI_COLORS
+from Application.Utils.Money import Money
+
+MINIMUM_MONETARY_INPUT: Money = Money(100)
 
 
 def count_decimals(num: float) -> int:
@@ -157,23 +160,27 @@ class IOConsole:
         """
         self.print_colored(error_message, ANSI_COLORS.RED)
 
-    def get_monetary_input(self, prompt, color: ANSI_COLORS=None) -> float:
+    def get_monetary_input(self, prompt, color: ANSI_COLORS=None) -> Money:
         """
         Prompts the user to enter a monetary amount and validates the input.
         The user will be re-prompted until a valid positive number  >= 1.00 with no more than two decimal places is entered.
 
         :param prompt: A string value that will be printed as the prompt
         :param color: A color from ANSI_COLORS which will be used as the printed color
-        :return: A valid monetary input float
+        :return: A valid monetary input as Money
         """
-        money_input: float = self.get_float_input(prompt, color)
+        while True:
+            string_response: str = self.get_string_input(prompt, color)
+            try:
+                money_input: Money = Money.parse(string_response)
+
+                if money_input >= MINIMUM_MONETARY_INPUT:
+                    return money_input
+            except ValueError:
+                pass
 
-        while count_decimals(money_input) > 2 or money_input < 1.00:
             self.print_error("Please enter a valid amount "
                              "(A positive number >= 1.00 with no more than 2 decimal places).")
-            money_input = self.get_float_input(prompt, color)
-
-        return money_input
 
     def print_success(self, message: str) -> None:
         """
@@ -1,42 +1,125 @@
+import atexit
 import logging
 import os
-from logging import FileHandler, Formatter, basicConfig
+import queue
+import random
+from logging import FileHandler, Filter, Formatter, LogRecord, basicConfig
+from logging.handlers import QueueHandler, QueueListener
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath("Application")))
 PARENT_DIR = os.path.join(BASE_DIR, "logs")
+ROUTED_LOGGERS: tuple[str, ...] = ("account.auth", "database")
+DEFAULT_WAGER_SAMPLE_RATE: float = 1.0
 
+# Pass as extra= on per-wager info logs so SamplingFilter can thin them out, e.g.
+# logger.info("%s won %s", username, wager, extra=SAMPLED)
+SAMPLED: dict = {"sampled": True}
 
-def setup_logging() -> None:
+listener: QueueListener | None = None
+
+
+class ExcludeFilter(Filter):
+    """
+    Rejects records from the given loggers (and their children), so app.log only receives what the dedicated files
+    do not.
+    """
+
+    def __init__(self, names: tuple[str, ...]):
+        super().__init__()
+        self.filters: list[Filter] = [Filter(name) for name in names]
+
+    def filter(self, record: LogRecord) -> bool:
+        return not any(name_filter.filter(record) for name_filter in self.filters)
+
+
+class SamplingFilter(Filter):
+    """
+    Keeps only a fraction of the records logged with extra=SAMPLED. Warnings and errors are never sampled out.
+
+    Attributes:
+        rate (float): Fraction of sampled records to keep, from 0.0 (drop all) to 1.0 (keep all).
+    """
+
+    def __init__(self, rate: float = DEFAULT_WAGER_SAMPLE_RATE):
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("Sample rate must be between 0.0 and 1.0")
+        self.rate: float = rate
+
+    def filter(self, record: LogRecord) -> bool:
+        if not getattr(record, "sampled", False) or record.levelno >= logging.WARNING:
+            return True
+
+        return self.rate >= 1.0 or random.random() < self.rate
+
+
+def setup_logging(log_dir: str = PARENT_DIR, wager_sample_rate: float = DEFAULT_WAGER_SAMPLE_RATE) -> QueueListener:
     """
     Configures application-wide logging.
 
-    This sets up log directories, formatters, handlers, and attaches handlers
-    to named loggers such as 'account.auth', 'database', and the default root logger.
+    Every logger ('account.auth', 'database' and the root logger) hands its records to a shared QueueHandler, so
+    logging never blocks on disk. A single QueueListener thread writes them to account.log, database.log or app.log
+    depending on the logger the record came from.
+
+    :param log_dir: Directory the log files are written to.
+    :param wager_sample_rate: Fraction of per-wager info logs to keep.
+    :return: The running QueueListener.
     """
-    os.makedirs(PARENT_DIR, exist_ok=True)
+    global listener
+    shutdown_logging()
+
+    os.makedirs(log_dir, exist_ok=True)
 
     formatter: Formatter = Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
-    default_file_handler: FileHandler = FileHandler(os.path.join(PARENT_DIR, "app.log"))
+    default_file_handler: FileHandler = FileHandler(os.path.join(log_dir, "app.log"))
     default_file_handler.setFormatter(formatter)
     default_file_handler.setLevel(logging.DEBUG)
+    default_file_handler.addFilter(ExcludeFilter(ROUTED_LOGGERS))
 
-    basicConfig(level=logging.INFO, handlers=[default_file_handler])  # Set default logging to use file_handler
-
-    auth_handler: FileHandler = FileHandler(os.path.join(PARENT_DIR, "account.log"))
+    auth_handler: FileHandler = FileHandler(os.path.join(log_dir, "account.log"))
     auth_handler.setLevel(logging.DEBUG)
     auth_handler.setFormatter(formatter)
+    auth_handler.addFilter(Filter("account.auth"))
 
-    db_handler: FileHandler = FileHandler(os.path.join(PARENT_DIR, "database.log"))
+    db_handler: FileHandler = FileHandler(os.path.join(log_dir, "database.log"))
     db_handler.setLevel(logging.DEBUG)
     db_handler.setFormatter(formatter)
+    db_handler.addFilter(Filter("database"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler: QueueHandler = QueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(wager_sample_rate))
+
+    basicConfig(level=logging.INFO, handlers=[queue_handler], force=True)  # Root logger also goes through the queue
+
+    for name in ROUTED_LOGGERS:
+        routed_logger: logging.Logger = logging.getLogger(name)
+        for handler in list(routed_logger.handlers):
+            routed_logger.removeHandler(handler)
+        routed_logger.addHandler(queue_handler)
+        routed_logger.setLevel(logging.INFO)
+        routed_logger.propagate = False
+
+    listener = QueueListener(log_queue, default_file_handler, auth_handler, db_handler, respect_handler_level=True)
+    listener.start()
+    atexit.unregister(shutdown_logging)
+    atexit.register(shutdown_logging)
+    return listener
+
+
+def shutdown_logging() -> None:
+    """
+    Stops the writer thread after it has drained the queue and closes the log files. Safe to call more than once.
+
+    :return: None
+    """
+    global listener
 
-    auth_logger = logging.getLogger("account.auth")
-    auth_logger.addHandler(auth_handler)
-    auth_logger.setLevel(logging.INFO)
-    auth_logger.propagate = False
+    if listener is None:
+        return
 
-    db_logger = logging.getLogger("database")
-    db_logger.addHandler(db_handler)
-    db_logger.setLevel(logging.INFO)
-    db_logger.propagate = False
\ No newline at end of file
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    listener = None
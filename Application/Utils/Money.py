@@ -0,0 +1,167 @@
+import math
+import re
+from decimal import Decimal, ROUND_HALF_UP
+
+MONEY_PATTERN = re.compile(r"^\s*(-)?(\d*)(?:\.(\d{0,2}))?\s*$")
+
+
+def to_cents(value) -> Decimal:
+    """
+    Converts a plain number to an exact number of cents without going through float arithmetic.
+
+    :param value: An int, float or Decimal amount in dollars.
+    :return: The amount in cents as a Decimal (may be fractional).
+    """
+    if isinstance(value, int):
+        return Decimal(value * 100)
+
+    return Decimal(str(value)) * 100  # str() gives the shortest repr, so 1.11 becomes exactly 111 cents
+
+
+class Money:
+    """
+    An immutable dollar amount stored as a whole number of cents.
+
+    All arithmetic and comparisons are integer operations. Plain ints and floats are accepted on the other side of
+    comparisons so existing code such as balance < 1.00 keeps working. A float is compared as the amount it was written
+    as, the same conversion Money.of makes, so Money.parse("0.10") == 0.1 and Money(111) == 1.11. Decimals are not
+    compared: Money(10) cannot equal both 0.1 and Decimal("0.1"), which hash differently. Convert them with Money.of.
+
+    Attributes:
+        cents (int): The amount in cents.
+    """
+    __slots__ = ("cents",)
+
+    def __init__(self, cents: int = 0):
+        if not isinstance(cents, int):
+            raise TypeError("Money must be created from an integer number of cents")
+        object.__setattr__(self, "cents", cents)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Money is immutable")
+
+    @classmethod
+    def parse(cls, text: str) -> 'Money':
+        """
+        Parses user input such as "12", "12.5" or "12.50" into Money.
+
+        :param text: The string to parse.
+        :return: The parsed Money.
+        :raises ValueError: If text is not a number or has more than two decimal places.
+        """
+        match = MONEY_PATTERN.match(text)
+
+        if not match or not (match.group(2) or match.group(3)):
+            raise ValueError(f"{text} is not a valid amount of money")
+
+        sign, dollars, cents = match.groups()
+        total: int = int(dollars or 0) * 100 + int((cents or "").ljust(2, "0"))
+        return cls(-total if sign else total)
+
+    @classmethod
+    def of(cls, value) -> 'Money':
+        """
+        Coerces a Money, dollar amount or numeric string into Money.
+
+        :param value: Money, int, float, Decimal or str.
+        :return: The equivalent Money.
+        :raises ValueError: If value has more than two decimal places.
+        """
+        if isinstance(value, Money):
+            return value
+
+        if isinstance(value, str):
+            return cls.parse(value)
+
+        cents: Decimal = to_cents(value)
+
+        if cents != cents.to_integral_value():
+            raise ValueError(f"{value} has more than two decimal places")
+
+        return cls(int(cents))
+
+    def __add__(self, other) -> 'Money':
+        return Money(self.cents + Money.of(other).cents)
+
+    __radd__ = __add__
+
+    def __sub__(self, other) -> 'Money':
+        return Money(self.cents - Money.of(other).cents)
+
+    def __rsub__(self, other) -> 'Money':
+        return Money(Money.of(other).cents - self.cents)
+
+    def __neg__(self) -> 'Money':
+        return Money(-self.cents)
+
+    def __mul__(self, factor) -> 'Money':
+        """
+        Scales the amount, rounding half up to the nearest cent.
+
+        :param factor: An int, float or Decimal multiplier (e.g. a payout multiplier).
+        :return: The scaled Money.
+        """
+        if isinstance(factor, int):
+            return Money(self.cents * factor)
+
+        scaled: Decimal = Decimal(self.cents) * Decimal(str(factor))
+        return Money(int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_UP)))
+
+    __rmul__ = __mul__
+
+    def compare_key(self, other) -> Decimal | float | int | None:
+        """
+        Converts the other side of a comparison to cents, or None if it is not an int, float or Money.
+        """
+        if isinstance(other, Money):
+            return other.cents
+
+        if isinstance(other, int) and not isinstance(other, bool):
+            return other * 100
+
+        if isinstance(other, float):
+            return to_cents(other) if math.isfinite(other) else other  # Infinities and NaN compare as they are
+
+        return None
+
+    def __eq__(self, other) -> bool:
+        key = self.compare_key(other)
+        return NotImplemented if key is None else self.cents == key
+
+    def __lt__(self, other) -> bool:
+        key = self.compare_key(other)
+        return NotImplemented if key is None else self.cents < key
+
+    def __le__(self, other) -> bool:
+        key = self.compare_key(other)
+        return NotImplemented if key is None else self.cents <= key
+
+    def __gt__(self, other) -> bool:
+        key = self.compare_key(other)
+        return NotImplemented if key is None else self.cents > key
+
+    def __ge__(self, other) -> bool:
+        key = self.compare_key(other)
+        return NotImplemented if key is None else self.cents >= key
+
+    def __hash__(self) -> int:
+        # A float equals Money exactly when it is the float nearest the amount, and whole floats hash like ints, so
+        # hashing that float puts Money(110) with 1.1 and Money(500) with 5, as __eq__ requires
+        return hash(self.cents / 100)
+
+    def __bool__(self) -> bool:
+        return self.cents != 0
+
+    def __float__(self) -> float:
+        return self.cents / 100
+
+    def __str__(self) -> str:
+        sign: str = "-" if self.cents < 0 else ""
+        dollars, cents = divmod(abs(self.cents), 100)
+        return f"{sign}{dollars}.{cents:02d}"
+
+    def __repr__(self) -> str:
+        return f"Money({self})"
+
+    def __reduce__(self):
+        return Money, (self.cents,)
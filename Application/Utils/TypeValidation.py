@@ -1,19 +1,24 @@
-def validate_float(user_input: str, min_value=1.00):
+from Application.Utils.Money import Money
+
+
+def validate_float(user_input: str, min_value=Money(100)):
     """
-    Validates that the given input string represents a float greater than a minimum value.
+    Validates that the given input string represents a monetary amount greater than a minimum value.
+
+    The input is parsed straight into integer cents, so amounts with more than two decimal places are rejected.
 
     :param user_input: String inputted by user
-    :param min_value: The minimum acceptable float value. Defaults to 1.00.
-    :return: True if the input is a valid float greater than min_value, or if no minimum is specified. False if the
-             input is not a valid float or does not meet the minimum requirement.
+    :param min_value: The minimum acceptable amount, in any form Money.of accepts. Defaults to 1.00.
+    :return: True if the input is a valid amount greater than min_value, or if no minimum is specified. False if the
+             input is not a valid amount or does not meet the minimum requirement.
     """
     if user_input == "":
         return True
 
     try:
-        float_val: float = float(user_input)
+        amount: Money = Money.parse(user_input)
         if min_value:
-            return float_val >= min_value
+            return amount >= Money.of(min_value)
         return True
 
     except ValueError:
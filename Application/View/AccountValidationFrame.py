@@ -57,8 +57,8 @@ class AccountValidationFrame(BaseFrame):
         self.answer_two_entry.place(relx=0.5, rely=0.5, anchor="center")
 
     def validate_security_answers(self) -> None:
-        if (self.answer_one_entry.get() == self.account.security_answer_one
-                and self.answer_two_entry.get() == self.account.security_answer_two):
+        if self.controller.account_controller.verify_security_answers(self.answer_one_entry.get(),
+                                                                      self.answer_two_entry.get()):
             self.controller.account_controller.email_reset_token()
 
             # Clear security prompts
@@ -79,7 +79,7 @@ class AccountValidationFrame(BaseFrame):
         self.auth_entry.place(relx=0.5, rely=0.5, anchor="center")
 
     def validate_auth_token(self) -> None:
-        if self.auth_entry.get() == str(self.account.reset_token):
+        if self.controller.account_controller.is_token_valid(self.auth_entry.get()):
             self.controller.render_frame(PasswordResetFrame, return_value=False)
         else:
             self.error_label.configure(text="Incorrect auth token", foreground="red")
@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from Application.Controller.MainWindow import MainWindow
 
+POLL_INTERVAL_MS: int = 25
+
 
 class BaseFrame(ttk.Frame, ABC):
     """
@@ -22,6 +25,22 @@ class BaseFrame(ttk.Frame, ABC):
         self.error_label: ttk.Label = ttk.Label(self, foreground="red")
         self.success_label: ttk.Label = ttk.Label(self, foreground="green")
 
+    def poll_future(self, future: Future, callback: Callable[[Future], None]) -> None:
+        """
+        Polls a Future from the Tk event loop and calls callback on the UI thread once it is done.
+
+        :param future: The Future to wait on.
+        :param callback: Called with the finished Future.
+        :return: None
+        """
+        if not self.winfo_exists():  # Frame was replaced while the work was running
+            return
+
+        if future.done():
+            callback(future)
+        else:
+            self.after(POLL_INTERVAL_MS, self.poll_future, future, callback)
+
     @abstractmethod
     def place_elements(self):
         pass
\ No newline at end of file
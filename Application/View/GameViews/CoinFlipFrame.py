@@ -6,6 +6,7 @@ from PIL import Image, ImageTk
 from PIL.Image import Image as PILImage
 
 from Application.Model.Games.GameOutcome import GameOutcome
+from Application.Utils.Money import Money
 from Application.Utils.TypeValidation import validate_float
 from Application.View.BaseFrame import BaseFrame
 
@@ -57,7 +58,7 @@ class CoinFlipFrame(BaseFrame):
         """
         self.coin_selected("heads")
 
-    def handle_outcome(self, outcome: GameOutcome, wager: float) -> None:
+    def handle_outcome(self, outcome: GameOutcome, wager: Money) -> None:
         """
         Displays the result of the coin flip game to the user based on the outcome.
         :param outcome: The result of the coin flip (WIN, LOSS, or WITHDRAW_ERROR).
@@ -88,11 +89,11 @@ class CoinFlipFrame(BaseFrame):
         self.prompt_label.place_forget()
 
         try:
-            wager: float = float(self.wager_entry.get())
+            wager: Money = Money.parse(self.wager_entry.get())
             outcome: GameOutcome = self.controller.game_controller.cf_controller.handle_outcome(guess, wager)
 
             self.handle_outcome(outcome, wager)
 
         except ValueError:
             tkinter.messagebox.showerror(message="An error has occurred. Try again")
-            logging.error("Error casting wager to float in CoinFlip")
+            logging.error("Error parsing wager in CoinFlip")
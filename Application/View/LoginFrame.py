@@ -1,3 +1,5 @@
+import math
+from concurrent.futures import Future
 from tkinter import ttk
 from typing import TYPE_CHECKING
 from Application.Utils.PlaceholderEntry import PlaceholderEntry as pEntry
@@ -28,11 +30,22 @@ class LoginFrame(BaseFrame):
         username: str = self.username_entry.get()
         password: str = self.password_entry.get()
 
-        account: bool = self.controller.account_controller.login(username, password)
+        self.login_button.state(["disabled"])
+        future: Future = self.controller.account_controller.login_async(username, password)
+        self.poll_future(future, self.handle_login_result)
+
+    def handle_login_result(self, future: Future) -> None:
+        self.login_button.state(["!disabled"])
+        account: bool = self.controller.account_controller.finish_login(future)
 
         if account:
             self.controller.render_frame(MainMenuFrame)
 
+        elif retry_after := self.controller.account_controller.get_login_retry_after(self.username_entry.get()):
+            self.error_label.configure(text=f"Too many failed attempts. Try again in {math.ceil(retry_after / 60)} "
+                                            f"minute(s)")
+            self.error_label.place(relx=0.5, rely=0.5, anchor="center")
+
         else:
             self.error_label.configure(text="Invalid username or password")
             self.error_label.place(relx=0.5, rely=0.5, anchor="center")
@@ -44,10 +44,10 @@ class MainMenuFrame(BaseFrame):
 
     def logout_user(self) -> None:
         """
-        Sets account_controller.account to None then transitions to EntryFrame
+        Ends the session and forgets the account, then transitions to EntryFrame
         :return: None
         """
         from Application.View.EntryFrame import EntryFrame
 
-        self.controller.account_controller.account = None
+        self.controller.account_controller.logout()
         self.controller.render_frame(EntryFrame, show_menu=False)
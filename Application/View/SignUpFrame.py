@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
@@ -133,7 +134,19 @@ class SignUpFrame(BaseFrame):
         questions: list[str] = [self.security_question_one.get().strip(), self.security_entry_one.get().strip(),
                                 self.security_question_two.get().strip(), self.security_entry_two.get().strip()]
 
-        is_valid, error_message = self.controller.account_controller.create_account(username, password, email, questions)
+        self.signup.state(["disabled"])
+        future: Future = self.controller.account_controller.create_account_async(username, password, email, questions)
+        self.poll_future(future, self.handle_signup_result)
+
+    def handle_signup_result(self, future: Future) -> None:
+        """
+        Finishes the sign-up once the password hash is ready.
+
+        :param future: The Future returned by AccountController.create_account_async
+        :return: None
+        """
+        self.signup.state(["!disabled"])
+        is_valid, error_message = self.controller.account_controller.finish_create_account(future)
 
         if not is_valid:
             self.error_label.config(text=error_message)
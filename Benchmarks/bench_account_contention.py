@@ -0,0 +1,68 @@
+"""
+Stress test for optimistic locking: many threads, each with its own session, hammer a single account.
+
+Checks that the final balance is exact and reports how often a commit lost the version race and had to be retried.
+
+Run with: python -m Benchmarks.bench_account_contention [thread_count] [wagers_per_thread]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+
+DEFAULT_THREADS: int = 16
+DEFAULT_WAGERS: int = 200
+
+
+def main() -> None:
+    thread_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_THREADS
+    wagers: int = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WAGERS
+
+    with tempfile.TemporaryDirectory() as directory:
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        session = session_factory()
+        session.add(UserAccount("shared", "hash", 50.0, "shared@example.com", ["q1", "a1", "q2", "a2"]))
+        session.commit()
+
+        managers: list[AccountManager] = [AccountManager(session=session_factory()) for _ in range(thread_count)]
+
+        def play(manager: AccountManager) -> None:
+            account: UserAccount = manager.session.query(UserAccount).filter_by(username="shared").one()
+            for i in range(wagers):
+                if i % 2:
+                    manager.settle_debit(account, Money(100))
+                else:
+                    manager.add_and_save_account(account, Money(300))
+
+        threads: list[threading.Thread] = [threading.Thread(target=play, args=(m,)) for m in managers]
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed: float = time.perf_counter() - start
+
+        debits: int = wagers // 2
+        expected: Money = Money(5000 + thread_count * ((wagers - debits) * 300 - debits * 100))
+        session.expire_all()
+        actual: Money = session.query(UserAccount).filter_by(username="shared").one().balance
+
+        total: int = thread_count * wagers
+        conflicts: int = sum(m.journal.version_conflicts + m.version_conflicts for m in managers)
+        print(f"{total:,} wagers from {thread_count} threads in {elapsed:.2f}s ({total / elapsed:,.0f} wagers/s)")
+        print(f"version conflicts retried: {conflicts:,} ({conflicts / total:.1%} of wagers)")
+        print(f"final balance {actual} (expected {expected}) -> {'exact' if actual == expected else 'MISMATCH'}")
+
+        for manager in managers:
+            manager.session.close()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Seeds a throwaway database with accounts and measures indexed email and reset-token lookup latency.
+
+Run with: python -m Benchmarks.bench_account_lookup [account_count]
+"""
+import datetime
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import insert
+
+from Application.Model.Accounts.AccountManager import AccountManager, hash_password
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+
+DEFAULT_ACCOUNTS: int = 1_000_000
+BATCH_SIZE: int = 50_000
+LOOKUPS: int = 2_000
+
+
+def seed(manager: AccountManager, count: int) -> list[uuid.UUID]:
+    """
+    Bulk inserts count accounts sharing one password hash, every tenth one holding a live reset token.
+
+    :return: The reset tokens that were issued.
+    """
+    password: str = hash_password("BenchPassword1!")
+    expiration: datetime.datetime = datetime.datetime.now(datetime.UTC) + datetime.timedelta(hours=1)
+    tokens: list[uuid.UUID] = []
+
+    for start in range(0, count, BATCH_SIZE):
+        rows: list[dict] = []
+        for i in range(start, min(start + BATCH_SIZE, count)):
+            token: uuid.UUID | None = uuid.uuid4() if i % 10 == 0 else None
+            if token:
+                tokens.append(token)
+
+            rows.append({"username": f"user_{i}", "password": password, "balance": 5000,
+                         "email": f"User_{i}@Example.com", "email_normalized": f"user_{i}@example.com",
+                         "security_question_one": "q1", "security_answer_one": "a1",
+                         "security_question_two": "q2", "security_answer_two": "a2",
+                         "reset_token": token, "reset_token_expiration": expiration if token else None})
+
+        manager.session.execute(insert(UserAccount), rows)
+        manager.session.commit()
+
+    return tokens
+
+
+def time_lookups(lookup, keys: list) -> tuple[float, float]:
+    """
+    :return: (mean latency in microseconds, p99 latency in microseconds)
+    """
+    samples: list[float] = []
+
+    for key in keys:
+        start: float = time.perf_counter()
+        assert lookup(key) is not None
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    samples.sort()
+    return statistics.fmean(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+
+    with tempfile.TemporaryDirectory() as directory:
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        manager: AccountManager = AccountManager(session=session)
+
+        start: float = time.perf_counter()
+        tokens: list[uuid.UUID] = seed(manager, count)
+        print(f"Seeded {count:,} accounts in {time.perf_counter() - start:.1f}s")
+
+        emails: list[str] = [f"USER_{random.randrange(count)}@example.com" for _ in range(LOOKUPS)]
+        sampled_tokens: list[str] = [str(random.choice(tokens)) for _ in range(LOOKUPS)]
+
+        for name, lookup, keys in (("email", manager.get_account_by_email, emails),
+                                   ("reset token", manager.get_account_by_reset_token, sampled_tokens)):
+            manager.session.expunge_all()
+            mean, p99 = time_lookups(lookup, keys)
+            print(f"{name:<12} mean {mean:8.1f} us   p99 {p99:8.1f} us")
+
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
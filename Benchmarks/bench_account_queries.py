@@ -0,0 +1,73 @@
+"""
+Measures queries per second for the hot account lookups, built per call as legacy ORM queries versus the pre-built
+statements in AccountQueries.
+
+Run with: python -m Benchmarks.bench_account_queries [account_count]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import insert, or_
+
+from Application.Model.Accounts.AccountQueries import find_by_email, find_by_username, username_or_email_taken
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+
+DEFAULT_ACCOUNTS: int = 100_000
+BATCH_SIZE: int = 50_000
+LOOKUPS: int = 20_000
+
+
+def seed(session, count: int) -> None:
+    for start in range(0, count, BATCH_SIZE):
+        session.execute(insert(UserAccount), [{"username": f"user_{i}", "password": "hash", "balance": 5000,
+                                               "email": f"user_{i}@example.com",
+                                               "email_normalized": f"user_{i}@example.com",
+                                               "security_question_one": "q1", "security_answer_one": "a1",
+                                               "security_question_two": "q2", "security_answer_two": "a2"}
+                                              for i in range(start, min(start + BATCH_SIZE, count))])
+        session.commit()
+
+
+def queries_per_second(session, lookup, keys: list) -> float:
+    session.expunge_all()
+    start: float = time.perf_counter()
+
+    for key in keys:
+        lookup(key)
+
+    return len(keys) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ACCOUNTS
+
+    with tempfile.TemporaryDirectory() as directory:
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        seed(session, count)
+        ids: list[int] = [random.randrange(count) for _ in range(LOOKUPS)]
+
+        paths = (
+            ("username", "orm query", lambda i: session.query(UserAccount).filter_by(username=f"user_{i}").first()),
+            ("username", "pre-built", lambda i: find_by_username(session, f"user_{i}")),
+            ("email", "orm query",
+             lambda i: session.query(UserAccount).filter_by(email_normalized=f"user_{i}@example.com").first()),
+            ("email", "pre-built", lambda i: find_by_email(session, f"user_{i}@example.com")),
+            ("exists", "orm query",
+             lambda i: session.query(UserAccount).filter(or_(UserAccount.username == f"user_{i}",
+                                                             UserAccount.email_normalized == f"new_{i}@example.com")
+                                                         ).first() is not None),
+            ("exists", "pre-built", lambda i: username_or_email_taken(session, f"user_{i}", f"new_{i}@example.com")),
+        )
+
+        for query, path, lookup in paths:
+            print(f"{query:<9} {path:<10} {queries_per_second(session, lookup, ids):10,.0f} queries/s")
+
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Load test for the account server: 50 simulated casino clients settling wagers through one shared writer.
+
+Run with: python -m Benchmarks.bench_account_server [client_count] [wagers_per_client]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from Application.Model.Accounts.AccountManager import AccountManager, hash_password
+from Application.Model.Accounts.AccountServer import AccountServer
+from Application.Model.Accounts.RemoteAccountManager import RemoteAccountManager
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+
+DEFAULT_CLIENTS: int = 50
+DEFAULT_WAGERS: int = 200
+PASSWORD: str = "BenchPassword1!"
+
+
+def run_client(address: str, username: str, wagers: int, barrier: threading.Barrier) -> None:
+    client: RemoteAccountManager = RemoteAccountManager(address)
+    account: UserAccount = client.get_account(username, PASSWORD)
+    barrier.wait()
+
+    for i in range(wagers):
+        if i % 2:
+            client.settle_debit(account, Money(100))
+        else:
+            client.add_and_save_account(account, Money(100))
+
+    client.close()
+
+
+def main() -> None:
+    clients: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CLIENTS
+    wagers: int = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_WAGERS
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)  # Keeps the wager journal inside the throwaway directory
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        manager: AccountManager = AccountManager(session=session, durability=DurabilityMode.GROUP)
+
+        password_hash: str = hash_password(PASSWORD, rounds=4)
+        for i in range(clients):
+            session.add(UserAccount(f"kiosk_{i}", password_hash, 50.0, f"kiosk_{i}@example.com",
+                                    ["q1", "a1", "q2", "a2"]))
+        session.commit()
+
+        server: AccountServer = AccountServer(manager, port=0)
+        server_thread: threading.Thread = threading.Thread(target=asyncio.run, args=(server.serve(),))
+        server_thread.start()
+        server.started.wait()
+        address: str = f"{server.address[0]}:{server.address[1]}"
+
+        barrier: threading.Barrier = threading.Barrier(clients + 1)
+        threads: list[threading.Thread] = [threading.Thread(target=run_client,
+                                                            args=(address, f"kiosk_{i}", wagers, barrier))
+                                           for i in range(clients)]
+        for thread in threads:
+            thread.start()
+
+        barrier.wait()
+        start: float = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed: float = time.perf_counter() - start
+
+        server.stop()
+        server_thread.join()
+        session.close()
+
+        total: int = clients * wagers
+        print(f"{clients} clients settled {total:,} wagers in {elapsed:.2f}s ({total / elapsed:,.0f} writes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compares blocking logins against the AuthExecutor pool.
+
+Simulates a Tk-style event loop that wants to tick every TICK_MS and reports logins per second together with the
+longest gap between ticks (the UI stall a user would see).
+
+Run with: python -m Benchmarks.bench_auth_pool
+"""
+import time
+
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.AuthExecutor import AuthExecutor
+from Application.Model.Accounts.db import init_db
+
+LOGINS: int = 16
+TICK_MS: float = 10.0
+TEST_QUESTIONS: list[str] = ["Question one?", "Answer one", "Question two?", "Answer two"]
+
+
+def seed(manager: AccountManager) -> None:
+    for i in range(LOGINS):
+        manager.create_account(f"bench_user_{i}", "BenchPassword1!", f"bench_{i}@email.com", TEST_QUESTIONS)
+
+
+def run_blocking(manager: AccountManager) -> tuple[float, float]:
+    """
+    Logs every user in on the loop thread, one after another.
+
+    :return: (logins per second, worst stall in ms)
+    """
+    worst_stall: float = 0.0
+    last_tick: float = time.perf_counter()
+    start: float = last_tick
+
+    for i in range(LOGINS):
+        manager.get_account(f"bench_user_{i}", "BenchPassword1!")
+        now: float = time.perf_counter()
+        worst_stall = max(worst_stall, (now - last_tick) * 1000)
+        last_tick = now
+
+    return LOGINS / (time.perf_counter() - start), worst_stall
+
+
+def run_pooled(manager: AccountManager) -> tuple[float, float]:
+    """
+    Submits every login to the auth pool and polls the futures from the loop, as the frames do.
+
+    :return: (logins per second, worst stall in ms)
+    """
+    worst_stall: float = 0.0
+    start: float = time.perf_counter()
+    last_tick: float = start
+
+    pending = [manager.get_account_async(f"bench_user_{i}", "BenchPassword1!") for i in range(LOGINS)]
+
+    while pending:
+        pending = [future for future in pending if not future.done()]
+        time.sleep(TICK_MS / 1000)
+        now: float = time.perf_counter()
+        worst_stall = max(worst_stall, (now - last_tick) * 1000 - TICK_MS)
+        last_tick = now
+
+    return LOGINS / (time.perf_counter() - start), worst_stall
+
+
+def main() -> None:
+    manager: AccountManager = AccountManager(session=init_db(in_memory=True), auth_executor=AuthExecutor(max_workers=4))
+    seed(manager)
+
+    blocking_rate, blocking_stall = run_blocking(manager)
+    pooled_rate, pooled_stall = run_pooled(manager)
+
+    print(f"{'mode':<10}{'logins/s':>12}{'worst stall (ms)':>20}")
+    print(f"{'blocking':<10}{blocking_rate:>12.2f}{blocking_stall:>20.1f}")
+    print(f"{'pooled':<10}{pooled_rate:>12.2f}{pooled_stall:>20.1f}")
+
+    manager.auth_executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Writes a synthetic partner CSV and measures BulkAccountController import and export throughput.
+
+Run with: python -m Benchmarks.bench_bulk_import [row_count]
+"""
+import csv
+import os
+import sys
+import tempfile
+
+from Application.Controller.BulkAccountController import BulkAccountController, CSV_FIELDS
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.db import get_session_factory
+
+DEFAULT_ROWS: int = 20_000
+
+
+def write_partner_file(path: str, count: int) -> None:
+    with open(path, mode='w', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows({"username": f"partner_{i}", "password": "PartnerPassword1!", "balance": "50.00",
+                          "email": f"partner_{i}@example.com", "security_question_one": "q1",
+                          "security_answer_one": "a1", "security_question_two": "q2", "security_answer_two": "a2"}
+                         for i in range(count))
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+
+    with tempfile.TemporaryDirectory() as directory:
+        source: str = os.path.join(directory, "partner.csv")
+        write_partner_file(source, count)
+
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        bulk: BulkAccountController = BulkAccountController(AccountManager(session=session))
+
+        result: dict = bulk.import_csv(source)
+        print(f"import  {result['imported']:,} rows in {result['seconds']:.1f}s "
+              f"({result['rows_per_second']:,.0f} rows/s)")
+
+        bulk.export_csv(os.path.join(directory, "export.csv"))
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compares get_valid_categories' old linear if/elif filter with CategoryIndex threshold, top-K and random queries, and
+times a full index build against an incremental sync after a few counts change.
+
+Run with: python -m Benchmarks.bench_category_index [categories]
+"""
+import random
+import sys
+import time
+
+from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.CategoryIndex import CategoryIndex
+
+DEFAULT_CATEGORIES: int = 10_000
+QUERIES: int = 1_000
+MIN_QUESTIONS: int = 50
+
+
+def linear_filter(categories: list[Category], difficulty: str) -> list[Category]:
+    valid_categories: list[Category] = []
+
+    for cat in categories:
+        if difficulty == "easy" and cat.easy_num >= MIN_QUESTIONS:
+            valid_categories.append(cat)
+        elif difficulty == "medium" and cat.med_num >= MIN_QUESTIONS:
+            valid_categories.append(cat)
+        elif difficulty == "hard" and cat.hard_num >= MIN_QUESTIONS:
+            valid_categories.append(cat)
+
+    return valid_categories
+
+
+def per_query_us(function, queries: int = QUERIES) -> float:
+    start: float = time.perf_counter()
+    for _ in range(queries):
+        function()
+    return (time.perf_counter() - start) / queries * 1_000_000
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CATEGORIES
+    rng: random.Random = random.Random(1)
+    categories: list[Category] = [Category(f"Category {i}", i, rng.randrange(100), rng.randrange(100),
+                                           rng.randrange(100)) for i in range(count)]
+
+    start: float = time.perf_counter()
+    index: CategoryIndex = CategoryIndex(categories)
+    build_ms: float = (time.perf_counter() - start) * 1000
+
+    changed: list[Category] = list(categories)
+    for position in rng.sample(range(count), 10):
+        old: Category = changed[position]
+        changed[position] = Category(old.name, old.id, old.easy_num + 1, old.med_num, old.hard_num)
+    copy: CategoryIndex = index.copy()
+    start = time.perf_counter()
+    copy.sync(changed)
+    sync_ms: float = (time.perf_counter() - start) * 1000
+
+    print(f"{count} categories")
+    print(f"build           {build_ms:9.2f} ms   sync of 10 changes {sync_ms:7.2f} ms")
+    print(f"linear filter   {per_query_us(lambda: linear_filter(categories, 'hard')):9.1f} us")
+    print(f"index at_least  {per_query_us(lambda: index.at_least('hard', MIN_QUESTIONS)):9.1f} us")
+    print(f"index count     {per_query_us(lambda: index.count_at_least('hard', MIN_QUESTIONS)):9.2f} us")
+    print(f"index top 10    {per_query_us(lambda: index.top('hard', 10)):9.2f} us")
+    print(f"index random    {per_query_us(lambda: index.random_eligible('hard', MIN_QUESTIONS, rng)):9.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Shows that rebuilding a balance from the ledger costs O(tail) once a snapshot exists, not O(history).
+
+Run with: python -m Benchmarks.bench_ledger_replay [history_length]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from Application.Model.Accounts.Ledger import compact_ledger, compute_balance, record_entries
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+
+DEFAULT_HISTORY: int = 1_000_000
+BATCH_SIZE: int = 50_000
+TAIL: int = 50
+REPEATS: int = 20
+
+
+def time_replay(session, username: str) -> float:
+    """
+    :return: Mean milliseconds per compute_balance call.
+    """
+    start: float = time.perf_counter()
+    for _ in range(REPEATS):
+        compute_balance(session, username)
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main() -> None:
+    history: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_HISTORY
+
+    with tempfile.TemporaryDirectory() as directory:
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+
+        for start in range(0, history, BATCH_SIZE):
+            record_entries(session, [{"username": f"player_{i % 100}", "delta": Money(100)}
+                                     for i in range(start, min(start + BATCH_SIZE, history))])
+        session.commit()
+
+        print(f"no snapshot     {time_replay(session, 'player_7'):8.2f} ms  ({history // 100:,} entries replayed)")
+
+        compact_ledger(session, tail_length=1)
+        record_entries(session, [{"username": "player_7", "delta": Money(100)} for _ in range(TAIL)])
+        session.commit()
+
+        print(f"snapshot + tail {time_replay(session, 'player_7'):8.2f} ms  ({TAIL} entries replayed)")
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Simulates credential stuffing (a few clients cycling through many usernames with leaked passwords) and reports how
+much bcrypt work reaches the CPU with and without the login rate limiter.
+
+Run with: python -m Benchmarks.bench_login_stuffing [attempts]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from Application.Model.Accounts import AccountManager as account_manager_module
+from Application.Model.Accounts.AccountManager import AccountManager, load_or_calibrate_bcrypt_cost
+from Application.Model.Accounts.LoginRateLimiter import LoginRateLimiter
+from Application.Model.Accounts.db import get_session_factory
+
+DEFAULT_ATTEMPTS: int = 200
+USERNAMES: int = 50
+CLIENTS: int = 4
+UNLIMITED: int = 10 ** 9
+
+
+def run(attempts: int, rate_limiter: LoginRateLimiter) -> tuple[int, float, float]:
+    """
+    :return: (bcrypt verifications, CPU seconds, wall seconds)
+    """
+    verifications: int = 0
+    verify = account_manager_module.verify_password
+
+    def counting_verify(password: str, hashed: str) -> bool:
+        nonlocal verifications
+        verifications += 1
+        return verify(password, hashed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        manager: AccountManager = AccountManager(session=session, rate_limiter=rate_limiter)
+        for i in range(0, USERNAMES, 2):  # Half of the stuffed usernames exist
+            manager.create_account(f"user_{i}", "RealPassword1!", f"user_{i}@example.com", ["q1", "a1", "q2", "a2"])
+
+        account_manager_module.verify_password = counting_verify
+        cpu_start: float = time.process_time()
+        wall_start: float = time.perf_counter()
+
+        try:
+            for i in range(attempts):
+                manager.get_account(f"user_{i % USERNAMES}", f"leaked_{i}", client=f"10.0.0.{i % CLIENTS}")
+        finally:
+            account_manager_module.verify_password = verify
+
+        result: tuple[int, float, float] = (verifications, time.process_time() - cpu_start,
+                                            time.perf_counter() - wall_start)
+        manager.close()
+        session.close()
+
+    return result
+
+
+def main() -> None:
+    attempts: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ATTEMPTS
+    logging.disable(logging.WARNING)  # Every refused attempt logs a warning
+    load_or_calibrate_bcrypt_cost()
+
+    for name, limiter in (("no limiter", LoginRateLimiter(UNLIMITED, UNLIMITED)), ("rate limited", LoginRateLimiter())):
+        verifications, cpu_s, wall_s = run(attempts, limiter)
+        print(f"{name:<13} {attempts} attempts  {verifications:5d} bcrypt verifies  "
+              f"cpu {cpu_s:6.2f}s  wall {wall_s:6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
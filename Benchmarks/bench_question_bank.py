@@ -0,0 +1,65 @@
+"""
+Measures how long TriviaGame.create_questions takes to start a game when it requests questions live from a local
+stub of OpenTDB that adds a fixed delay to every request, and when it takes them from a stocked QuestionBank.
+
+Run with: python -m Benchmarks.bench_question_bank [delay_ms]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from Application.Model.Accounts.db import dispose_engines, get_session_factory
+from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.QuestionBank import QuestionBank
+from Application.Model.Games.TriviaGame.TriviaGame import TriviaGame, create_opentdb_client, set_opentdb_client
+from Application.Utils.HttpClient import HttpClient
+from Tests.OpenTDBStub import OpenTDBStub, QUESTIONS_PER_KEY
+
+DEFAULT_DELAY_MS: int = 80  # Roughly one round trip to opentdb.com from Europe
+GAMES: int = QUESTIONS_PER_KEY // 10
+CATEGORY: Category = Category("Category 9", 9, 100, 100, 100)
+
+
+def time_games(game: TriviaGame) -> list[float]:
+    """
+    :return: Milliseconds each of GAMES create_questions calls took.
+    """
+    game.set_category(CATEGORY)
+    timings: list[float] = []
+
+    for _ in range(GAMES):
+        start: float = time.perf_counter()
+        assert len(game.create_questions()) == 10
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def report(label: str, timings: list[float]) -> None:
+    print(f"{label:<6} median {statistics.median(timings):7.2f} ms  max {max(timings):7.2f} ms  over {GAMES} games")
+
+
+def main() -> None:
+    delay_s: float = (int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DELAY_MS) / 1000
+
+    with tempfile.TemporaryDirectory() as directory, OpenTDBStub(delay_s) as stub:
+        client: HttpClient = create_opentdb_client(stub.base_url)
+        set_opentdb_client(client)
+        report("live", time_games(TriviaGame("boolean", "easy")))
+
+        db_url: str = f"sqlite:///{os.path.join(directory, 'bench.db')}"
+        bank: QuestionBank = QuestionBank(client, session_factory=get_session_factory(db_url),
+                                          watermark=QUESTIONS_PER_KEY, request_interval_s=0)
+        with bank.session_factory() as session:
+            bank.top_up(session, (CATEGORY.id, "easy", "boolean"))  # No refills run, so the stock lasts GAMES games
+
+        report("bank", time_games(TriviaGame("boolean", "easy", bank)))
+
+        set_opentdb_client(None)
+        dispose_engines()
+
+
+if __name__ == "__main__":
+    main()
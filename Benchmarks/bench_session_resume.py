@@ -0,0 +1,53 @@
+"""
+Compares logging back in with a password (one bcrypt verification) against resuming with a session token.
+
+Run with: python -m Benchmarks.bench_session_resume [logins]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from Application.Model.Accounts.AccountManager import AccountManager, load_or_calibrate_bcrypt_cost
+from Application.Model.Accounts.db import get_session_factory
+
+DEFAULT_LOGINS: int = 50
+PASSWORD: str = "BenchPassword1!"
+
+
+def time_logins(login, logins: int) -> float:
+    """
+    :return: Mean latency in microseconds.
+    """
+    samples: list[float] = []
+
+    for _ in range(logins):
+        start: float = time.perf_counter()
+        assert login() is not None
+        samples.append((time.perf_counter() - start) * 1_000_000)
+
+    return statistics.fmean(samples)
+
+
+def main() -> None:
+    logins: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_LOGINS
+    load_or_calibrate_bcrypt_cost()
+
+    with tempfile.TemporaryDirectory() as directory:
+        session = get_session_factory(f"sqlite:///{os.path.join(directory, 'bench.db')}")()
+        manager: AccountManager = AccountManager(session=session)
+        account = manager.create_account("bench_user", PASSWORD, "bench@example.com", ["q1", "a1", "q2", "a2"])
+        token: str = manager.issue_session_token(account)
+
+        password_us: float = time_logins(lambda: manager.get_account("bench_user", PASSWORD), logins)
+        token_us: float = time_logins(lambda: manager.get_account_by_session_token(token), logins)
+
+        print(f"password login  mean {password_us:12.1f} us")
+        print(f"session token   mean {token_us:12.1f} us   ({password_us / token_us:,.0f}x faster)")
+        manager.close()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
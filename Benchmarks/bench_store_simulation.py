@@ -0,0 +1,66 @@
+"""
+Simulates many players placing wagers and reports wagers per minute for each account store.
+
+Run with: python -m Benchmarks.bench_store_simulation [wager_count]
+"""
+import logging
+import random
+import sys
+import time
+
+from Application.Model.Accounts.AccountManager import STARTING_BALANCE, AccountManager
+from Application.Model.Accounts.AccountStore import AccountStore
+from Application.Model.Accounts.InMemoryAccountStore import InMemoryAccountStore
+from Application.Model.Accounts.SqlAccountStore import SqlAccountStore
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode
+from Application.Model.Accounts.db import init_db
+from Application.Utils.Money import Money
+
+DEFAULT_WAGERS: int = 200_000
+SQL_WAGERS: int = 2_000  # Every SQL commit expires the loaded players, so this store gets a much shorter run
+PLAYERS: int = 1_000
+QUESTIONS: list[str] = ["q1", "a1", "q2", "a2"]
+
+
+def simulate(store: AccountStore, count: int) -> float:
+    """
+    Players bet a random stake: the stake is settled as a debit and half of the bets pay out double.
+
+    :return: Wagers settled per minute.
+    """
+    manager: AccountManager = AccountManager(store=store)
+    players: list[UserAccount] = []
+    for i in range(PLAYERS):
+        player: UserAccount = UserAccount(f"player_{i}", "hash", STARTING_BALANCE, f"player_{i}@example.com",
+                                          QUESTIONS)
+        store.add_account(player)
+        players.append(player)
+
+    rng: random.Random = random.Random(7)
+    start: float = time.perf_counter()
+
+    for _ in range(count):
+        player = players[rng.randrange(PLAYERS)]
+        stake: Money = Money(rng.randrange(1, 500))
+
+        if manager.settle_debit(player, stake) and rng.random() < 0.5:
+            manager.add_and_save_account(player, stake * 2)
+
+    manager.flush_wagers()
+    elapsed: float = time.perf_counter() - start
+    manager.close()
+    return count / elapsed * 60
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WAGERS
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'in-memory':<14} {simulate(InMemoryAccountStore(), count):14,.0f} wagers/min")
+    sql_store: SqlAccountStore = SqlAccountStore(init_db(in_memory=True), DurabilityMode.SYNC)
+    print(f"{'sql (sync)':<14} {simulate(sql_store, min(count, SQL_WAGERS)):14,.0f} wagers/min")
+
+
+if __name__ == "__main__":
+    main()
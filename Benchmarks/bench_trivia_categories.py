@@ -0,0 +1,90 @@
+"""
+Measures the cold-start latency of TriviaGame.get_possible_categories against a local stub of OpenTDB that adds a
+fixed delay to every request, with the count requests run one at a time and concurrently. Then measures calls served
+from the cache, both while it is fresh and once it has gone stale and refreshes in the background.
+
+Run with: python -m Benchmarks.bench_trivia_categories [delay_ms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from Application.Model.Games.TriviaGame import TriviaGame as trivia_module
+from Application.Model.Games.TriviaGame.TriviaGame import (CATEGORY_TTL_S, COUNT_FETCH_CONCURRENCY, TriviaGame,
+                                                           category_cacher, create_opentdb_client,
+                                                           get_category_cache_stats, set_opentdb_client)
+from Application.Utils.HttpClient import HttpClient
+from Tests.OpenTDBStub import CATEGORY_COUNT, OpenTDBStub
+
+DEFAULT_DELAY_MS: int = 80  # Roughly one round trip to opentdb.com from Europe
+WARM_CALLS: int = 10_000
+
+
+def cold_start(base_url: str, max_workers: int) -> tuple[float, dict]:
+    """
+    :return: (seconds taken by get_possible_categories with no category cache, the client's stats)
+    """
+    if os.path.exists(trivia_module.CACHE_FILE_PATH):
+        os.remove(trivia_module.CACHE_FILE_PATH)
+
+    client: HttpClient = create_opentdb_client(base_url)
+    set_opentdb_client(client)
+
+    start: float = time.perf_counter()
+    categories = TriviaGame.get_possible_categories(max_workers=max_workers)
+    elapsed: float = time.perf_counter() - start
+
+    assert len(categories) == CATEGORY_COUNT
+    return elapsed, client.stats()
+
+
+def warm_calls() -> float:
+    """
+    :return: Average microseconds per get_possible_categories call served from the cache.
+    """
+    start: float = time.perf_counter()
+    for _ in range(WARM_CALLS):
+        TriviaGame.get_possible_categories()
+    return (time.perf_counter() - start) / WARM_CALLS * 1_000_000
+
+
+def stale_call() -> tuple[float, float]:
+    """
+    :return: (milliseconds the first call after the cache went stale took, milliseconds its background refresh took)
+    """
+    categories = TriviaGame.get_possible_categories()
+    expired_at: float = time.time() - CATEGORY_TTL_S - 60
+    category_cacher(categories, {category.id: expired_at for category in categories}, expired_at)
+
+    start: float = time.perf_counter()
+    TriviaGame.get_possible_categories()
+    elapsed: float = time.perf_counter() - start
+    trivia_module.category_refresh_thread.join()
+
+    return elapsed * 1000, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    delay_s: float = (int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DELAY_MS) / 1000
+
+    with tempfile.TemporaryDirectory() as directory, OpenTDBStub(delay_s) as stub:
+        trivia_module.CACHE_FILE_PATH = os.path.join(directory, "category_cache.txt")
+
+        for label, workers in (("sequential", 1), (f"{COUNT_FETCH_CONCURRENCY} workers", COUNT_FETCH_CONCURRENCY)):
+            connections_before: int = stub.connections
+            elapsed, stats = cold_start(stub.base_url, workers)
+            print(f"{label:<12} {elapsed * 1000:8.0f} ms for {CATEGORY_COUNT} categories  "
+                  f"p50 {stats['p50_ms']:5.0f} ms  p95 {stats['p95_ms']:5.0f} ms  "
+                  f"{stub.connections - connections_before} connections")
+
+        print(f"{'warm':<12} {warm_calls():8.1f} us per call")
+        served_ms, refreshed_ms = stale_call()
+        print(f"{'stale':<12} {served_ms:8.1f} ms to serve, refreshed in the background in {refreshed_ms:.0f} ms")
+        print(f"cache stats  {get_category_cache_stats()}")
+
+        set_opentdb_client(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Measures settled wagers per second with the queued logging pipeline enabled, sampled, and disabled.
+
+Run with: python -m Benchmarks.bench_wager_logging [wager_count]
+"""
+import logging
+import sys
+import tempfile
+import time
+
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import init_db
+from Application.Utils.LoggingController import setup_logging, shutdown_logging
+from Application.Utils.Money import Money
+
+DEFAULT_WAGERS: int = 20_000
+QUESTIONS: list[str] = ["q1", "a1", "q2", "a2"]
+
+
+def settle_wagers(count: int) -> float:
+    """
+    Alternates winnings and debits against one in-memory account.
+
+    :return: Wagers settled per second.
+    """
+    manager: AccountManager = AccountManager(session=init_db(in_memory=True))
+    account: UserAccount = UserAccount("bench", "hash", 50.0, "bench@example.com", QUESTIONS)
+    manager.session.add(account)
+    manager.session.commit()
+
+    start: float = time.perf_counter()
+    for i in range(count):
+        if i % 2:
+            manager.settle_debit(account, Money(100))
+        else:
+            manager.add_and_save_account(account, Money(100))
+    elapsed: float = time.perf_counter() - start
+
+    manager.session.close()
+    return count / elapsed
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_WAGERS
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, sample_rate in (("logging on", 1.0), ("sampled 1%", 0.01)):
+            setup_logging(log_dir=directory, wager_sample_rate=sample_rate)
+            print(f"{label:<12} {settle_wagers(count):10,.0f} wagers/s")
+            shutdown_logging()
+
+        logging.disable(logging.CRITICAL)
+        print(f"{'logging off':<12} {settle_wagers(count):10,.0f} wagers/s")
+        logging.disable(logging.NOTSET)
+
+
+if __name__ == "__main__":
+    main()
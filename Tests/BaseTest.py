@@ -3,7 +3,7 @@ import unittest
 
 from Application.Model.Accounts.AccountManager import AccountManager, verify_password
 from Application.Model.Accounts.UserAccount import UserAccount
-from Application.Model.Accounts.db import init_db
+from Application.Model.Accounts.db import dispose_engines, init_db
 
 IOCONSOLE_PATH: str = "Application.Utils.IOConsole.IOConsole"
 GAMES_PATH: str = "Application.Model.Games"
@@ -22,7 +22,8 @@ NUMBERGUESS_FILE_PATH: str = f"{GAMES_PATH}.NumberGuess.NumberGuess"
 NUMBERGUESS_CLASS_PATH: str = f"{NUMBERGUESS_FILE_PATH}.NumberGuess"
 CASINO_CLASS_PATH: str = "Application.Casino.Casino.Casino"
 USER_ACCOUNT_CLASS_PATH: str = "Application.Model.Accounts.UserAccount.UserAccount"
-ACCOUNT_MANAGER_CLASS_PATH: str = "Application.Model.Accounts.AccountManager.AccountManager"
+ACCOUNT_MANAGER_FILE_PATH: str = "Application.Model.Accounts.AccountManager"
+ACCOUNT_MANAGER_CLASS_PATH: str = f"{ACCOUNT_MANAGER_FILE_PATH}.AccountManager"
 TEST_QUESTIONS: list[str] = ["Who is your favorite sports team?", "Test Answer",
                              "What street did you grow up on?", "Test Street"]
 
@@ -57,8 +58,12 @@ class BaseTest(unittest.TestCase):
         if hasattr(self.manager, 'session'):
             self.manager.session.close()
 
-        if os.path.exists("casino.db"):
-            os.remove("casino.db")
+        dispose_engines()
 
-        if os.path.exists("category_cache.txt"):
-            os.remove("category_cache.txt")
+        for db_file in ("casino.db", "casino.db-wal", "casino.db-shm"):
+            if os.path.exists(db_file):
+                os.remove(db_file)
+
+        for local_file in ("category_cache.txt", "session_token.txt", "session_secret.key"):
+            if os.path.exists(local_file):
+                os.remove(local_file)
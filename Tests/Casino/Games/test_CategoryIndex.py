@@ -0,0 +1,70 @@
+import random
+
+from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.CategoryIndex import CategoryIndex
+from Tests.BaseTest import BaseTest
+
+
+def make_categories() -> list[Category]:
+    return [Category(f"Category {i}", i, easy_num=i * 10, med_num=100 - i * 10, hard_num=50) for i in range(10)]
+
+
+class TestCategoryIndex(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.index: CategoryIndex = CategoryIndex(make_categories())
+
+    def test_at_least_is_most_questions_first(self):
+        self.assertEqual([9, 8, 7, 6, 5], [category.id for category in self.index.at_least("easy", 50)])
+        self.assertEqual([0, 1, 2, 3, 4, 5], [category.id for category in self.index.at_least("medium", 50)])
+        self.assertEqual(10, len(self.index.at_least("hard", 50)))
+        self.assertEqual([], self.index.at_least("easy", 1000))
+
+    def test_at_least_can_keep_the_source_order(self):
+        index: CategoryIndex = CategoryIndex(make_categories()[::-1])
+
+        self.assertEqual([9, 8, 7, 6, 5], [category.id for category in index.at_least("easy", 50, most_first=False)])
+        self.assertEqual([5, 4, 3, 2, 1, 0], [category.id for category in index.at_least("medium", 50,
+                                                                                        most_first=False)])
+
+    def test_count_at_least(self):
+        self.assertEqual(5, self.index.count_at_least("easy", 50))
+        self.assertEqual(4, self.index.count_at_least("easy", 51))
+        self.assertEqual(10, self.index.count_at_least("hard", 0))
+
+    def test_top(self):
+        self.assertEqual([9, 8, 7], [category.id for category in self.index.top("easy", 3)])
+        self.assertEqual(10, len(self.index.top("easy", 10)))
+        self.assertEqual(10, len(self.index.top("easy", 50)))
+        self.assertEqual([], self.index.top("easy", 0))
+
+    def test_random_eligible_only_picks_eligible_categories(self):
+        rng: random.Random = random.Random(7)
+        picked: set[int] = {self.index.random_eligible("easy", 70, rng).id for _ in range(200)}
+
+        self.assertEqual({7, 8, 9}, picked)
+        self.assertIsNone(self.index.random_eligible("easy", 1000, rng))
+
+    def test_sync_only_touches_changed_categories(self):
+        categories: list[Category] = make_categories()
+        categories[0] = Category("Category 0", 0, easy_num=500, med_num=100, hard_num=50)
+        del categories[9]
+        categories.append(Category("Category 42", 42, easy_num=55, med_num=0, hard_num=0))
+
+        changed: int = self.index.sync(categories)
+
+        self.assertEqual(3, changed)
+        self.assertEqual(len(categories), len(self.index))
+        self.assertEqual([0, 8, 7, 6, 42, 5], [category.id for category in self.index.at_least("easy", 50)])
+        self.assertEqual([0, 5, 6, 7, 8, 42], [category.id for category in self.index.at_least("easy", 50,
+                                                                                             most_first=False)])
+        self.assertEqual(self.index.keys, CategoryIndex(categories).keys)
+
+    def test_copy_is_independent(self):
+        copy: CategoryIndex = self.index.copy()
+        copy.remove(9)
+
+        self.assertEqual(10, len(self.index))
+        self.assertEqual(9, self.index.top("easy", 1)[0].id)
+        self.assertEqual(8, copy.top("easy", 1)[0].id)
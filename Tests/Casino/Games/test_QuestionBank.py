@@ -0,0 +1,125 @@
+import os
+import tempfile
+import time
+
+from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.Question import Question
+from Application.Model.Games.TriviaGame.QuestionBank import BankKey, QuestionBank
+from Application.Model.Games.TriviaGame.TriviaGame import TriviaGame, create_opentdb_client
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.HttpClient import HttpClient
+from Tests.BaseTest import BaseTest
+from Tests.OpenTDBStub import OpenTDBStub, QUESTIONS_PER_KEY
+
+KEY: BankKey = (9, "easy", "boolean")
+
+
+class TestQuestionBank(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.session_factory = get_session_factory(f"sqlite:///{os.path.join(self.directory.name, 'bank.db')}")
+        self.bank_session = self.session_factory()
+
+        self.stub: OpenTDBStub = OpenTDBStub().__enter__()
+        self.client: HttpClient = create_opentdb_client(self.stub.base_url)
+        self.bank: QuestionBank = QuestionBank(self.client, session_factory=self.session_factory,
+                                               request_interval_s=0)
+
+    def tearDown(self):
+        self.bank.stop(timeout=5)
+        self.bank_session.close()
+        self.client.close()
+        self.stub.__exit__()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def api_requests(self) -> list[str]:
+        return [path for path in self.stub.requests if path.startswith("/api.php")]
+
+    def test_top_up_fills_to_the_watermark_with_a_token(self):
+        added: int = self.bank.top_up(self.bank_session, KEY)
+
+        self.assertEqual(self.bank.watermark, added)
+        self.assertEqual(self.bank.watermark, self.bank.stock(*KEY))
+        self.assertEqual(1, len(self.api_requests()))
+        self.assertIn(f"token={self.bank.token}", self.api_requests()[0])
+
+    def test_taken_questions_do_not_repeat(self):
+        self.bank.top_up(self.bank_session, KEY)
+
+        first: list[Question] = self.bank.take(*KEY)
+        second: list[Question] = self.bank.take(*KEY)
+
+        self.assertEqual({f"Question {i} & more?" for i in range(10)}, {q.question for q in first})
+        self.assertFalse({q.question for q in first} & {q.question for q in second})
+        self.assertEqual(self.bank.watermark - 20, self.bank.stock(*KEY))
+
+    def test_take_without_stock_takes_nothing_and_queues_a_refill(self):
+        self.bank.store(self.bank_session, KEY, [{"question": "Only one", "correct_answer": "True",
+                                                  "incorrect_answers": ["False"]}])
+
+        self.assertIsNone(self.bank.take(*KEY))
+        self.assertEqual(1, self.bank.stock(*KEY))
+        self.assertIn(KEY, self.bank.pending)
+
+    def test_take_does_not_touch_the_network(self):
+        self.bank.top_up(self.bank_session, KEY)
+        requests_before: int = len(self.stub.requests)
+        game: TriviaGame = TriviaGame("boolean", "easy", self.bank)
+        game.set_category(Category("Category 9", 9, 100, 100, 100))
+
+        self.assertEqual(10, len(game.create_questions()))
+        self.assertEqual(requests_before, len(self.stub.requests))
+
+    def test_exhausted_token_is_reset_and_repeats_are_not_banked(self):
+        self.bank.watermark = QUESTIONS_PER_KEY + 20
+
+        self.bank.top_up(self.bank_session, KEY)
+
+        self.assertEqual(QUESTIONS_PER_KEY, self.bank.stock(*KEY))
+        self.assertTrue(any("command=reset" in path for path in self.stub.requests))
+
+    def test_unknown_token_is_replaced(self):
+        self.bank.token = "expired"
+
+        self.assertEqual(self.bank.watermark, self.bank.top_up(self.bank_session, KEY))
+        self.assertNotEqual("expired", self.bank.token)
+
+    def test_background_thread_refills_after_take(self):
+        self.bank.start()
+        self.bank.request(KEY)
+        self.wait_for_stock(self.bank.watermark)
+
+        self.bank.take(*KEY)
+        self.wait_for_stock(self.bank.watermark)
+
+        self.assertEqual(self.bank.watermark, self.bank.stock(*KEY))
+
+    def test_prefetch_waits_for_live_requests(self):
+        self.bank.start()
+
+        with self.bank.live_request():
+            self.bank.request(KEY)
+            time.sleep(0.2)
+            self.assertEqual([], self.stub.requests)
+
+        self.wait_for_stock(self.bank.watermark)
+
+    def test_prefetch_requests_are_spaced(self):
+        self.bank.request_interval_s = 0.2
+
+        with self.bank.live_request():
+            pass
+        start: float = time.monotonic()
+        self.bank.top_up(self.bank_session, KEY)  # Token request, then one question request
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+    def wait_for_stock(self, amount: int, timeout_s: float = 5.0) -> None:
+        deadline: float = time.monotonic() + timeout_s
+
+        while self.bank.stock(*KEY) < amount or self.bank.pending:
+            self.assertLess(time.monotonic(), deadline, "Bank was not refilled in time")
+            time.sleep(0.01)
@@ -0,0 +1,202 @@
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from Application.Model.Games.TriviaGame import TriviaGame as trivia_module
+from Application.Model.Games.TriviaGame.Category import Category
+from Application.Model.Games.TriviaGame.Question import Question
+from Application.Model.Games.TriviaGame.TriviaGame import (CACHE_FILE_PATH, CATEGORY_TTL_S, CATEGORY_TTLS_S,
+                                                           COUNT_FETCH_CONCURRENCY, PREFETCH_CATEGORIES, TriviaGame,
+                                                           cache_loader,
+                                                           category_cacher, create_opentdb_client, fetch_categories,
+                                                           get_category_cache_stats, refresh_categories,
+                                                           set_opentdb_client, start_category_refresh)
+from Tests.BaseTest import BaseTest, TRIVIA_GAME_FILE_PATH
+from Tests.OpenTDBStub import OpenTDBStub
+
+CATEGORY_COUNT: int = 24
+
+
+def fake_opentdb(failing_ids: set[int] = frozenset(), delay_s: float = 0.0):
+    """
+    Builds a stand-in for get_response that answers like OpenTDB and records the most concurrent requests.
+    """
+    in_flight: list[int] = [0]
+    stats: dict = {"peak": 0}
+    lock: threading.Lock = threading.Lock()
+
+    def get_response(url: str, timeout: float = 0) -> dict | None:
+        if url.endswith("api_category.php"):
+            return {"trivia_categories": [{"id": i, "name": f"Category {i}"} for i in range(CATEGORY_COUNT)]}
+
+        with lock:
+            in_flight[0] += 1
+            stats["peak"] = max(stats["peak"], in_flight[0])
+
+        time.sleep(delay_s)
+
+        with lock:
+            in_flight[0] -= 1
+
+        category_id: int = int(url.rsplit("=", 1)[1])
+        if category_id in failing_ids:
+            return None
+
+        return {"category_question_count": {"total_easy_question_count": category_id,
+                                            "total_medium_question_count": 60,
+                                            "total_hard_question_count": 70}}
+
+    return get_response, stats
+
+
+class TestTriviaGame(BaseTest):
+
+    def tearDown(self):
+        set_opentdb_client(None)
+        trivia_module.category_refresh_after = 0.0
+        super().tearDown()
+
+    def write_cache(self, age_s: float, easy_num: int = 0) -> None:
+        fetched_at: float = time.time() - age_s
+        categories: list[Category] = [Category(f"Category {i}", i, easy_num, 60, 70) for i in range(CATEGORY_COUNT)]
+        category_cacher(categories, {category.id: fetched_at for category in categories}, fetched_at)
+
+    def test_failed_cache_write_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with (patch(f"{TRIVIA_GAME_FILE_PATH}.CACHE_FILE_PATH", os.path.join(directory, "category_cache.txt")),
+                  patch("json.dump", side_effect=TypeError("not serializable"))):
+                with self.assertRaises(TypeError):
+                    self.write_cache(age_s=0)
+
+            self.assertEqual([], os.listdir(directory))
+
+    def test_cache_file_is_parsed_once_until_it_changes(self):
+        self.write_cache(age_s=0)
+        hits_before: int = get_category_cache_stats()["hits"]
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response") as get_response:
+            first: list[Category] = TriviaGame.get_possible_categories()
+            loaded = cache_loader()
+            self.assertIs(loaded, cache_loader())
+
+            self.write_cache(age_s=0, easy_num=99)
+            second: list[Category] = TriviaGame.get_possible_categories()
+
+        get_response.assert_not_called()
+        self.assertEqual(0, first[0].easy_num)
+        self.assertEqual(99, second[0].easy_num)
+        self.assertIsNot(loaded, cache_loader())
+        self.assertEqual(hits_before + 2, get_category_cache_stats()["hits"])
+
+    def test_stale_cache_is_served_while_refreshing(self):
+        self.write_cache(age_s=CATEGORY_TTL_S + 60)
+        get_response, _ = fake_opentdb(delay_s=0.2)
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            start: float = time.monotonic()
+            categories: list[Category] = TriviaGame.get_possible_categories()
+            elapsed: float = time.monotonic() - start
+            trivia_module.category_refresh_thread.join(5)
+
+        self.assertLess(elapsed, 0.1)
+        self.assertEqual(0, categories[5].easy_num)
+        self.assertEqual(5, TriviaGame.get_possible_categories()[5].easy_num)
+        self.assertLess(time.time(), cache_loader().expires_at)
+
+    def test_categories_expire_on_their_own_ttl(self):
+        self.write_cache(age_s=120)
+        get_response, _ = fake_opentdb()
+
+        with (patch.dict(CATEGORY_TTLS_S, {5: 60}),
+              patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response) as mock_get_response):
+            self.assertTrue(refresh_categories())
+
+        self.assertEqual(["api_count.php?category=5"], [call.args[0] for call in mock_get_response.call_args_list])
+        self.assertEqual(5, cache_loader().categories[5].easy_num)
+
+    def test_valid_categories_come_from_an_index_reused_until_the_cache_changes(self):
+        get_response, _ = fake_opentdb()
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            game: TriviaGame = TriviaGame("boolean", "easy")
+            valid: list[Category] = game.get_valid_categories("medium")
+            most_first: list[Category] = game.get_valid_categories("medium", most_questions_first=True)
+            self.assertEqual([], game.get_valid_categories("easy"))
+            index = TriviaGame.get_category_index()
+            self.assertIs(index, TriviaGame.get_category_index())
+
+            self.write_cache(age_s=0, easy_num=50)
+            self.assertIsNot(index, TriviaGame.get_category_index())
+
+        self.assertEqual(list(range(CATEGORY_COUNT)), [category.id for category in valid])  # OpenTDB's order
+        # Every category has 60 medium questions, so the tie is broken by id
+        self.assertEqual(list(range(CATEGORY_COUNT - 1, -1, -1)), [category.id for category in most_first])
+        self.assertEqual(CATEGORY_COUNT, len(game.get_valid_categories("easy")))
+
+    def test_valid_categories_prefetch_only_a_few(self):
+        self.write_cache(age_s=0)
+        bank: MagicMock = MagicMock()
+        game: TriviaGame = TriviaGame("boolean", "medium", bank)
+
+        self.assertEqual(CATEGORY_COUNT, len(game.get_valid_categories("medium")))
+        self.assertEqual(PREFETCH_CATEGORIES, len(bank.request.call_args.args))
+
+        self.assertEqual([], game.get_valid_categories("easy"))
+        self.assertEqual((), bank.request.call_args.args)
+
+    def test_failed_refresh_keeps_old_counts_and_backs_off(self):
+        self.write_cache(age_s=CATEGORY_TTL_S + 60)
+        get_response, _ = fake_opentdb(failing_ids={3})
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            self.assertFalse(refresh_categories())
+            self.assertIsNone(start_category_refresh())
+
+        categories: list[Category] = cache_loader().categories
+        self.assertEqual(CATEGORY_COUNT, len(categories))
+        self.assertEqual(0, categories[3].easy_num)
+        self.assertEqual(4, categories[4].easy_num)
+
+    def test_categories_keep_api_order(self):
+        get_response, _ = fake_opentdb(delay_s=0.001)
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            categories: list[Category] = TriviaGame.get_possible_categories()
+
+        self.assertEqual(list(range(CATEGORY_COUNT)), [category.id for category in categories])
+        self.assertEqual(CATEGORY_COUNT - 1, categories[-1].easy_num)
+        self.assertTrue(os.path.exists(CACHE_FILE_PATH))
+
+    def test_count_requests_are_bounded(self):
+        get_response, stats = fake_opentdb(delay_s=0.02)
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            fetch_categories({f"Category {i}": i for i in range(CATEGORY_COUNT)}, max_workers=4)
+
+        self.assertGreater(stats["peak"], 1)
+        self.assertLessEqual(stats["peak"], 4)
+
+    def test_partial_failure_returns_the_rest_uncached(self):
+        get_response, _ = fake_opentdb(failing_ids={3, 7})
+
+        with patch(f"{TRIVIA_GAME_FILE_PATH}.get_response", side_effect=get_response):
+            categories: list[Category] = TriviaGame.get_possible_categories()
+
+        self.assertEqual(CATEGORY_COUNT - 2, len(categories))
+        self.assertNotIn(3, [category.id for category in categories])
+        self.assertFalse(os.path.exists(CACHE_FILE_PATH))
+
+    def test_questions_come_through_the_injected_client(self):
+        with OpenTDBStub() as stub:
+            set_opentdb_client(create_opentdb_client(stub.base_url))
+            game: TriviaGame = TriviaGame("boolean", "easy")
+            game.set_category(TriviaGame.get_possible_categories()[0])
+
+            questions: list[Question] = game.create_questions()
+
+        self.assertEqual(10, len(questions))
+        self.assertEqual("Question 0 & more?", questions[0].question)
+        self.assertEqual(CATEGORY_COUNT + 2, len(stub.requests))
+        self.assertLessEqual(stub.connections, COUNT_FETCH_CONCURRENCY)  # Reused, not one per request
@@ -0,0 +1,72 @@
+from Application.Model.Accounts.AccountCache import AccountCache
+from Application.Model.Accounts.UserAccount import UserAccount
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+
+class TestAccountCache(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = AccountCache(max_size=2)
+
+    def add_account(self, username: str) -> UserAccount:
+        account: UserAccount = UserAccount(username, "password", 50.0, f"{username}@email.com", TEST_QUESTIONS)
+        self.session.add(account)
+        self.session.commit()
+        return account
+
+    def test_get_by_username_hit_and_miss(self):
+        account: UserAccount = self.add_account("first")
+
+        self.assertIsNone(self.cache.get_by_username("first"))
+        self.cache.put(account)
+
+        self.assertIs(account, self.cache.get_by_username("first"))
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(1, self.cache.misses)
+
+    def test_get_by_email(self):
+        account: UserAccount = self.add_account("first")
+        self.cache.put(account)
+
+        self.assertIs(account, self.cache.get_by_email("first@email.com"))
+        self.assertIsNone(self.cache.get_by_email("other@email.com"))
+
+    def test_evicts_least_recently_used(self):
+        first: UserAccount = self.add_account("first")
+        second: UserAccount = self.add_account("second")
+        self.cache.put(first)
+        self.cache.put(second)
+
+        self.cache.get_by_username("first")
+        self.cache.put(self.add_account("third"))
+
+        self.assertIsNone(self.cache.get_by_username("second"))
+        self.assertIsNone(self.cache.get_by_email("second@email.com"))
+        self.assertIs(first, self.cache.get_by_username("first"))
+
+    def test_invalidate(self):
+        account: UserAccount = self.add_account("first")
+        self.cache.put(account)
+
+        self.cache.invalidate("first")
+
+        self.assertIsNone(self.cache.get_by_username("first"))
+        self.assertIsNone(self.cache.get_by_email("first@email.com"))
+
+    def test_detached_account_is_a_miss(self):
+        account: UserAccount = self.add_account("first")
+        self.cache.put(account)
+
+        self.session.expunge(account)
+
+        self.assertIsNone(self.cache.get_by_username("first"))
+        self.assertEqual(0, self.cache.stats()["size"])
+
+    def test_stats(self):
+        self.cache.put(self.add_account("first"))
+        self.cache.get_by_username("first")
+        self.cache.get_by_username("missing")
+
+        expected: dict = {"size": 1, "max_size": 2, "hits": 1, "misses": 1, "hit_rate": 0.5}
+        self.assertEqual(expected, self.cache.stats())
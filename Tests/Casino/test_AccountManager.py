@@ -1,16 +1,53 @@
 import datetime
+import os
+import tempfile
 import uuid
 from unittest.mock import MagicMock, patch
 
-from Application.Model.Accounts.AccountManager import hash_password, verify_password
-from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+import bcrypt
+
+from Application.Model.Accounts import AccountManager as account_manager_module
+from Application.Model.Accounts.AccountManager import (AccountManager, calibrate_bcrypt_cost, get_bcrypt_cost,
+                                                       hash_password, load_bcrypt_cost, verify_password)
+from Application.Model.Accounts.InMemoryAccountStore import InMemoryAccountStore
+from Application.Model.Accounts.Ledger import SNAPSHOT_TAIL_LENGTH
+from Application.Model.Accounts.LoginRateLimiter import MAX_FAILURES_PER_USER
+from Application.Model.Accounts.SessionTokens import load_or_create_session_secret
+from Application.Model.Accounts.db import init_db
+from Application.Utils.Money import Money
+from Tests.BaseTest import ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
 from Application.Model.Accounts.UserAccount import UserAccount
 
+DB_FILE_PATH: str = "Application.Model.Accounts.db"
+SESSION_TOKENS_FILE_PATH: str = "Application.Model.Accounts.SessionTokens"
 
-class TestAccountManager(BaseTest):
+
+class AccountManagerContract:
+    """
+    Behaviour AccountManager must have whichever AccountStore it runs on. Mixed into one TestCase per store, each of
+    which sets self.manager and implements restart.
+    """
 
     def setUp(self):
         super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        # Keep the database and signing key these tests create out of the working directory
+        db_url_patch = patch(f"{DB_FILE_PATH}.DB_URL", f"sqlite:///{os.path.join(self.directory.name, 'casino.db')}")
+        db_url_patch.start()
+        self.addCleanup(db_url_patch.stop)
+
+        secret_patch = patch(f"{SESSION_TOKENS_FILE_PATH}.session_secret",
+                             load_or_create_session_secret(os.path.join(self.directory.name, "session_secret.key")))
+        secret_patch.start()
+        self.addCleanup(secret_patch.stop)
+
+    def restart(self) -> AccountManager:
+        """
+        :return: A new manager on the same storage, as after a restart.
+        """
+        raise NotImplementedError
 
     def test_create_account(self):
         subject = self.manager.create_account("username", "password", "test@email.com", TEST_QUESTIONS)
@@ -44,6 +81,223 @@ class TestAccountManager(BaseTest):
 
         self.assertIsNone(actual)
 
+    def test_invalidate_reset_token(self):
+        self.account.reset_token = uuid.uuid4()
+        self.account.reset_token_expiration = datetime.datetime.now()
+
+        self.manager.invalidate_reset_token(self.account)
+
+        self.assertIsNone(self.account.reset_token)
+        self.assertIsNone(self.account.reset_token_expiration)
+
+    def test_get_account_by_email(self):
+        self.manager.create_account("test_username", "test_password",
+                                    "test@email.com", TEST_QUESTIONS)
+        actual_account: UserAccount = self.manager.get_account_by_email("test@email.com")
+
+        self.assert_account_info(actual_account, hashed_password=actual_account.password)
+
+    def test_get_account_by_email_fail(self):
+        account: UserAccount = self.manager.get_account_by_email("WRONG_EMAIL@DOMAIN.com")
+        self.assertIsNone(account)
+
+    def test_get_account_async(self):
+        self.manager.create_account("test_username", "test_password",
+                                    "test@email.com", TEST_QUESTIONS)
+        actual: UserAccount = self.manager.get_account_async("test_username", "test_password").result(timeout=10)
+
+        self.assert_account_info(actual, hashed_password=actual.password)
+
+    def test_get_account_async_wrong_password(self):
+        self.manager.create_account("test_username", "test_password",
+                                    "test@email.com", TEST_QUESTIONS)
+        actual: UserAccount = self.manager.get_account_async("test_username", "wrong_password").result(timeout=10)
+
+        self.assertIsNone(actual)
+
+    @patch(f"{ACCOUNT_MANAGER_FILE_PATH}.verify_password", return_value=False)
+    def test_get_account_async_unknown_user_checks_dummy_hash(self, mock_verify_password):
+        future = self.manager.get_account_async("this_name_won't_be_used", "secure123")
+
+        self.assertIsNone(future.result(timeout=10))
+        mock_verify_password.assert_called_once()
+
+    def test_create_account_async_and_save(self):
+        new_account: UserAccount = self.manager.create_account_async("username", "password", "test@email.com",
+                                                                     TEST_QUESTIONS).result(timeout=10)
+        saved: UserAccount = self.manager.save_new_account(new_account)
+
+        self.assertEqual("username", saved.username)
+        self.assertTrue(verify_password("password", saved.password))
+        self.assertTrue(self.manager.account_exists("username", "other@email.com"))
+
+    def test_create_account_async_username_exist(self):
+        self.manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+        future = self.manager.create_account_async("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+
+        self.assertIsNone(future.result(timeout=10))
+
+    def test_save_new_account_taken_while_hashing(self):
+        new_account: UserAccount = self.manager.create_account_async("test_username", "test_password",
+                                                                     "test@email.com",
+                                                                     TEST_QUESTIONS).result(timeout=10)
+        self.manager.create_account("test_username", "test_password", "other@email.com", TEST_QUESTIONS)
+
+        self.assertIsNone(self.manager.save_new_account(new_account))
+
+    def test_settle_debit(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.assertTrue(self.manager.settle_debit(account, 20.0))
+        self.assertEqual(30.0, account.balance)
+
+    def test_settle_debit_insufficient_funds(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.assertFalse(self.manager.settle_debit(account, 50.01))
+        self.assertEqual(50.0, account.balance)
+
+    def test_settle_debit_non_positive(self):
+        with self.assertRaises(ValueError):
+            self.manager.settle_debit(self.account, 0)
+
+    def test_get_account_by_email_ignores_case(self):
+        self.manager.create_account("test_username", "test_password",
+                                    "test@email.com", TEST_QUESTIONS)
+        actual_account: UserAccount = self.manager.get_account_by_email("  Test@Email.COM ")
+
+        self.assertEqual("test_username", actual_account.username)
+
+    def test_create_account_email_exists_different_case(self):
+        self.manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+        subject = self.manager.create_account("other_username", "test_password", "TEST@email.com", TEST_QUESTIONS)
+
+        self.assertIsNone(subject)
+
+    def test_get_account_by_reset_token(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: str = self.manager.generate_uuid_and_store_it(account)
+
+        actual: UserAccount = self.manager.get_account_by_reset_token(token)
+
+        self.assertEqual("test_username", actual.username)
+
+    def test_get_account_by_reset_token_not_uuid(self):
+        self.assertIsNone(self.manager.get_account_by_reset_token("invalid token"))
+
+    def test_get_account_by_reset_token_after_expiry(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: str = self.manager.generate_uuid_and_store_it(account)
+        expired: datetime.datetime = datetime.datetime.now(datetime.UTC) - datetime.timedelta(minutes=1)
+
+        self.manager.store.update_account(account, lambda user: setattr(user, "reset_token_expiration", expired))
+
+        self.assertIsNone(self.manager.get_account_by_reset_token(token))
+
+    def test_reset_token_is_rejected_at_its_expiry(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: uuid.UUID = uuid.UUID(self.manager.generate_uuid_and_store_it(account))
+        expires_at: datetime.datetime = datetime.datetime(2030, 1, 1, 12, 0)
+
+        self.manager.store.update_account(account, lambda user: setattr(user, "reset_token_expiration", expires_at))
+
+        self.assertIsNotNone(self.manager.store.find_by_reset_token(token, expires_at - datetime.timedelta(seconds=1)))
+        self.assertIsNone(self.manager.store.find_by_reset_token(token, expires_at))
+
+    def test_update_password_revokes_session_tokens(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: str = self.manager.issue_session_token(account)
+
+        self.manager.update_password(account, "new_password")
+
+        self.assertIsNone(self.manager.get_account_by_session_token(token))
+        self.assertIsNone(self.manager.get_account("test_username", "test_password"))
+        self.assertIsNotNone(self.manager.get_account("test_username", "new_password"))
+
+    def test_session_token_round_trip(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: str = self.manager.issue_session_token(account)
+
+        self.assertEqual("test_username", self.manager.get_account_by_session_token(token).username)
+        self.assertIsNone(self.manager.get_account_by_session_token(token[:-2] + "xx"))
+
+        self.manager.revoke_session_token(token)
+
+        self.assertIsNone(self.manager.get_account_by_session_token(token))
+
+    def test_wagers_reach_the_ledger(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.manager.add_and_save_account(account, Money(5000))
+        self.manager.subtract_and_save_account(account, Money(2000))
+        self.manager.settle_debit(account, Money(1000))
+        self.manager.flush_wagers()
+
+        self.assertEqual(Money(7000), account.balance)
+        self.assertEqual(Money(7000), self.manager.find_account("test_username").balance)
+        self.assertEqual(Money(7000), self.manager.get_ledger_balance(account))
+
+    def test_compact_ledger_keeps_balance(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        for _ in range(SNAPSHOT_TAIL_LENGTH):
+            self.manager.add_and_save_account(account, Money(1))
+
+        self.manager.compact_ledger()
+
+        self.assertEqual(Money(5000 + SNAPSHOT_TAIL_LENGTH), self.manager.get_ledger_balance(account))
+
+    def test_lockouts_survive_a_restart(self):
+        for _ in range(MAX_FAILURES_PER_USER):
+            self.manager.rate_limiter.record_failure("test_username")
+        self.manager.save_lockouts()
+
+        self.assertGreater(self.restart().get_login_retry_after("test_username"), 0)
+
+    def test_reset_email_is_queued(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.manager.email_recovery_token(account)
+
+        self.assertIsNotNone(self.manager.get_account_by_reset_token(str(account.reset_token)))
+
+
+class TestAccountManager(AccountManagerContract, BaseTest):
+
+    def tearDown(self):
+        super().tearDown()
+        account_manager_module.target_cost = None  # Calibration tests must not leak a cost into other tests
+
+    def restart(self) -> AccountManager:
+        return AccountManager(session=self.session)
+
+    def test_get_account_by_email_uses_cache(self):
+        self.manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+
+        first: UserAccount = self.manager.get_account_by_email("test@email.com")
+        second: UserAccount = self.manager.get_account_by_email("TEST@email.com")
+
+        self.assertIs(first, second)
+        self.assertEqual(1, self.manager.cache.stats()["hits"])
+
+    def test_update_password_invalidates_cache(self):
+        self.manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+        account: UserAccount = self.manager.get_account_by_email("test@email.com")
+
+        self.manager.update_password(account, "new_password")
+
+        self.assertEqual(0, self.manager.cache.stats()["size"])
+        self.assertIsNotNone(self.manager.get_account("test_username", "new_password"))
+
     def test_add_winnings_and_save(self):
         account: UserAccount = self.manager.create_account("test_username", "test_password",
                                                            "test@email.com", TEST_QUESTIONS)
@@ -84,26 +338,6 @@ class TestAccountManager(BaseTest):
         self.assertEqual(expected_token, actual_token)
         self.assertTrue(is_time_valid)
 
-    def test_invalidate_reset_token(self):
-        self.account.reset_token = uuid.uuid4()
-        self.account.reset_token_expiration = datetime.datetime.now()
-
-        self.manager.invalidate_reset_token(self.account)
-
-        self.assertIsNone(self.account.reset_token)
-        self.assertIsNone(self.account.reset_token_expiration)
-
-    def test_get_account_by_email(self):
-        self.manager.create_account("test_username", "test_password",
-                                    "test@email.com", TEST_QUESTIONS)
-        actual_account: UserAccount = self.manager.get_account_by_email("test@email.com")
-
-        self.assert_account_info(actual_account, hashed_password=actual_account.password)
-
-    def test_get_account_by_email_fail(self):
-        account: UserAccount = self.manager.get_account_by_email("WRONG_EMAIL@DOMAIN.com")
-        self.assertIsNone(account)
-
     def test_hash_password(self):
         password: str = "ValidPassword123!"
         hashed_password: str = hash_password(password)
@@ -147,3 +381,106 @@ class TestAccountManager(BaseTest):
 
         actual: bool = verify_password("", hashed_password)
         self.assertFalse(actual)
+
+    def test_settle_debit_uses_stored_balance(self):
+        first_manager: AccountManager = AccountManager(session=init_db())
+        second_manager: AccountManager = AccountManager(session=init_db())
+        first_manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+
+        first_view: UserAccount = first_manager.get_account_by_email("test@email.com")
+        second_view: UserAccount = second_manager.get_account_by_email("test@email.com")
+
+        # Both processes believe the balance is 50, only one debit of 40 may succeed
+        self.assertTrue(first_manager.settle_debit(first_view, 40.0))
+        self.assertFalse(second_manager.settle_debit(second_view, 40.0))
+        self.assertEqual(10.0, first_view.balance)
+
+        first_manager.session.close()
+        second_manager.session.close()
+
+    def test_get_account_by_reset_token_expired(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+        token: str = self.manager.generate_uuid_and_store_it(account)
+        account.reset_token_expiration = datetime.datetime.now(datetime.UTC) - datetime.timedelta(minutes=1)
+        self.manager.session.commit()
+
+        self.assertIsNone(self.manager.get_account_by_reset_token(token))
+
+    def test_get_bcrypt_cost(self):
+        hashed: str = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=5)).decode('utf-8')
+
+        self.assertEqual(5, get_bcrypt_cost(hashed))
+
+    @patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=5)
+    def test_get_account_rehashes_outdated_cost(self, mock_target_cost):
+        account: UserAccount = UserAccount("test_username", bcrypt.hashpw(b"test_password", bcrypt.gensalt(rounds=4))
+                                           .decode('utf-8'), 50.0, "test@email.com", TEST_QUESTIONS)
+        self.manager.session.add(account)
+        self.manager.session.commit()
+
+        actual: UserAccount = self.manager.get_account("test_username", "test_password")
+
+        self.assertEqual(5, get_bcrypt_cost(actual.password))
+        self.assertTrue(verify_password("test_password", actual.password))
+
+    @patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+    def test_get_account_async_defers_rehash(self, mock_target_cost):
+        account: UserAccount = UserAccount("test_username", bcrypt.hashpw(b"test_password", bcrypt.gensalt(rounds=5))
+                                           .decode('utf-8'), 50.0, "test@email.com", TEST_QUESTIONS)
+        self.manager.session.add(account)
+        self.manager.session.commit()
+
+        actual: UserAccount = self.manager.get_account_async("test_username", "test_password").result(timeout=10)
+        self.assertEqual(5, get_bcrypt_cost(actual.password))
+
+        self.manager.apply_pending_rehash(actual)
+        self.assertEqual(4, get_bcrypt_cost(actual.password))
+
+    def test_calibrate_bcrypt_cost_stores_choice(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "bcrypt_cost.json")
+            chosen: int = calibrate_bcrypt_cost(budget_ms=60_000, min_cost=4, max_cost=5, path=path)
+
+            self.assertEqual(5, chosen)
+            self.assertEqual(5, load_bcrypt_cost(path))
+
+    @patch("time.perf_counter", side_effect=[0.0, 1.0])
+    def test_calibrate_bcrypt_cost_keeps_floor(self, mock_perf_counter):
+        with tempfile.TemporaryDirectory() as directory:
+            chosen: int = calibrate_bcrypt_cost(budget_ms=1, min_cost=4, max_cost=6,
+                                                path=os.path.join(directory, "bcrypt_cost.json"))
+
+        self.assertEqual(4, chosen)
+
+
+class TestInMemoryAccountManager(AccountManagerContract, BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        cost_patch = patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+        cost_patch.start()
+        self.addCleanup(cost_patch.stop)
+        self.manager = AccountManager(store=InMemoryAccountStore())
+
+    def restart(self) -> AccountManager:
+        return AccountManager(store=self.manager.store)
+
+    def test_lookups_return_the_stored_account(self):
+        created: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.assertIs(created, self.manager.find_account("test_username"))
+        self.assertIs(created, self.manager.get_account_by_email("TEST@email.com"))
+
+    def test_ledger_is_one_entry_per_wager(self):
+        account: UserAccount = self.manager.create_account("test_username", "test_password",
+                                                           "test@email.com", TEST_QUESTIONS)
+
+        self.manager.add_and_save_account(account, Money(300))
+        self.manager.settle_debit(account, Money(100))
+
+        self.assertEqual([5000, 300, -100], list(self.manager.store.ledgers["test_username"]))
+
+    def test_has_no_session(self):
+        self.assertFalse(hasattr(self.manager, "session"))
@@ -0,0 +1,50 @@
+import datetime
+import uuid
+
+from Application.Model.Accounts.AccountQueries import (ACCOUNT_EXISTS, find_by_email, find_by_reset_token,
+                                                       find_by_username, username_or_email_taken)
+from Application.Model.Accounts.UserAccount import UserAccount
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+
+class TestAccountQueries(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.account: UserAccount = UserAccount("test_username", "hash", 50.0, "Test@Email.com", TEST_QUESTIONS)
+        self.session.add(self.account)
+        self.session.commit()
+
+    def test_find_by_username_and_email(self):
+        self.assertIs(self.account, find_by_username(self.session, "test_username"))
+        self.assertIs(self.account, find_by_email(self.session, "test@email.com"))
+        self.assertIsNone(find_by_username(self.session, "missing"))
+        self.assertIsNone(find_by_email(self.session, "missing@email.com"))
+
+    def test_find_by_reset_token_skips_expired(self):
+        now: datetime.datetime = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        self.account.reset_token = uuid.uuid4()
+        self.account.reset_token_expiration = now + datetime.timedelta(minutes=15)
+        self.session.commit()
+
+        self.assertIs(self.account, find_by_reset_token(self.session, self.account.reset_token, now))
+        self.assertIsNone(find_by_reset_token(self.session, self.account.reset_token,
+                                              now + datetime.timedelta(minutes=16)))
+        self.assertIsNone(find_by_reset_token(self.session, uuid.uuid4(), now))
+
+    def test_username_or_email_taken(self):
+        self.assertTrue(username_or_email_taken(self.session, "test_username", "other@email.com"))
+        self.assertTrue(username_or_email_taken(self.session, "other", "test@email.com"))
+        self.assertFalse(username_or_email_taken(self.session, "other", "other@email.com"))
+
+    def test_existence_check_is_an_exists_query(self):
+        self.assertIn("EXISTS", str(ACCOUNT_EXISTS))
+
+    def test_repeated_lookups_reuse_the_compiled_statement(self):
+        find_by_username(self.session, "test_username")
+        cache_size: int = len(self.session.get_bind()._compiled_cache)
+
+        for username in ("test_username", "missing", "another"):
+            find_by_username(self.session, username)
+
+        self.assertEqual(cache_size, len(self.session.get_bind()._compiled_cache))
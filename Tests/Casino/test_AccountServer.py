@@ -0,0 +1,249 @@
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import uuid
+from unittest.mock import patch
+
+from Application.Controller.AccountController import AccountController
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.AccountServer import AccountServer, STREAM_LIMIT
+from Application.Model.Accounts.EmailOutbox import OutboxMessage
+from Application.Model.Accounts.RemoteAccountManager import AccountServerError, RemoteAccountManager
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+from Tests.BaseTest import ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
+
+
+@patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+class TestAccountServer(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.directory.name, 'server.db')}")
+        self.server_manager = AccountManager(session=session_factory())
+        self.clients: list[RemoteAccountManager] = []
+
+    def tearDown(self):
+        for client in self.clients:
+            client.close()
+        self.server.stop()
+        self.server_thread.join(timeout=5)
+        self.server_manager.session.close()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def start_server(self, **kwargs) -> str:
+        self.server = AccountServer(self.server_manager, port=0, **kwargs)
+        self.server_thread = threading.Thread(target=asyncio.run, args=(self.server.serve(),), daemon=True)
+        self.server_thread.start()
+        self.server.started.wait(timeout=5)
+
+        if isinstance(self.server.address, str):
+            return f"unix:{self.server.address}"
+        return f"{self.server.address[0]}:{self.server.address[1]}"
+
+    def connect(self, address: str) -> AccountController:
+        client: RemoteAccountManager = RemoteAccountManager(address)
+        self.clients.append(client)
+        return AccountController(client, os.path.join(self.directory.name, f"session_{len(self.clients)}.txt"))
+
+    def test_create_login_and_settle(self, mock_target_cost):
+        controller: AccountController = self.connect(self.start_server())
+
+        self.assertEqual((True, None), controller.create_account("test_username", "ValidPassword123!",
+                                                                 "test@email.com", TEST_QUESTIONS))
+        self.assertTrue(controller.login("test_username", "ValidPassword123!"))
+        self.assertTrue(controller.subtract_losses(Money(1000)))
+        controller.add_winnings(Money(250))
+
+        self.assertEqual(Money(4250), controller.account.balance)
+        self.assertEqual(Money(4250), self.server_manager.find_account("test_username").balance)
+
+    def test_async_login_and_create(self, mock_target_cost):
+        controller: AccountController = self.connect(self.start_server())
+
+        future = controller.create_account_async("test_username", "ValidPassword123!", "test@email.com",
+                                                 TEST_QUESTIONS)
+        self.assertEqual((True, None), controller.finish_create_account(future))
+
+        self.assertTrue(controller.finish_login(controller.login_async("test_username", "ValidPassword123!")))
+        self.assertFalse(controller.finish_login(controller.login_async("test_username", "wrong")))
+
+    def test_insufficient_funds_and_bad_wager(self, mock_target_cost):
+        controller: AccountController = self.connect(self.start_server())
+        controller.create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+
+        self.assertFalse(controller.subtract_losses(Money(10_000)))
+        self.assertEqual(Money(5000), controller.account.balance)
+        with self.assertRaises(ValueError):
+            controller.subtract_losses(Money(0))
+
+    def test_reset_token_round_trip(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        controller: AccountController = self.connect(address)
+
+        self.assertIsNotNone(controller.validate_email("TEST@email.com"))
+        self.assertFalse(controller.verify_security_answers("Wrong", "Answers"))
+        self.assertTrue(controller.verify_security_answers(TEST_QUESTIONS[1], TEST_QUESTIONS[3]))
+        self.assertIsNone(controller.email_reset_token())  # Only the email carries the token
+        token = self.server_manager.find_account("test_username").reset_token
+
+        self.assertFalse(controller.is_token_valid(str(uuid.uuid4())))
+        with self.assertRaises(PermissionError):
+            controller.reset_password("NewPassword123!")
+
+        self.assertTrue(controller.is_token_valid(str(token)))
+        controller.reset_password("NewPassword123!")
+        self.assertTrue(controller.login("test_username", "NewPassword123!"))
+
+    def test_responses_carry_no_secrets(self, mock_target_cost):
+        controller: AccountController = self.connect(self.start_server())
+        controller.create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        self.assertTrue(controller.login("test_username", "ValidPassword123!"))
+
+        account: UserAccount = controller.account
+
+        self.assertIsNone(account.reset_token)
+        self.assertEqual("", account.security_answer_one)
+        self.assertEqual("", account.security_answer_two)
+        self.assertEqual(TEST_QUESTIONS[0], account.security_question_one)
+
+    def test_email_lookup_only_returns_the_recovery_view(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        anonymous: RemoteAccountManager = RemoteAccountManager(address)
+        self.clients.append(anonymous)
+
+        self.assertEqual({"username": "test_username", "questions": [TEST_QUESTIONS[0], TEST_QUESTIONS[2]]},
+                         anonymous.call("get_account_by_email", email="test@email.com"))
+
+    def test_email_lookup_misses_are_rate_limited(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        controller: AccountController = self.connect(address)
+
+        for attempt in range(self.server_manager.rate_limiter.max_failures_per_client):
+            self.assertIsNone(controller.validate_email(f"unknown{attempt}@email.com"))
+
+        self.assertIsNone(controller.validate_email("test@email.com"))
+
+    def test_reset_token_email_requires_verified_answers(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        controller: AccountController = self.connect(address)
+        controller.validate_email("test@email.com")
+
+        with self.assertRaises(PermissionError):
+            controller.email_reset_token()
+        self.assertFalse(controller.verify_security_answers("Wrong", "Answers"))
+        with self.assertRaises(PermissionError):
+            controller.email_reset_token()
+
+        self.assertTrue(controller.verify_security_answers(TEST_QUESTIONS[1], TEST_QUESTIONS[3]))
+        controller.email_reset_token()
+        with self.assertRaises(PermissionError):  # One email per correct set of answers
+            controller.email_reset_token()
+
+        self.assertEqual(1, self.server_manager.session.query(OutboxMessage).count())
+
+    def test_account_rpcs_require_the_logged_in_account(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("victim", "ValidPassword123!", "victim@email.com", TEST_QUESTIONS)
+        attacker: AccountController = self.connect(address)
+        attacker.create_account("attacker", "ValidPassword123!", "attacker@email.com", TEST_QUESTIONS)
+        victim: UserAccount = UserAccount("victim", "", 50.0, "victim@email.com", TEST_QUESTIONS)
+
+        for attempt in (lambda: attacker.manager.settle_debit(victim, Money(100)),
+                        lambda: attacker.manager.add_and_save_account(victim, Money(100)),
+                        lambda: attacker.manager.update_password(victim, "Hijacked123!"),
+                        lambda: attacker.manager.issue_session_token(victim),
+                        lambda: attacker.manager.invalidate_reset_token(victim)):
+            with self.assertRaises(PermissionError):
+                attempt()
+
+        anonymous: RemoteAccountManager = RemoteAccountManager(address)
+        self.clients.append(anonymous)
+        with self.assertRaises(PermissionError):
+            anonymous.settle_debit(victim, Money(100))
+
+        self.assertEqual(Money(5000), self.server_manager.find_account("victim").balance)
+        self.assertIsNotNone(self.server_manager.get_account("victim", "ValidPassword123!"))
+
+    def test_failed_login_and_logout_end_the_identity(self, mock_target_cost):
+        controller: AccountController = self.connect(self.start_server())
+        controller.create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        account: UserAccount = controller.account
+
+        controller.logout()
+        with self.assertRaises(PermissionError):
+            controller.manager.settle_debit(account, Money(100))
+
+        self.assertTrue(controller.login("test_username", "ValidPassword123!"))
+        self.assertFalse(controller.login("test_username", "WrongPassword123!"))
+        with self.assertRaises(PermissionError):
+            controller.manager.settle_debit(account, Money(100))
+
+    def test_session_token_round_trip(self, mock_target_cost):
+        address: str = self.start_server()
+        controller: AccountController = self.connect(address)
+        controller.create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        self.assertTrue(controller.login("test_username", "ValidPassword123!"))
+
+        restarted: AccountController = self.connect(address)
+        restarted.session_token_path = controller.session_token_path
+        self.assertTrue(restarted.resume_session())
+        self.assertEqual(Money(5000), restarted.account.balance)
+
+        restarted.logout()
+        self.assertFalse(controller.resume_session())
+
+    def test_unknown_account_raises(self, mock_target_cost):
+        client: RemoteAccountManager = RemoteAccountManager(self.start_server())
+        self.clients.append(client)
+        account: UserAccount = UserAccount("ghost", "", 50.0, "ghost@email.com", TEST_QUESTIONS)
+
+        with self.assertRaises(AccountServerError):
+            client.verify_security_answers(account, ["Test Answer", "Test Street"])
+
+    def test_oversized_request_gets_an_error_and_closes_the_connection(self, mock_target_cost):
+        host, port = self.start_server().rsplit(":", 1)
+
+        with socket.create_connection((host, int(port)), timeout=5) as sock, sock.makefile("rwb") as stream:
+            stream.write(b"x" * (STREAM_LIMIT + 1) + b"\n")
+            stream.flush()
+
+            self.assertEqual("ValueError", json.loads(stream.readline())["error"]["type"])
+            self.assertEqual(b"", stream.readline())
+
+    def test_clients_share_one_writer(self, mock_target_cost):
+        address: str = self.start_server()
+        self.connect(address).create_account("test_username", "ValidPassword123!", "test@email.com", TEST_QUESTIONS)
+        controllers: list[AccountController] = [self.connect(address) for _ in range(5)]
+
+        def play(controller: AccountController) -> None:
+            controller.login("test_username", "ValidPassword123!")
+            for _ in range(10):
+                controller.subtract_losses(Money(10))
+
+        threads: list[threading.Thread] = [threading.Thread(target=play, args=(c,)) for c in controllers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(Money(4500), self.server_manager.find_account("test_username").balance)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_unix_socket(self, mock_target_cost):
+        controller: AccountController = self.connect(
+            self.start_server(unix_path=os.path.join(self.directory.name, "accounts.sock")))
+
+        self.assertEqual((True, None), controller.create_account("test_username", "ValidPassword123!",
+                                                                 "test@email.com", TEST_QUESTIONS))
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import tempfile
+from unittest.mock import patch
+
+from Application.Model.Accounts.DatabaseBackup import BackupResult, MAX_RESTARTS, backup_database, check_integrity
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+DATABASE_BACKUP_FILE_PATH: str = "Application.Model.Accounts.DatabaseBackup"
+
+
+class TestDatabaseBackup(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.source_path: str = os.path.join(self.directory.name, "casino.db")
+        self.backup_dir: str = os.path.join(self.directory.name, "backups")
+
+        session = get_session_factory(f"sqlite:///{self.source_path}")()
+        for i in range(50):
+            session.add(UserAccount(f"user_{i}", "hash", 50.0, f"user_{i}@email.com", TEST_QUESTIONS))
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def count_accounts(self, path: str) -> int:
+        connection: sqlite3.Connection = sqlite3.connect(path)
+
+        try:
+            return connection.execute("SELECT COUNT(*) FROM user_account").fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_backup_is_a_verified_copy(self):
+        result: BackupResult = backup_database(self.source_path, self.backup_dir, pages_per_step=1, sleep_ms=0)
+
+        self.assertEqual(50, self.count_accounts(result.path))
+        self.assertEqual("ok", check_integrity(result.path))
+        self.assertGreater(result.pages, 1)
+        self.assertGreater(result.pages_per_second, 0)
+        self.assertEqual([os.path.basename(result.path)], os.listdir(self.backup_dir))
+
+    def test_old_generations_are_rotated(self):
+        paths: list[str] = [backup_database(self.source_path, self.backup_dir, keep=2, sleep_ms=0).path
+                            for _ in range(4)]
+
+        self.assertEqual(sorted(os.path.basename(path) for path in paths[2:]), sorted(os.listdir(self.backup_dir)))
+
+    def test_writes_during_the_backup_are_included(self):
+        writer: sqlite3.Connection = sqlite3.connect(self.source_path)
+        written: list[int] = []
+
+        def write_between_batches(seconds: float) -> None:
+            writer.execute("UPDATE user_account SET balance = balance + 1 WHERE username = 'user_0'")
+            writer.commit()
+            written.append(1)
+
+        with patch(f"{DATABASE_BACKUP_FILE_PATH}.time.sleep", side_effect=write_between_batches):
+            result: BackupResult = backup_database(self.source_path, self.backup_dir, pages_per_step=1)
+        writer.close()
+
+        connection: sqlite3.Connection = sqlite3.connect(result.path)
+        balance: int = connection.execute("SELECT balance FROM user_account WHERE username = 'user_0'").fetchone()[0]
+        connection.close()
+
+        self.assertGreater(result.restarts, MAX_RESTARTS)
+        self.assertEqual(5000 + len(written), balance)
+
+    def test_failed_integrity_check_keeps_no_copy(self):
+        with patch(f"{DATABASE_BACKUP_FILE_PATH}.check_integrity", return_value="*** in database main ***"):
+            with self.assertRaises(sqlite3.DatabaseError):
+                backup_database(self.source_path, self.backup_dir, sleep_ms=0)
+
+        self.assertEqual([], os.listdir(self.backup_dir))
+
+    def test_interrupted_copy_keeps_no_partial_file(self):
+        with patch(f"{DATABASE_BACKUP_FILE_PATH}.copy_database", side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                backup_database(self.source_path, self.backup_dir, sleep_ms=0)
+
+        self.assertEqual([], os.listdir(self.backup_dir))
+
+    def test_missing_source_is_not_created(self):
+        missing_path: str = os.path.join(self.directory.name, "missing.db")
+
+        with self.assertRaises(sqlite3.OperationalError):
+            backup_database(missing_path, self.backup_dir, sleep_ms=0)
+
+        self.assertFalse(os.path.exists(missing_path))
+        self.assertEqual([], os.listdir(self.backup_dir))
@@ -0,0 +1,150 @@
+import datetime
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from Application.Model.Accounts import EmailOutbox as email_outbox_module
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.EmailOutbox import (EmailConfig, EmailSender, MAX_RETRY_DELAY_S, OutboxMessage,
+                                                    enqueue_email, get_email_config, get_retry_delay, utc_now)
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_session_factory
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+from Tests.SmtpStub import SmtpStub
+
+
+class TestEmailOutbox(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.session_factory = get_session_factory(f"sqlite:///{os.path.join(self.directory.name, 'outbox.db')}")
+        self.outbox_session = self.session_factory()
+
+        self.smtp_stub = SmtpStub().__enter__()
+        self.sender = EmailSender(EmailConfig("127.0.0.1", self.smtp_stub.port, "casino@email.com", "app_key",
+                                              use_tls=False),
+                                  session_factory=self.session_factory)
+
+    def tearDown(self):
+        self.sender.stop(timeout=5)
+        self.sender.disconnect()
+        self.outbox_session.close()
+        self.smtp_stub.__exit__()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def queue(self, count: int) -> None:
+        for i in range(count):
+            enqueue_email(self.outbox_session, f"user_{i}@email.com", "Subject", f"Body {i}")
+        self.outbox_session.commit()
+
+    def test_messages_share_one_connection(self):
+        self.queue(5)
+
+        self.sender.send_due(self.outbox_session)
+
+        self.assertEqual(5, len(self.smtp_stub.messages))
+        self.assertEqual(1, self.smtp_stub.connections)
+        self.assertEqual(1, self.smtp_stub.logins)
+        self.assertEqual(0, self.outbox_session.query(OutboxMessage).filter(OutboxMessage.sent_at.is_(None)).count())
+
+    def test_failed_message_is_retried_with_backoff(self):
+        self.queue(1)
+        self.smtp_stub.failures_left = 1
+
+        self.sender.send_due(self.outbox_session)
+        message: OutboxMessage = self.outbox_session.query(OutboxMessage).one()
+
+        self.assertIsNone(message.sent_at)
+        self.assertEqual(1, message.attempts)
+        self.assertIn("451", message.last_error)
+        self.assertGreater(message.next_attempt_at, utc_now())
+
+        self.sender.send_due(self.outbox_session)
+        self.assertIsNone(message.sent_at)
+
+        message.next_attempt_at = utc_now() - datetime.timedelta(seconds=1)
+        self.outbox_session.commit()
+        self.sender.send_due(self.outbox_session)
+
+        self.assertIsNotNone(message.sent_at)
+        self.assertEqual(2, message.attempts)
+        self.assertEqual(1, len(self.smtp_stub.messages))
+
+    def test_unexpected_delivery_error_is_recorded_and_the_batch_continues(self):
+        self.queue(2)
+
+        with patch.object(self.sender, "deliver", side_effect=[ValueError("bad address"), None]):
+            self.sender.send_due(self.outbox_session)
+
+        failed, sent = self.outbox_session.query(OutboxMessage).order_by(OutboxMessage.id).all()
+        self.assertEqual("bad address", failed.last_error)
+        self.assertIsNone(failed.sent_at)
+        self.assertIsNotNone(sent.sent_at)
+
+    def test_sender_thread_survives_an_outbox_error(self):
+        self.sender.poll_interval_s = 0.01
+
+        with patch.object(self.sender, "send_due", side_effect=[RuntimeError("database is locked"), 60.0]) as mock_send:
+            self.sender.start()
+
+            deadline: float = time.monotonic() + 5
+            while mock_send.call_count < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(2, mock_send.call_count)
+            self.assertTrue(self.sender.thread.is_alive())
+
+    def test_retry_delay_is_exponential_and_capped(self):
+        self.assertEqual(datetime.timedelta(seconds=5), get_retry_delay(1))
+        self.assertEqual(datetime.timedelta(seconds=20), get_retry_delay(3))
+        self.assertEqual(datetime.timedelta(seconds=MAX_RETRY_DELAY_S), get_retry_delay(30))
+
+    def test_email_recovery_token_is_delivered_in_background(self):
+        manager: AccountManager = AccountManager(session=self.outbox_session, email_sender=self.sender.start())
+        account: UserAccount = manager.create_account("test_username", "test_password", "test@email.com",
+                                                      TEST_QUESTIONS)
+
+        manager.email_recovery_token(account)
+
+        deadline: float = time.monotonic() + 5
+        while not self.smtp_stub.messages and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        recipients, raw = self.smtp_stub.messages[0]
+        self.assertEqual(["test@email.com"], recipients)
+        self.assertIn(str(account.reset_token), raw)
+
+    def test_email_recovery_token_queues_without_sender(self):
+        manager: AccountManager = AccountManager(session=self.outbox_session)
+        account: UserAccount = manager.create_account("test_username", "test_password", "test@email.com",
+                                                      TEST_QUESTIONS)
+
+        manager.email_recovery_token(account)
+
+        message: OutboxMessage = self.outbox_session.query(OutboxMessage).one()
+        self.assertEqual("test@email.com", message.recipient)
+        self.assertIsNone(message.sent_at)
+        self.assertEqual([], self.smtp_stub.messages)
+
+    def test_reset_token_and_email_are_committed_together(self):
+        manager: AccountManager = AccountManager(session=self.outbox_session)
+        account: UserAccount = manager.create_account("test_username", "test_password", "test@email.com",
+                                                      TEST_QUESTIONS)
+
+        with patch.object(self.outbox_session, "commit", wraps=self.outbox_session.commit) as mock_commit:
+            manager.email_recovery_token(account)
+
+        mock_commit.assert_called_once()
+        self.assertIn(str(account.reset_token), self.outbox_session.query(OutboxMessage).one().body)
+
+    @patch("dotenv.load_dotenv")
+    def test_config_is_loaded_once(self, mock_load_dotenv):
+        with patch.object(email_outbox_module, "email_config", None):
+            first: EmailConfig = get_email_config()
+            second: EmailConfig = get_email_config()
+
+        self.assertIs(first, second)
+        mock_load_dotenv.assert_called_once()
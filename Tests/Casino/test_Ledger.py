@@ -0,0 +1,99 @@
+import datetime
+import os
+import sqlite3
+import tempfile
+
+from sqlalchemy import update
+
+from Application.Model.Accounts.Ledger import (BalanceSnapshot, LedgerEntry, OPENING, compact_ledger,
+                                               compute_balance, take_snapshot)
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.db import get_engine
+from Application.Utils.Money import Money
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+
+class TestLedger(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.account: UserAccount = self.manager.create_account("test_username", "test_password", "test@email.com",
+                                                                TEST_QUESTIONS)
+
+    def entries(self) -> list[tuple[str, Money]]:
+        return [(entry.kind, entry.delta) for entry in self.session.query(LedgerEntry).order_by(LedgerEntry.id)]
+
+    def play(self, rounds: int) -> None:
+        for _ in range(rounds):
+            self.manager.add_and_save_account(self.account, Money(300))
+            self.manager.settle_debit(self.account, Money(100))
+
+    def test_every_balance_change_is_recorded(self):
+        self.manager.add_and_save_account(self.account, Money(1000))
+        self.manager.subtract_and_save_account(self.account, Money(250))
+        self.manager.settle_debit(self.account, Money(500))
+        self.manager.settle_debit(self.account, Money(1_000_000))
+
+        expected: list[tuple[str, Money]] = [(OPENING, Money(5000)), ("credit", Money(1000)),
+                                             ("debit", Money(-250)), ("debit", Money(-500))]
+        self.assertEqual(expected, self.entries())
+
+    def test_ledger_matches_stored_balance(self):
+        self.play(10)
+
+        self.assertEqual(Money(7000), self.account.balance)
+        self.assertEqual(self.account.balance, self.manager.get_ledger_balance(self.account))
+
+    def test_balance_is_snapshot_plus_tail(self):
+        self.play(5)
+        last_id: int = self.session.query(LedgerEntry.id).order_by(LedgerEntry.id.desc()).limit(1).scalar()
+        take_snapshot(self.session, "test_username", last_id)
+        self.session.commit()
+
+        self.play(2)
+        self.session.query(LedgerEntry).filter(LedgerEntry.id <= last_id).delete()  # The tail alone must suffice
+        self.session.commit()
+
+        self.assertEqual(Money(6400), compute_balance(self.session, "test_username"))
+
+    def test_compaction_snapshots_long_tails(self):
+        self.play(3)
+
+        compact_ledger(self.session, tail_length=5)
+
+        snapshot: BalanceSnapshot = self.session.get(BalanceSnapshot, "test_username")
+        self.assertEqual(Money(5600), snapshot.balance)
+        self.assertEqual(7, self.session.query(LedgerEntry).count())
+
+    def test_compaction_folds_expired_entries(self):
+        self.play(3)
+        old: datetime.datetime = datetime.datetime.now(datetime.UTC).replace(tzinfo=None) - datetime.timedelta(days=1)
+        self.session.execute(update(LedgerEntry).where(LedgerEntry.id <= 4).values(created_at=old))
+        self.session.commit()
+
+        deleted: int = compact_ledger(self.session, retention=datetime.timedelta(hours=1))
+
+        self.assertEqual(4, deleted)
+        self.assertEqual(4, self.session.get(BalanceSnapshot, "test_username").last_entry_id)
+        self.assertEqual(Money(5600), compute_balance(self.session, "test_username"))
+
+    def test_migration_snapshots_existing_balances(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "legacy.db")
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE user_account (username VARCHAR PRIMARY KEY, password VARCHAR NOT NULL, "
+                               "balance INTEGER NOT NULL, email VARCHAR NOT NULL, email_normalized VARCHAR, "
+                               "security_question_one VARCHAR NOT NULL, security_question_two VARCHAR NOT NULL, "
+                               "security_answer_one VARCHAR NOT NULL, security_answer_two VARCHAR NOT NULL, "
+                               "reset_token CHAR(32), reset_token_expiration DATETIME, version INTEGER)")
+            connection.execute("INSERT INTO user_account VALUES ('legacy', 'hash', 1234, 'legacy@email.com', "
+                               "'legacy@email.com', 'q1', 'q2', 'a1', 'a2', NULL, NULL, 1)")
+            connection.commit()
+            connection.close()
+
+            engine = get_engine(f"sqlite:///{path}")
+            with engine.connect() as migrated:
+                snapshot = migrated.exec_driver_sql("SELECT balance, last_entry_id FROM balance_snapshot").one()
+            engine.dispose()
+
+        self.assertEqual((1234, 0), tuple(snapshot))
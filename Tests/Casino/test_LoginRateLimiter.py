@@ -0,0 +1,143 @@
+import datetime
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+
+from Application.Model.Accounts import AccountManager as account_manager_module
+from Application.Model.Accounts.AccountManager import AccountManager, load_or_calibrate_bcrypt_cost
+from Application.Model.Accounts.LoginRateLimiter import LoginLockout, LoginRateLimiter
+from Tests.BaseTest import ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
+
+RATE_LIMITER_FILE_PATH: str = "Application.Model.Accounts.LoginRateLimiter"
+START: datetime.datetime = datetime.datetime(2026, 1, 1, 12, 0)
+
+
+class TestLoginRateLimiter(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        cost_patch = patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+        cost_patch.start()
+        self.addCleanup(cost_patch.stop)
+        self.manager.create_account("test_username", "test_password", "test@email.com", TEST_QUESTIONS)
+
+    def fail(self, count: int, username: str = "test_username", client: str = "local") -> None:
+        for _ in range(count):
+            self.assertIsNone(self.manager.get_account(username, "wrong_password", client))
+
+    def test_locked_out_user_skips_bcrypt(self):
+        self.fail(5)
+
+        with patch(f"{ACCOUNT_MANAGER_FILE_PATH}.verify_password") as mock_verify:
+            self.assertIsNone(self.manager.get_account("test_username", "test_password"))
+
+        mock_verify.assert_not_called()
+        self.assertGreater(self.manager.get_login_retry_after("test_username"), 0)
+        self.assertEqual(1, self.manager.rate_limiter.rejected)
+
+    def test_lockout_is_per_username(self):
+        self.manager.create_account("other_user", "other_password", "other@email.com", TEST_QUESTIONS)
+        self.fail(5)
+
+        self.assertIsNotNone(self.manager.get_account("other_user", "other_password"))
+
+    def test_client_trying_many_usernames_is_locked_out(self):
+        for i in range(20):
+            self.fail(1, username=f"stuffed_{i}", client="10.0.0.9")
+
+        self.assertIsNone(self.manager.get_account("test_username", "test_password", "10.0.0.9"))
+        self.assertIsNotNone(self.manager.get_account("test_username", "test_password", "10.0.0.10"))
+
+    def test_local_failures_across_usernames_do_not_lock_out_the_kiosk(self):
+        for i in range(20):
+            self.fail(1, username=f"mistyped_{i}")
+
+        self.assertIsNotNone(self.manager.get_account("test_username", "test_password"))
+
+    def test_concurrent_async_guesses_cannot_outrun_the_limit(self):
+        release: threading.Event = threading.Event()
+
+        def slow_wrong_password(password: str, hashed: str) -> bool:
+            release.wait(10)
+            return False
+
+        with patch(f"{ACCOUNT_MANAGER_FILE_PATH}.verify_password", side_effect=slow_wrong_password) as mock_verify:
+            futures: list[Future] = [self.manager.get_account_async("test_username", f"guess_{i}")
+                                     for i in range(20)]
+            release.set()
+            results: list = [future.result(timeout=10) for future in futures]
+
+        self.assertEqual([None] * 20, results)
+        self.assertEqual(5, mock_verify.call_count)
+        self.assertEqual(15, self.manager.rate_limiter.rejected)
+        self.assertFalse(self.manager.rate_limiter.in_flight)
+
+    def test_failures_outside_the_window_are_forgotten(self):
+        limiter: LoginRateLimiter = self.manager.rate_limiter
+
+        with patch(f"{RATE_LIMITER_FILE_PATH}.utc_now", return_value=START):
+            for _ in range(4):
+                limiter.record_failure("test_username")
+
+        with patch(f"{RATE_LIMITER_FILE_PATH}.utc_now", return_value=START + datetime.timedelta(minutes=16)):
+            limiter.record_failure("test_username")
+            self.assertTrue(limiter.check("test_username"))
+
+    def test_lockout_expires(self):
+        limiter: LoginRateLimiter = self.manager.rate_limiter
+
+        with patch(f"{RATE_LIMITER_FILE_PATH}.utc_now", return_value=START):
+            for _ in range(5):
+                limiter.record_failure("test_username")
+            self.assertFalse(limiter.check("test_username"))
+
+        with patch(f"{RATE_LIMITER_FILE_PATH}.utc_now", return_value=START + datetime.timedelta(minutes=15)):
+            self.assertTrue(limiter.check("test_username"))
+
+    def test_success_resets_username_failures(self):
+        self.fail(4)
+        self.assertIsNotNone(self.manager.get_account("test_username", "test_password"))
+        self.fail(4)
+
+        self.assertIsNotNone(self.manager.get_account("test_username", "test_password"))
+
+    def test_lockouts_survive_a_restart(self):
+        self.fail(5)
+        self.assertEqual(1, self.session.query(LoginLockout).count())
+
+        restarted: AccountManager = AccountManager(session=self.session)
+
+        self.assertIsNone(restarted.get_account("test_username", "test_password"))
+
+    def test_async_lockouts_are_saved_on_the_owner_thread(self):
+        for _ in range(5):
+            self.manager.get_account_async("test_username", "wrong_password").result(timeout=10)
+        self.assertEqual(0, self.session.query(LoginLockout).count())
+
+        self.manager.save_lockouts()
+
+        self.assertEqual(1, self.session.query(LoginLockout).count())
+        self.assertIsNone(self.manager.get_account_async("test_username", "test_password").result(timeout=10))
+
+    def test_unknown_username_is_verified_against_dummy_hash(self):
+        with patch(f"{ACCOUNT_MANAGER_FILE_PATH}.verify_password", return_value=False) as mock_verify:
+            self.assertIsNone(self.manager.get_account("no_such_user", "password"))
+
+        mock_verify.assert_called_once()
+        self.assertTrue(mock_verify.call_args.args[1].startswith("$2b$04$"))
+
+    def test_dummy_hash_is_precomputed_with_the_cost(self):
+        with patch(f"{ACCOUNT_MANAGER_FILE_PATH}.dummy_hash", None), \
+                patch(f"{ACCOUNT_MANAGER_FILE_PATH}.calibrate_bcrypt_cost", return_value=4), \
+                patch(f"{ACCOUNT_MANAGER_FILE_PATH}.BCRYPT_COST_FILE_PATH", "no_such_bcrypt_cost.json"):
+            load_or_calibrate_bcrypt_cost()
+
+            self.assertTrue(account_manager_module.dummy_hash.startswith("$2b$04$"))
+
+    def test_tracked_keys_are_bounded(self):
+        limiter: LoginRateLimiter = LoginRateLimiter(max_tracked_keys=10)
+
+        for i in range(100):
+            limiter.record_failure(f"user_{i}", client=f"client_{i}")
+
+        self.assertEqual(10, len(limiter.failures))
@@ -0,0 +1,112 @@
+import os
+import tempfile
+import threading
+
+from sqlalchemy.orm import sessionmaker
+
+from Application.Model.Accounts.AccountManager import AccountManager, verify_password
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode, WagerJournal
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+THREADS: int = 8
+WAGERS_PER_THREAD: int = 25
+
+
+class TestOptimisticLocking(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.session_factory: sessionmaker = get_session_factory(
+            f"sqlite:///{os.path.join(self.directory.name, 'locking.db')}")
+
+        session = self.session_factory()
+        session.add(UserAccount("test_username", "hash", 50.0, "test@email.com", TEST_QUESTIONS))
+        session.commit()
+        session.close()
+
+        self.first = AccountManager(session=self.session_factory())
+        self.second = AccountManager(session=self.session_factory())
+
+    def tearDown(self):
+        self.first.session.close()
+        self.second.session.close()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def load(self, manager: AccountManager) -> UserAccount:
+        manager.session.expire_all()
+        return manager.session.query(UserAccount).filter_by(username="test_username").one()
+
+    def test_concurrent_winnings_are_not_lost(self):
+        first_account: UserAccount = self.load(self.first)
+        second_account: UserAccount = self.load(self.second)
+
+        self.first.add_and_save_account(first_account, Money(1000))
+        self.second.add_and_save_account(second_account, Money(500))
+
+        self.assertEqual(Money(6500), self.load(self.first).balance)
+        self.assertEqual(1, self.second.journal.version_conflicts)
+
+    def test_group_journal_reapplies_after_conflict(self):
+        journal_path: str = os.path.join(self.directory.name, "wager_journal.log")
+        self.second.journal = WagerJournal(self.second.session, DurabilityMode.GROUP, max_events=100,
+                                           max_delay_ms=60_000, path=journal_path)
+        second_account: UserAccount = self.load(self.second)
+        self.second.add_and_save_account(second_account, Money(500))
+        self.second.add_and_save_account(second_account, Money(500))
+
+        self.first.add_and_save_account(self.load(self.first), Money(1000))
+        self.second.flush_wagers()
+
+        self.assertEqual(Money(7000), self.load(self.second).balance)
+        self.assertEqual(1, self.second.journal.version_conflicts)
+        self.second.journal.close()
+
+    def test_settle_debit_bumps_version(self):
+        first_account: UserAccount = self.load(self.first)
+        second_account: UserAccount = self.load(self.second)
+
+        self.first.settle_debit(first_account, Money(1000))
+        self.second.add_and_save_account(second_account, Money(500))
+
+        self.assertEqual(Money(4500), self.load(self.first).balance)
+        self.assertEqual(1, self.second.journal.version_conflicts)
+
+    def test_update_password_retries_on_stale_account(self):
+        first_account: UserAccount = self.load(self.first)
+        second_account: UserAccount = self.load(self.second)
+
+        self.first.add_and_save_account(first_account, Money(1000))
+        self.second.update_password(second_account, "new_password")
+
+        reloaded: UserAccount = self.load(self.first)
+        self.assertEqual(1, self.second.version_conflicts)
+        self.assertTrue(verify_password("new_password", reloaded.password))
+        self.assertEqual(Money(6000), reloaded.balance)
+
+    def test_many_threads_keep_balance_exact(self):
+        def play() -> None:
+            manager: AccountManager = AccountManager(session=self.session_factory())
+            account: UserAccount = self.load(manager)
+
+            for i in range(WAGERS_PER_THREAD):
+                if i % 2:
+                    manager.settle_debit(account, Money(100))
+                else:
+                    manager.add_and_save_account(account, Money(300))
+            manager.session.close()
+
+        threads: list[threading.Thread] = [threading.Thread(target=play) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        debits: int = WAGERS_PER_THREAD // 2
+        credits: int = WAGERS_PER_THREAD - debits
+        expected: Money = Money(5000 + THREADS * (credits * 300 - debits * 100))
+        self.assertEqual(expected, self.load(self.first).balance)
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session, object_session
+
+from Application.Model.Accounts.AccountManager import AccountManager
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import DurabilityMode
+from Application.Model.Accounts.db import get_session_factory
+from Application.Utils.Money import Money
+from Tests.BaseTest import ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
+
+THREADS: int = 8
+ACCOUNTS: int = 4
+ROUNDS: int = 20
+
+
+class TestSessionRegistry(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        cost_patch = patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+        cost_patch.start()
+        self.addCleanup(cost_patch.stop)
+
+        self.directory = tempfile.TemporaryDirectory()
+        session_factory = get_session_factory(f"sqlite:///{os.path.join(self.directory.name, 'registry.db')}")
+        self.shared = AccountManager(session=session_factory(), durability=DurabilityMode.SYNC)
+
+        for i in range(ACCOUNTS):
+            self.shared.create_account(f"user_{i}", "password", f"user_{i}@email.com", TEST_QUESTIONS)
+
+    def tearDown(self):
+        self.shared.release_thread()
+        super().tearDown()
+        self.directory.cleanup()
+
+    def run_on_worker(self, func):
+        def run():
+            try:
+                return func()
+            finally:
+                self.shared.release_thread()
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(run).result(timeout=30)
+
+    def test_each_thread_gets_its_own_session_and_cache(self):
+        owner_session: Session = self.shared.session
+        owner_account: UserAccount = self.shared.find_account("user_0")
+
+        def load() -> tuple[Session, UserAccount]:
+            return self.shared.session, self.shared.find_account("user_0")
+
+        worker_session, worker_account = self.run_on_worker(load)
+
+        self.assertIsNot(owner_session, worker_session)
+        self.assertIsNot(owner_account, worker_account)
+        self.assertIs(owner_session, object_session(owner_account))
+        self.assertIs(owner_session, self.shared.session)
+
+    def test_worker_wagers_are_committed_before_the_thread_ends(self):
+        def play() -> None:
+            self.shared.add_and_save_account(self.shared.find_account("user_0"), Money(700))
+
+        self.run_on_worker(play)
+        self.shared.session.expire_all()
+
+        self.assertEqual(Money(5700), self.shared.find_account("user_0").balance)
+
+    def test_mixed_reads_and_writes_from_many_threads(self):
+        errors: list[BaseException] = []
+        sessions: set[int] = set()
+        sessions_lock: threading.Lock = threading.Lock()
+
+        def play(thread_number: int) -> None:
+            username: str = f"user_{thread_number % ACCOUNTS}"
+
+            try:
+                with sessions_lock:
+                    sessions.add(id(self.shared.session))
+
+                for _ in range(ROUNDS):
+                    account: UserAccount = self.shared.find_account(username)
+                    self.assertIs(self.shared.session, object_session(account))
+
+                    self.shared.add_and_save_account(account, Money(300))
+                    self.assertTrue(self.shared.settle_debit(account, Money(100)))
+                    self.assertEqual(username, self.shared.get_account_by_email(f"{username}@email.com").username)
+
+                    token: str = self.shared.issue_session_token(account)
+                    self.assertEqual(username, self.shared.get_account_by_session_token(token).username)
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                self.shared.release_thread()
+
+        threads: list[threading.Thread] = [threading.Thread(target=play, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        self.assertEqual([], errors)
+        self.assertEqual(THREADS, len(sessions))
+
+        self.shared.session.expire_all()
+        expected: Money = Money(5000) + Money(200) * (ROUNDS * THREADS // ACCOUNTS)
+        for i in range(ACCOUNTS):
+            self.assertEqual(expected, self.shared.find_account(f"user_{i}").balance)
+            self.assertEqual(expected, self.shared.get_ledger_balance(self.shared.find_account(f"user_{i}")))
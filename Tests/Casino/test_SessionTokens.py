@@ -0,0 +1,67 @@
+import datetime
+from unittest.mock import patch
+
+from Application.Model.Accounts.SessionTokens import LoginSession, issue_token, parse_token, verify_token
+from Application.Model.Accounts.UserAccount import UserAccount
+from Tests.BaseTest import ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
+
+SECRET: bytes = b"s" * 32
+
+
+@patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+class TestSessionTokens(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.account: UserAccount = self.manager.create_account("test_username", "test_password", "test@email.com",
+                                                                TEST_QUESTIONS)
+
+    def test_token_logs_in_without_password(self, mock_target_cost):
+        token: str = self.manager.issue_session_token(self.account)
+
+        with patch(f"{ACCOUNT_MANAGER_FILE_PATH}.verify_password") as mock_verify:
+            self.assertIs(self.account, self.manager.get_account_by_session_token(token))
+
+        mock_verify.assert_not_called()
+
+    def test_tampered_token_is_rejected(self, mock_target_cost):
+        token: str = issue_token(self.session, "test_username", secret=SECRET)
+        self.session.commit()
+        session_id, expires, signature = token.split(".")
+
+        self.assertEqual(session_id, parse_token(token, SECRET))
+        self.assertIsNone(parse_token(f"{session_id}.{int(expires) + 3600}.{signature}", SECRET))
+        self.assertIsNone(parse_token(token, b"x" * 32))
+        self.assertIsNone(parse_token("not-a-token", SECRET))
+
+    def test_expired_token_is_rejected(self, mock_target_cost):
+        token: str = issue_token(self.session, "test_username", ttl=datetime.timedelta(seconds=-1), secret=SECRET)
+        self.session.commit()
+
+        self.assertIsNone(verify_token(self.session, token, SECRET))
+
+    def test_password_change_revokes_tokens(self, mock_target_cost):
+        tokens: list[str] = [self.manager.issue_session_token(self.account) for _ in range(2)]
+
+        self.manager.update_password(self.account, "new_password")
+
+        for token in tokens:
+            self.assertIsNone(self.manager.get_account_by_session_token(token))
+        self.assertEqual(0, self.session.query(LoginSession).count())
+
+    def test_revoke_one_session(self, mock_target_cost):
+        kept: str = self.manager.issue_session_token(self.account)
+        revoked: str = self.manager.issue_session_token(self.account)
+
+        self.manager.revoke_session_token(revoked)
+
+        self.assertIsNone(self.manager.get_account_by_session_token(revoked))
+        self.assertIs(self.account, self.manager.get_account_by_session_token(kept))
+
+    def test_issuing_removes_expired_sessions(self, mock_target_cost):
+        issue_token(self.session, "test_username", ttl=datetime.timedelta(seconds=-1), secret=SECRET)
+        self.session.commit()
+
+        self.manager.issue_session_token(self.account)
+
+        self.assertEqual(1, self.session.query(LoginSession).count())
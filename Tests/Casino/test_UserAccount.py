@@ -31,7 +31,7 @@ class TestUserAccount(BaseTest):
         self.assertEqual(expected, actual)
 
     def test_subtract_losses_negative_balance(self):
-        expected: str = f"Insufficient funds! Available: {self.account.balance}, Tried to subtract: {100}"
+        expected: str = "Insufficient funds! Available: 50.00, Tried to subtract: 100.00"
         with self.assertRaises(ValueError) as ve:
             self.account.subtract_losses(100)
 
@@ -50,6 +50,6 @@ class TestUserAccount(BaseTest):
             self.account.add_winnings(-10)
 
     def test_repr(self):
-        expected: str = "Username: test_username Balance: 50.0"
+        expected: str = "Username: test_username Balance: 50.00"
         actual: str = self.account.__repr__()
         self.assertEqual(expected, actual)
\ No newline at end of file
@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Model.Accounts.WagerJournal import (DurabilityMode, JournalCheckpoint, WagerJournal,
+                                                     acquire_journal_lock, get_checkpoint, read_journal,
+                                                     replay_journal)
+from Application.Utils.Money import Money
+from Tests.BaseTest import BaseTest, TEST_QUESTIONS
+
+
+class TestWagerJournal(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.journal_dir = tempfile.TemporaryDirectory()
+        self.journal_path: str = os.path.join(self.journal_dir.name, "wager_journal.log")
+
+        self.session.add(self.account)
+        self.session.commit()
+
+    def tearDown(self):
+        super().tearDown()
+        self.journal_dir.cleanup()
+
+    def test_sync_commits_every_record(self):
+        journal: WagerJournal = WagerJournal(self.session, DurabilityMode.SYNC, path=self.journal_path)
+        self.session.commit = MagicMock()
+
+        journal.record(self.account, Money(1000))
+        journal.record(self.account, Money(-500))
+
+        self.assertEqual(2, self.session.commit.call_count)
+        self.assertFalse(os.path.exists(self.journal_path))
+
+    def test_group_writes_journal_before_commit(self):
+        journal: WagerJournal = WagerJournal(self.session, DurabilityMode.GROUP, max_events=10,
+                                             max_delay_ms=60_000, path=self.journal_path)
+
+        self.account.add_winnings(10.0)
+        journal.record(self.account, Money(1000))
+
+        expected: list[dict] = [{"seq": 1, "username": "test_username", "delta": 1000}]
+        self.assertEqual(expected, read_journal(self.journal_path))
+        self.assertEqual(1, journal.pending)
+
+    def test_group_flushes_after_max_events(self):
+        journal: WagerJournal = WagerJournal(self.session, DurabilityMode.GROUP, max_events=3,
+                                             max_delay_ms=60_000, path=self.journal_path)
+
+        for _ in range(3):
+            self.account.add_winnings(10.0)
+            journal.record(self.account, Money(1000))
+
+        self.assertEqual(0, journal.pending)
+        self.assertEqual([], read_journal(self.journal_path))
+        self.assertEqual(3, self.session.get(JournalCheckpoint, 1).last_seq)
+
+        self.session.expire_all()
+        self.assertEqual(80.0, self.account.balance)
+
+    def test_flush_if_due_after_delay(self):
+        journal: WagerJournal = WagerJournal(self.session, DurabilityMode.ASYNC, max_events=100,
+                                             max_delay_ms=0, path=self.journal_path)
+        journal.pending = 1
+        self.session.commit = MagicMock()
+
+        journal.flush_if_due()
+
+        self.session.commit.assert_called_once()
+
+    def test_replay_applies_unflushed_entries(self):
+        get_checkpoint(self.session)
+        with open(self.journal_path, mode='w') as journal_file:
+            journal_file.write(json.dumps({"seq": 1, "username": "test_username", "delta": 2500}) + "\n")
+            journal_file.write(json.dumps({"seq": 2, "username": "test_username", "delta": -500}) + "\n")
+            journal_file.write('{"seq": 3, "usern')  # Torn write from a crash
+
+        replayed: int = replay_journal(self.session, self.journal_path)
+
+        self.session.expire_all()
+        self.assertEqual(2, replayed)
+        self.assertEqual(70.0, self.account.balance)
+        self.assertEqual(2, get_checkpoint(self.session))
+        self.assertEqual([], read_journal(self.journal_path))
+
+    def test_replay_skips_committed_entries(self):
+        get_checkpoint(self.session)
+        self.session.get(JournalCheckpoint, 1).last_seq = 1
+        self.session.commit()
+
+        with open(self.journal_path, mode='w') as journal_file:
+            journal_file.write(json.dumps({"seq": 1, "username": "test_username", "delta": 2500}) + "\n")
+            journal_file.write(json.dumps({"seq": 2, "username": "test_username", "delta": 500}) + "\n")
+
+        replayed: int = replay_journal(self.session, self.journal_path)
+
+        self.session.expire_all()
+        self.assertEqual(1, replayed)
+        self.assertEqual(55.0, self.account.balance)
+
+    def test_other_commit_checkpoints_journal(self):
+        journal: WagerJournal = WagerJournal(self.session, DurabilityMode.GROUP, max_events=10,
+                                             max_delay_ms=60_000, path=self.journal_path)
+        self.account.add_winnings(10.0)
+        journal.record(self.account, Money(1000))
+
+        self.session.add(UserAccount("other_user", "password", 50.0, "other@email.com", TEST_QUESTIONS))
+        self.session.commit()
+
+        self.assertEqual(0, journal.pending)
+        self.assertEqual(1, get_checkpoint(self.session))
+        self.assertEqual([], read_journal(self.journal_path))
+
+    def test_replay_leaves_a_journal_locked_by_another_process_alone(self):
+        get_checkpoint(self.session)
+        with open(self.journal_path, mode='w') as journal_file:
+            journal_file.write(json.dumps({"seq": 1, "username": "test_username", "delta": 2500}) + "\n")
+
+        lock_file = acquire_journal_lock(self.journal_path)
+        try:
+            self.assertEqual(0, replay_journal(self.session, self.journal_path))
+            self.assertEqual(1, len(read_journal(self.journal_path)))
+        finally:
+            lock_file.close()
+
+        self.assertEqual(1, replay_journal(self.session, self.journal_path))
+
+    def test_second_journal_on_a_locked_file_falls_back_to_sync(self):
+        first: WagerJournal = WagerJournal(self.session, DurabilityMode.GROUP, path=self.journal_path)
+        second: WagerJournal = WagerJournal(self.session, DurabilityMode.GROUP, path=self.journal_path)
+
+        self.assertIs(DurabilityMode.GROUP, first.mode)
+        self.assertIs(DurabilityMode.SYNC, second.mode)
+
+        first.close()
+        self.assertIs(DurabilityMode.GROUP, WagerJournal(self.session, DurabilityMode.GROUP,
+                                                         path=self.journal_path).mode)
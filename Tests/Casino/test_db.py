@@ -0,0 +1,87 @@
+import os
+import sqlite3
+import tempfile
+import threading
+from unittest.mock import patch
+
+from sqlalchemy import Engine
+
+from Application.Model.Accounts.db import DB_URL, SCHEMA_VERSION, get_engine, init_db
+from Tests.BaseTest import BaseTest
+
+
+class TestDb(BaseTest):
+
+    def test_engine_is_cached_per_url(self):
+        self.assertIs(get_engine(DB_URL), get_engine(DB_URL))
+
+    def test_in_memory_engine_is_not_cached(self):
+        self.assertIsNot(get_engine("sqlite:///:memory:"), get_engine("sqlite:///:memory:"))
+
+    def test_in_memory_engine_is_shared_across_threads(self):
+        engine: Engine = get_engine("sqlite:///:memory:")
+        tables: list[list[str]] = []
+
+        def list_tables() -> None:
+            with engine.connect() as connection:
+                tables.append(connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type='table'")
+                              .scalars().all())
+
+        thread: threading.Thread = threading.Thread(target=list_tables)
+        thread.start()
+        thread.join()
+
+        self.assertIn("user_account", tables[0])
+
+    def test_file_database_uses_wal(self):
+        with get_engine(DB_URL).connect() as connection:
+            journal_mode: str = connection.exec_driver_sql("PRAGMA journal_mode").scalar()
+            synchronous: int = connection.exec_driver_sql("PRAGMA synchronous").scalar()
+
+        self.assertEqual("wal", journal_mode)
+        self.assertEqual(1, synchronous)  # 1 == NORMAL
+
+    def test_schema_version_is_recorded(self):
+        init_db()
+
+        with get_engine(DB_URL).connect() as connection:
+            version: int = connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+        self.assertEqual(SCHEMA_VERSION, version)
+
+    def test_init_db_skips_create_all_when_cached(self):
+        init_db()
+
+        with patch("sqlalchemy.MetaData.create_all") as mock_create_all:
+            init_db()
+
+        mock_create_all.assert_not_called()
+
+    def test_migrate_float_balance_to_cents(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path: str = os.path.join(directory, "legacy.db")
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE user_account (username VARCHAR PRIMARY KEY, password VARCHAR NOT NULL, "
+                               "balance FLOAT NOT NULL, email VARCHAR NOT NULL, "
+                               "security_question_one VARCHAR NOT NULL, security_question_two VARCHAR NOT NULL, "
+                               "security_answer_one VARCHAR NOT NULL, security_answer_two VARCHAR NOT NULL, "
+                               "reset_token CHAR(32), reset_token_expiration DATETIME)")
+            connection.execute("INSERT INTO user_account VALUES ('legacy', 'hash', 12.34, 'Legacy@Email.com', "
+                               "'q1', 'q2', 'a1', 'a2', NULL, NULL)")
+            connection.commit()
+            connection.close()
+
+            engine = get_engine(f"sqlite:///{path}")
+            with engine.connect() as migrated:
+                balance = migrated.exec_driver_sql("SELECT balance, typeof(balance) FROM user_account").one()
+                email: str = migrated.exec_driver_sql("SELECT email_normalized FROM user_account").scalar()
+                version: int = migrated.exec_driver_sql("SELECT version FROM user_account").scalar()
+                indexes: list[str] = [row[1] for row in
+                                      migrated.exec_driver_sql("PRAGMA index_list(user_account)").all()]
+            engine.dispose()
+
+        self.assertEqual((1234, "integer"), tuple(balance))
+        self.assertEqual("legacy@email.com", email)
+        self.assertEqual(1, version)
+        self.assertIn("ix_user_account_email_normalized", indexes)
+        self.assertIn("ix_user_account_reset_token", indexes)
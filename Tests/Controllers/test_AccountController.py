@@ -1,11 +1,13 @@
 import datetime
+import os
 import uuid
 from unittest.mock import patch
 
-from Application.Controller.AccountController import AccountController, is_password_valid
+from Application.Controller.AccountController import AccountController, SESSION_TOKEN_FILE_PATH, is_password_valid
 from Application.Model.Accounts.AccountManager import AccountManager, verify_password
+from Application.Model.Accounts.AuthExecutor import completed_future
 from Application.Model.Accounts.UserAccount import UserAccount
-from Tests.BaseTest import ACCOUNT_MANAGER_CLASS_PATH, BaseTest, TEST_QUESTIONS
+from Tests.BaseTest import ACCOUNT_MANAGER_CLASS_PATH, ACCOUNT_MANAGER_FILE_PATH, BaseTest, TEST_QUESTIONS
 
 
 class TestAccountController(BaseTest):
@@ -31,6 +33,33 @@ class TestAccountController(BaseTest):
         actual: bool = self.account_controller.login("test_username", "InvalidPassword123!")
         self.assertFalse(actual)
 
+    @patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.get_account_async",
+           return_value=completed_future(UserAccount("test_username", "ValidPassword123!",
+                                                     50.0, "test@email.com", TEST_QUESTIONS)))
+    def test_login_async_success(self, mock_get_account_async):
+        future = self.account_controller.login_async("test_username", "ValidPassword123!")
+        actual: bool = self.account_controller.finish_login(future)
+
+        self.assertTrue(actual)
+        self.assert_account_info(self.account_controller.account)
+        mock_get_account_async.assert_called_once_with("test_username", "ValidPassword123!")
+
+    @patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.get_account_async", return_value=completed_future(None))
+    def test_login_async_failure(self, mock_get_account_async):
+        future = self.account_controller.login_async("test_username", "InvalidPassword123!")
+        actual: bool = self.account_controller.finish_login(future)
+
+        self.assertFalse(actual)
+        self.assertIsNone(self.account_controller.account)
+
+    @patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.create_account_async", return_value=completed_future(None))
+    def test_create_account_async_taken(self, mock_create_account_async):
+        future = self.account_controller.create_account_async("test_username", "ValidPassword123!",
+                                                              "test@email.com", TEST_QUESTIONS)
+        actual: tuple[bool, str | None] = self.account_controller.finish_create_account(future)
+
+        self.assertEqual((False, "Account with that username or email already exists"), actual)
+
     def test_is_password_valid_true(self):
         test_password: str = "validPassword123!"
 
@@ -150,4 +179,49 @@ class TestAccountController(BaseTest):
         self.account_controller.reset_password("NewValidPassword123!")
         actual: bool = verify_password("NewValidPassword123!", self.account_controller.account.password)
 
-        self.assertTrue(actual)
\ No newline at end of file
+        self.assertTrue(actual)
+
+    @patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.settle_debit", return_value=False)
+    def test_subtract_losses_rejected(self, mock_settle_debit):
+        actual: bool = self.account_controller.subtract_losses(20.0)
+
+        self.assertFalse(actual)
+        mock_settle_debit.assert_called_once_with(self.account_controller.account, 20.0)
+
+    @patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.settle_debit", return_value=True)
+    def test_subtract_losses_success(self, mock_settle_debit):
+        actual: bool = self.account_controller.subtract_losses(5.0)
+
+        self.assertTrue(actual)
+        mock_settle_debit.assert_called_once_with(self.account_controller.account, 5.0)
+
+    @patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+    def test_resume_session_after_login(self, mock_target_cost):
+        manager: AccountManager = self.account_controller.manager
+        manager.create_account("session_user", "ValidPassword123!", "session@email.com", TEST_QUESTIONS)
+        self.assertTrue(self.account_controller.login("session_user", "ValidPassword123!"))
+
+        restarted: AccountController = AccountController(manager)
+        with patch(f"{ACCOUNT_MANAGER_CLASS_PATH}.get_account") as mock_get_account:
+            self.assertTrue(restarted.resume_session())
+
+        self.assertEqual("session_user", restarted.account.username)
+        mock_get_account.assert_not_called()
+
+    def test_resume_session_without_token(self):
+        self.assertFalse(self.account_controller.resume_session())
+
+    @patch(f"{ACCOUNT_MANAGER_FILE_PATH}.get_target_cost", return_value=4)
+    def test_logout_and_password_change_end_session(self, mock_target_cost):
+        manager: AccountManager = self.account_controller.manager
+        manager.create_account("session_user", "ValidPassword123!", "session@email.com", TEST_QUESTIONS)
+
+        self.account_controller.login("session_user", "ValidPassword123!")
+        self.account_controller.logout()
+        self.assertIsNone(self.account_controller.account)
+        self.assertFalse(self.account_controller.resume_session())
+
+        self.account_controller.login("session_user", "ValidPassword123!")
+        self.account_controller.reset_password("NewValidPassword123!")
+        self.assertFalse(AccountController(manager).resume_session())
+        self.assertFalse(os.path.exists(SESSION_TOKEN_FILE_PATH))
@@ -0,0 +1,102 @@
+import csv
+import os
+import tempfile
+from unittest.mock import patch
+
+from Application.Controller.BulkAccountController import BulkAccountController, CSV_FIELDS
+from Application.Model.Accounts.AccountManager import verify_password
+from Application.Model.Accounts.UserAccount import UserAccount
+from Application.Utils.Money import Money
+from Tests.BaseTest import BaseTest
+
+QUESTIONS: dict = {"security_question_one": "q1", "security_answer_one": "a1",
+                   "security_question_two": "q2", "security_answer_two": "a2"}
+
+
+@patch("Application.Controller.BulkAccountController.get_target_cost", return_value=4)
+class TestBulkAccountController(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path: str = os.path.join(self.directory.name, "accounts.csv")
+        self.bulk = BulkAccountController(self.manager, chunk_size=2, workers=2)
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def write_rows(self, rows: list[dict]) -> None:
+        with open(self.path, mode='w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def test_import_hashes_and_inserts(self, mock_target_cost):
+        self.write_rows([{"username": f"user_{i}", "password": "ValidPassword123!", "balance": "12.50",
+                          "email": f"User_{i}@Example.com", **QUESTIONS} for i in range(5)])
+
+        result: dict = self.bulk.import_csv(self.path)
+
+        self.assertEqual(5, result["imported"])
+        self.assertEqual(0, result["skipped"])
+        account: UserAccount = self.session.query(UserAccount).filter_by(username="user_3").one()
+        self.assertTrue(verify_password("ValidPassword123!", account.password))
+        self.assertEqual(Money(1250), account.balance)
+        self.assertEqual("user_3@example.com", account.email_normalized)
+
+    def test_import_skips_invalid_and_duplicate_rows(self, mock_target_cost):
+        self.write_rows([{"username": "good", "password": "ValidPassword123!", "email": "good@email.com", **QUESTIONS},
+                         {"username": "weak", "password": "weak", "email": "weak@email.com", **QUESTIONS},
+                         {"username": "bad_email", "password": "ValidPassword123!", "email": "nope", **QUESTIONS},
+                         {"username": "good", "password": "ValidPassword123!", "email": "other@email.com",
+                          **QUESTIONS},
+                         {"username": "same_email", "password": "ValidPassword123!", "email": "GOOD@email.com",
+                          **QUESTIONS}])
+
+        result: dict = self.bulk.import_csv(self.path)
+
+        self.assertEqual(1, result["imported"])
+        self.assertEqual(4, result["skipped"])
+        self.assertEqual(50.0, self.session.query(UserAccount).one().balance)
+
+    def test_import_skips_negative_balances(self, mock_target_cost):
+        self.write_rows([{"username": "debtor", "password": "ValidPassword123!", "balance": "-5.00",
+                          "email": "debtor@email.com", **QUESTIONS},
+                         {"username": "empty", "password": "ValidPassword123!", "balance": "0",
+                          "email": "empty@email.com", **QUESTIONS}])
+
+        result: dict = self.bulk.import_csv(self.path)
+
+        self.assertEqual(1, result["imported"])
+        self.assertEqual(1, result["skipped"])
+        account: UserAccount = self.session.query(UserAccount).one()
+        self.assertEqual("empty", account.username)
+        self.assertEqual(Money(0), self.manager.get_ledger_balance(account))
+
+    def test_skipped_rows_report_their_physical_line(self, mock_target_cost):
+        self.write_rows([{"username": "multiline", "password": "ValidPassword123!", "email": "multi@email.com",
+                          **QUESTIONS, "security_answer_one": "first line\nsecond line"},
+                         {"username": "bad_email", "password": "ValidPassword123!", "email": "nope", **QUESTIONS}])
+
+        with self.assertLogs("database", level="WARNING") as logs:
+            self.bulk.import_csv(self.path)
+
+        self.assertIn("ending on line 4 ", logs.output[0])
+
+    def test_export_round_trips_through_import(self, mock_target_cost):
+        self.write_rows([{"username": f"user_{i}", "password": "ValidPassword123!", "email": f"user_{i}@email.com",
+                          **QUESTIONS} for i in range(3)])
+        self.bulk.import_csv(self.path)
+        exported_path: str = os.path.join(self.directory.name, "exported.csv")
+
+        written: int = self.bulk.export_csv(exported_path)
+        self.session.query(UserAccount).delete()
+        self.session.commit()
+        result: dict = self.bulk.import_csv(exported_path)
+
+        self.assertEqual(3, written)
+        self.assertEqual(3, result["imported"])
+        account: UserAccount = self.session.query(UserAccount).filter_by(username="user_1").one()
+        self.assertTrue(verify_password("ValidPassword123!", account.password))
+        self.assertEqual(50.0, account.balance)
@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+CATEGORY_COUNT: int = 24
+QUESTIONS_PER_KEY: int = 60  # Distinct questions per (category, difficulty, type)
+
+
+class OpenTDBStubHandler(BaseHTTPRequestHandler):
+    """
+    Answers api_category.php, api_count.php, api.php and api_token.php the way OpenTDB does, over keep-alive HTTP/1.1.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # Headers and body are written separately, which Nagle would hold back on keep-alive
+
+    def setup(self) -> None:
+        super().setup()
+        server: 'OpenTDBStub' = self.server
+        with server.lock:
+            server.connections += 1
+
+    def send_json(self, status: int, body: dict) -> None:
+        payload: bytes = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        server: 'OpenTDBStub' = self.server
+        url = urlparse(self.path)
+        query: dict[str, list[str]] = parse_qs(url.query)
+
+        with server.lock:
+            server.requests.append(self.path)
+            fail: bool = server.errors_left > 0
+            server.errors_left -= fail
+            rate_limit: bool = not fail and server.rate_limits_left > 0
+            server.rate_limits_left -= rate_limit
+
+        time.sleep(server.delay_s)
+
+        if fail:
+            self.send_json(503, {})
+        elif rate_limit:
+            self.send_json(200, {"response_code": 5, "results": []})
+        elif url.path == "/api_category.php":
+            self.send_json(200, {"trivia_categories": [{"id": i, "name": f"Category {i}"}
+                                                       for i in range(CATEGORY_COUNT)]})
+        elif url.path == "/api_count.php":
+            self.send_json(200, {"category_id": int(query["category"][0]),
+                                 "category_question_count": {"total_question_count": 300,
+                                                             "total_easy_question_count": 100,
+                                                             "total_medium_question_count": 120,
+                                                             "total_hard_question_count": 80}})
+        elif url.path == "/api.php":
+            self.send_json(200, self.get_questions(query))
+        elif url.path == "/api_token.php":
+            self.send_json(200, self.get_token(query))
+        else:
+            self.send_json(404, {})
+
+    def get_questions(self, query: dict[str, list[str]]) -> dict:
+        """
+        Serves the next unseen questions of a token, or the first ones without a token.
+        """
+        server: 'OpenTDBStub' = self.server
+        amount: int = int(query["amount"][0])
+        key: tuple = (query["category"][0], query["difficulty"][0], query["type"][0])
+        token: str | None = query["token"][0] if "token" in query else None
+
+        with server.lock:
+            if token is not None and token not in server.tokens:
+                return {"response_code": 3, "results": []}
+
+            seen: dict = server.tokens[token] if token is not None else {}
+            start: int = seen.get(key, 0)
+
+            if start >= QUESTIONS_PER_KEY:
+                return {"response_code": 4, "results": []}
+            if start + amount > QUESTIONS_PER_KEY:
+                return {"response_code": 1, "results": []}
+
+            if token is not None:
+                seen[key] = start + amount
+
+        return {"response_code": 0, "results": [
+            {"type": key[2], "difficulty": key[1], "category": "Stub",
+             "question": f"Question {i} &amp; more?", "correct_answer": "True", "incorrect_answers": ["False"]}
+            for i in range(start, start + amount)]}
+
+    def get_token(self, query: dict[str, list[str]]) -> dict:
+        server: 'OpenTDBStub' = self.server
+
+        with server.lock:
+            if query["command"][0] == "request":
+                token: str = f"token{len(server.tokens)}"
+            else:
+                token = query["token"][0]
+                if token not in server.tokens:
+                    return {"response_code": 3}
+
+            server.tokens[token] = {}
+
+        return {"response_code": 0, "token": token}
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+class OpenTDBStub(ThreadingHTTPServer):
+    """
+    In-process OpenTDB for tests and benchmarks. Can fail or rate limit the next few requests to exercise retries.
+
+    Attributes:
+        requests (list): The path of every request received.
+        connections (int): The number of TCP connections opened so far.
+        delay_s (float): Added before every response, to stand in for network latency.
+        errors_left (int): How many upcoming requests to answer with HTTP 503.
+        rate_limits_left (int): How many upcoming requests to answer with OpenTDB's response_code 5.
+        tokens (dict): For each session token, how many questions of each key it has been served.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, delay_s: float = 0.0):
+        super().__init__(("127.0.0.1", 0), OpenTDBStubHandler)
+        self.lock: threading.Lock = threading.Lock()
+        self.requests: list[str] = []
+        self.connections: int = 0
+        self.delay_s: float = delay_s
+        self.errors_left: int = 0
+        self.rate_limits_left: int = 0
+        self.tokens: dict[str, dict[tuple, int]] = {}
+        self.thread: threading.Thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+    def __enter__(self) -> 'OpenTDBStub':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
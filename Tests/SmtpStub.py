@@ -0,0 +1,91 @@
+import socketserver
+import threading
+
+
+class SmtpStubHandler(socketserver.StreamRequestHandler):
+    """
+    Speaks just enough SMTP for smtplib.login and send_message: EHLO/HELO, AUTH PLAIN (any credentials), MAIL, RCPT,
+    DATA, RSET, NOOP and QUIT.
+    """
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server: 'SmtpStub' = self.server
+        server.connections += 1
+        self.reply("220 stub ready")
+        recipients: list[str] = []
+
+        while line := self.rfile.readline():
+            command: str = line.decode().strip()
+            verb: str = command[:4].upper()
+
+            if verb == "EHLO":
+                self.reply("250-stub")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "HELO":
+                self.reply("250 stub")
+            elif verb == "AUTH":
+                server.logins += 1
+                self.reply("235 Authentication successful")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip("<> "))
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data: list[str] = []
+                while (data_line := self.rfile.readline().decode()) not in (".\r\n", ""):
+                    data.append(data_line)
+
+                if server.failures_left > 0:
+                    server.failures_left -= 1
+                    self.reply("451 Try again later")
+                else:
+                    server.messages.append((recipients, "".join(data)))
+                    self.reply("250 OK")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SmtpStub(socketserver.ThreadingTCPServer):
+    """
+    In-process SMTP server for tests. Records every accepted message and can reject the next few with a temporary
+    failure to exercise retries.
+
+    Attributes:
+        messages (list): (recipients, raw message) for each accepted message.
+        connections (int): The number of connections opened so far.
+        logins (int): The number of successful AUTH commands.
+        failures_left (int): How many upcoming messages to reject with 451.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SmtpStubHandler)
+        self.messages: list[tuple[list[str], str]] = []
+        self.connections: int = 0
+        self.logins: int = 0
+        self.failures_left: int = 0
+        self.thread: threading.Thread = threading.Thread(target=self.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def __enter__(self) -> 'SmtpStub':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.shutdown()
+        self.server_close()
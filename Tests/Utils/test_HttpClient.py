@@ -0,0 +1,71 @@
+import time
+
+from Application.Model.Games.TriviaGame.TriviaGame import is_rate_limited
+from Application.Utils.HttpClient import HttpClient
+from Tests.BaseTest import BaseTest
+from Tests.OpenTDBStub import CATEGORY_COUNT, OpenTDBStub
+
+
+class TestHttpClient(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.stub: OpenTDBStub = OpenTDBStub().__enter__()
+        self.client: HttpClient = HttpClient(base_url=self.stub.base_url, backoff_s=0.001,
+                                             is_rate_limited=is_rate_limited, rate_limit_delay_s=0.05)
+
+    def tearDown(self):
+        self.client.close()
+        self.stub.__exit__()
+        super().tearDown()
+
+    def test_connections_are_reused(self):
+        for _ in range(10):
+            self.assertEqual(CATEGORY_COUNT, len(self.client.get_json("api_category.php")["trivia_categories"]))
+
+        self.assertEqual(1, self.stub.connections)
+
+    def test_server_errors_are_retried(self):
+        self.stub.errors_left = 2
+
+        self.assertIsNotNone(self.client.get_json("api_count.php?category=9"))
+        self.assertEqual(2, self.client.retries)
+        self.assertEqual(3, len(self.stub.requests))
+
+    def test_rate_limit_response_waits_before_retrying(self):
+        self.stub.rate_limits_left = 1
+        start: float = time.monotonic()
+
+        body: dict = self.client.get_json("api.php?amount=1&category=9&difficulty=easy&type=boolean")
+
+        self.assertEqual(0, body["response_code"])
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+    def test_gives_up_after_max_retries(self):
+        self.stub.errors_left = 10
+
+        self.assertIsNone(self.client.get_json("api_category.php"))
+        self.assertEqual(self.client.max_retries + 1, len(self.stub.requests))
+        self.assertEqual(1, self.client.failures)
+
+    def test_client_errors_are_not_retried(self):
+        self.assertIsNone(self.client.get_json("no_such_endpoint.php"))
+        self.assertEqual(1, len(self.stub.requests))
+
+    def test_deadline_bounds_the_call(self):
+        self.stub.delay_s = 0.5
+        start: float = time.monotonic()
+
+        self.assertIsNone(self.client.get_json("api_category.php", deadline_s=0.1))
+        self.assertLess(time.monotonic() - start, 0.4)
+
+    def test_stats_report_latency(self):
+        self.stub.delay_s = 0.01
+        for _ in range(5):
+            self.client.get_json("api_category.php")
+
+        stats: dict = self.client.stats()
+
+        self.assertEqual(5, stats["requests"])
+        self.assertGreaterEqual(stats["p50_ms"], 10)
+        self.assertGreaterEqual(stats["max_ms"], stats["p95_ms"])
@@ -3,6 +3,7 @@ from unittest.mock import patch, call
 
 from Application.Utils.ANSI_COLORS import ANSI_COLORS
 from Application.Utils.IOConsole import IOConsole, count_decimals
+from Application.Utils.Money import Money
 from Tests.BaseTest import IOCONSOLE_PATH
 
 
@@ -155,27 +156,27 @@ class TestIOConsole(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", return_value=1.11)
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", return_value="1.11")
     def test_get_monetary_input_valid_with_color(self, mock_input):
-        expected: float = 1.11
-        actual: float = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
+        expected: Money = Money(111)
+        actual: Money = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
 
         mock_input.assert_called_once_with("Some Prompt", ANSI_COLORS.BLUE)
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", return_value=1.11)
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", return_value="1.11")
     def test_get_monetary_input_valid_no_color(self, mock_input):
-        expected: float = 1.11
-        actual: float = self.console.get_monetary_input("Some Prompt")
+        expected: Money = Money(111)
+        actual: Money = self.console.get_monetary_input("Some Prompt")
 
         mock_input.assert_called_once_with("Some Prompt", None)
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", side_effect=[1.2345, 123.4])
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", side_effect=["1.2345", "123.4"])
     @patch(f"{IOCONSOLE_PATH}.print_error")
     def test_get_monetary_input_invalid_decimal_with_color(self, mock_print, mock_input):
-        expected: float = 123.4
-        actual: float = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
+        expected: Money = Money(12340)
+        actual: Money = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
 
         mock_input.assert_has_calls([
             call("Some Prompt", ANSI_COLORS.BLUE),
@@ -186,11 +187,11 @@ class TestIOConsole(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", side_effect=[1.2345, 123.4])
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", side_effect=["1.2345", "123.4"])
     @patch(f"{IOCONSOLE_PATH}.print_error")
     def test_get_monetary_input_invalid_decimal_no_color(self, mock_print, mock_input):
-        expected: float = 123.4
-        actual: float = self.console.get_monetary_input("Some Prompt")
+        expected: Money = Money(12340)
+        actual: Money = self.console.get_monetary_input("Some Prompt")
 
         mock_input.assert_has_calls([
             call("Some Prompt", None),
@@ -201,11 +202,11 @@ class TestIOConsole(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", side_effect=[0, 123.4])
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", side_effect=["0", "123.4"])
     @patch(f"{IOCONSOLE_PATH}.print_error")
     def test_get_monetary_input_zero_with_color(self, mock_print, mock_input):
-        expected: float = 123.4
-        actual: float = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
+        expected: Money = Money(12340)
+        actual: Money = self.console.get_monetary_input("Some Prompt", ANSI_COLORS.BLUE)
 
         mock_input.assert_has_calls([
             call("Some Prompt", ANSI_COLORS.BLUE),
@@ -216,11 +217,11 @@ class TestIOConsole(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
-    @patch(f"{IOCONSOLE_PATH}.get_float_input", side_effect=[0, 123])
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", side_effect=["0", "123"])
     @patch(f"{IOCONSOLE_PATH}.print_error")
     def test_get_monetary_input_zero_no_color(self, mock_print, mock_input):
-        expected: float = 123
-        actual: float = self.console.get_monetary_input("Some Prompt")
+        expected: Money = Money(12300)
+        actual: Money = self.console.get_monetary_input("Some Prompt")
 
         mock_input.assert_has_calls([
             call("Some Prompt", None),
@@ -231,6 +232,15 @@ class TestIOConsole(unittest.TestCase):
 
         self.assertEqual(expected, actual)
 
+    @patch(f"{IOCONSOLE_PATH}.get_string_input", side_effect=["abc", "5"])
+    @patch(f"{IOCONSOLE_PATH}.print_error")
+    def test_get_monetary_input_not_a_number(self, mock_print, mock_input):
+        actual: Money = self.console.get_monetary_input("Some Prompt")
+
+        mock_print.assert_called_once_with(
+            "Please enter a valid amount (A positive number >= 1.00 with no more than 2 decimal places).")
+        self.assertEqual(Money(500), actual)
+
     @patch("builtins.input", return_value="y")
     def test_boolean_y(self, mock_input):
         actual: bool = self.console.get_boolean_input("Some Prompt")
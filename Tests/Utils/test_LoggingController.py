@@ -0,0 +1,86 @@
+import logging
+import os
+import tempfile
+import threading
+from logging.handlers import QueueHandler
+from unittest.mock import patch
+
+from Application.Utils.LoggingController import SAMPLED, SamplingFilter, setup_logging, shutdown_logging
+from Tests.BaseTest import BaseTest
+
+
+class TestLoggingController(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.log_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        super().tearDown()
+        shutdown_logging()
+        logging.basicConfig(force=True, handlers=[logging.NullHandler()])
+        for name in ("account.auth", "database"):
+            routed_logger: logging.Logger = logging.getLogger(name)
+            for handler in list(routed_logger.handlers):
+                routed_logger.removeHandler(handler)
+            routed_logger.propagate = True
+        self.log_dir.cleanup()
+
+    def read_log(self, name: str) -> str:
+        with open(os.path.join(self.log_dir.name, name)) as log_file:
+            return log_file.read()
+
+    def test_records_are_routed_by_logger(self):
+        setup_logging(log_dir=self.log_dir.name)
+
+        logging.getLogger("account.auth").info("auth message")
+        logging.getLogger("database").info("database message")
+        logging.getLogger("other").info("other message")
+        shutdown_logging()
+
+        self.assertIn("auth message", self.read_log("account.log"))
+        self.assertIn("database message", self.read_log("database.log"))
+        self.assertIn("other message", self.read_log("app.log"))
+        self.assertNotIn("auth message", self.read_log("app.log"))
+        self.assertNotIn("database message", self.read_log("account.log"))
+
+    def test_loggers_only_use_queue_handler(self):
+        setup_logging(log_dir=self.log_dir.name)
+
+        for name in ("account.auth", "database"):
+            handlers: list = logging.getLogger(name).handlers
+            self.assertEqual(1, len(handlers))
+            self.assertIsInstance(handlers[0], QueueHandler)
+
+    def test_files_are_written_off_the_calling_thread(self):
+        setup_logging(log_dir=self.log_dir.name)
+        writer_threads: set = set()
+        emit = logging.FileHandler.emit
+
+        def record_thread(handler, record):
+            writer_threads.add(threading.current_thread())
+            emit(handler, record)
+
+        with patch.object(logging.FileHandler, "emit", record_thread):
+            logging.getLogger("database").info("queued message")
+            shutdown_logging()
+
+        self.assertEqual(1, len(writer_threads))
+        self.assertNotIn(threading.current_thread(), writer_threads)
+
+    def test_sampling_filter_drops_sampled_info(self):
+        record = logging.makeLogRecord({"levelno": logging.INFO, "sampled": True})
+
+        self.assertFalse(SamplingFilter(0.0).filter(record))
+        self.assertTrue(SamplingFilter(1.0).filter(record))
+
+    def test_sampling_filter_keeps_unsampled_and_warnings(self):
+        unsampled = logging.makeLogRecord({"levelno": logging.INFO})
+        warning = logging.makeLogRecord({"levelno": logging.WARNING, **SAMPLED})
+
+        self.assertTrue(SamplingFilter(0.0).filter(unsampled))
+        self.assertTrue(SamplingFilter(0.0).filter(warning))
+
+    def test_sampling_filter_rejects_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            SamplingFilter(1.5)
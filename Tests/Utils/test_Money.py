@@ -0,0 +1,86 @@
+import unittest
+from decimal import Decimal
+
+from Application.Utils.Money import Money
+from Application.Utils.TypeValidation import validate_float
+
+
+class TestMoney(unittest.TestCase):
+
+    def test_parse_whole_dollars(self):
+        self.assertEqual(1200, Money.parse("12").cents)
+
+    def test_parse_one_decimal(self):
+        self.assertEqual(1250, Money.parse("12.5").cents)
+
+    def test_parse_two_decimals(self):
+        self.assertEqual(1205, Money.parse("12.05").cents)
+
+    def test_parse_too_many_decimals(self):
+        with self.assertRaises(ValueError):
+            Money.parse("1.234")
+
+    def test_parse_not_a_number(self):
+        with self.assertRaises(ValueError):
+            Money.parse("abc")
+
+    def test_of_float_is_exact(self):
+        self.assertEqual(111, Money.of(1.11).cents)
+
+    def test_of_float_too_precise(self):
+        with self.assertRaises(ValueError):
+            Money.of(1.005)
+
+    def test_addition_and_subtraction(self):
+        self.assertEqual(Money(30), Money(10) + Money(20))
+        self.assertEqual(Money(-10), Money(10) - Money(20))
+
+    def test_multiply_rounds_half_up(self):
+        expected: Money = Money(313)  # 2.50 * 1.25 = 3.125
+        actual: Money = Money(250) * Decimal("1.25")
+
+        self.assertEqual(expected, actual)
+
+    def test_compare_with_numbers(self):
+        self.assertTrue(Money(5000) == 50.0)
+        self.assertTrue(Money(99) < 1.00)
+        self.assertTrue(Money(100) >= 1)
+
+    def test_equal_numbers_hash_alike(self):
+        for money, number in ((Money.parse("5.50"), 5.5), (Money.parse("0.10"), 0.1), (Money(500), 5)):
+            self.assertEqual(money, number)
+            self.assertEqual(hash(money), hash(number))
+
+        self.assertEqual(1, len({Money(110), 1.1}))
+
+    def test_floats_compare_as_the_amount_written(self):
+        self.assertEqual(Money(111), 1.11)
+        self.assertGreaterEqual(Money.parse("0.10"), 0.1)
+        self.assertGreaterEqual(Money.parse("1.10"), 1.1)
+        self.assertLessEqual(Money.parse("0.30"), 0.3)
+        self.assertLess(Money(111), 1.115)
+
+    def test_decimals_are_not_compared(self):
+        self.assertNotEqual(Money(10), Decimal("0.1"))
+        self.assertEqual(Money(10), Money.of(Decimal("0.1")))
+
+    def test_str(self):
+        self.assertEqual("1.05", str(Money(105)))
+        self.assertEqual("-0.50", str(Money(-50)))
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            Money(1).cents = 2
+
+    def test_validate_float_rejects_three_decimals(self):
+        self.assertFalse(validate_float("1.234"))
+
+    def test_validate_float_accepts_two_decimals(self):
+        self.assertTrue(validate_float("1.23"))
+
+    def test_validate_float_below_minimum(self):
+        self.assertFalse(validate_float("0.99"))
+
+    def test_validate_float_accepts_the_minimum(self):
+        for minimum in (0.10, 2.50, "0.30", Money(110)):
+            self.assertTrue(validate_float(str(Money.of(minimum)), min_value=minimum))